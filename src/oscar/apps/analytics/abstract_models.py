@@ -28,6 +28,16 @@ class AbstractProductRecord(models.Model):
     # Product score - used within search
     score = models.FloatField(_('Score'), default=0.00)
 
+    # Used to only recalculate the scores of records that have changed
+    date_updated = models.DateTimeField(
+        _('Date updated'), auto_now=True, null=True, db_index=True)
+    date_scored = models.DateTimeField(
+        _('Date scored'), blank=True, null=True, db_index=True)
+    # The weighted total of the counters when the score was last calculated
+    scored_total = models.FloatField(_('Scored total'), default=0.00)
+    # The half-life the score was calculated with, if it decays
+    scored_half_life = models.FloatField(_('Scored half-life'), blank=True, null=True)
+
     class Meta:
         abstract = True
         app_label = 'analytics'
@@ -115,3 +125,54 @@ class AbstractUserSearch(models.Model):
         return _("%(user)s searched for '%(query)s'") % {
             'user': self.user,
             'query': self.query}
+
+
+class AbstractStatistics(models.Model):
+    """
+    Rolled-up shop statistics of a period, which the dashboard reads instead
+    of aggregating over all orders, users and baskets.
+
+    Rows without a partner hold the statistics of the whole shop, rows with a
+    partner those of the orders with lines of the partner. There can be more
+    than one row for the same partner and period, so the statistics are
+    always summed up.
+    """
+    partner = models.ForeignKey(
+        'partner.Partner', null=True, blank=True, on_delete=models.CASCADE,
+        related_name='+', verbose_name=_("Partner"))
+    period_start = models.DateTimeField(_("Start of period"), db_index=True)
+
+    num_orders = models.IntegerField(_("Orders"), default=0)
+    num_lines = models.IntegerField(_("Order lines"), default=0)
+    total_incl_tax = models.DecimalField(
+        _("Revenue (inc. tax)"), decimal_places=2, max_digits=12, default=Decimal('0.00'))
+    # Customers are counted when they place their first order, in the period
+    # they joined in
+    num_customers = models.IntegerField(_("Customers"), default=0)
+    # Open baskets, in the period they were created in
+    num_open_baskets = models.IntegerField(_("Open baskets"), default=0)
+
+    class Meta:
+        abstract = True
+        app_label = 'analytics'
+        ordering = ['period_start']
+
+    def __str__(self):
+        return _("Statistics of %(partner)s from %(start)s") % {
+            'partner': self.partner or _("all partners"), 'start': self.period_start}
+
+
+class AbstractHourlyStatistics(AbstractStatistics):
+
+    class Meta(AbstractStatistics.Meta):
+        abstract = True
+        verbose_name = _("Hourly statistics")
+        verbose_name_plural = _("Hourly statistics")
+
+
+class AbstractDailyStatistics(AbstractStatistics):
+
+    class Meta(AbstractStatistics.Meta):
+        abstract = True
+        verbose_name = _("Daily statistics")
+        verbose_name_plural = _("Daily statistics")
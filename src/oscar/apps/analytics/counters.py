@@ -0,0 +1,196 @@
+import logging
+import threading
+import time
+from collections import Counter, defaultdict
+
+from django.conf import settings
+from django.db import DatabaseError, connections, router, transaction
+from django.db.models import F
+from django.utils.timezone import now
+
+logger = logging.getLogger('oscar.analytics')
+
+
+def upsert_counters(model, key_field_name, increments, batch_size=500):
+    """
+    Add increments to the counter fields of a model in bulk.
+
+    ``increments`` maps values of the unique ``key_field_name`` field (e.g.
+    product ids for ``ProductRecord.product``) to dicts of the increments of
+    each counter field. Missing rows are created with the increments as
+    their values. Fields with ``auto_now`` are set to the current time. Uses
+    ``INSERT ... ON CONFLICT DO UPDATE`` on PostgreSQL and
+    SQLite, and ``INSERT ... ON DUPLICATE KEY UPDATE`` on MySQL, so that
+    concurrent updates can't fail or get lost. Other databases fall back to an
+    update followed by an insert per row.
+    """
+    connection = connections[router.db_for_write(model)]
+    if not _supports_upsert(connection):
+        for key, values in sorted(increments.items()):
+            _update_or_create(model, key_field_name, key, values)
+        return
+
+    # Rows are grouped by the fields they change, and each group is written
+    # in key order to avoid deadlocks between concurrent flushes.
+    groups = defaultdict(list)
+    for key, values in sorted(increments.items()):
+        groups[tuple(sorted(values))].append((key, values))
+    for field_names, rows in groups.items():
+        for start in range(0, len(rows), batch_size):
+            sql, params = _get_upsert_sql(
+                connection, model, key_field_name, field_names, rows[start:start + batch_size])
+            with connection.cursor() as cursor:
+                cursor.execute(sql, params)
+
+
+def _supports_upsert(connection):
+    if connection.vendor == 'sqlite':
+        return connection.Database.sqlite_version_info >= (3, 24, 0)
+    return connection.vendor in ('postgresql', 'mysql')
+
+
+def _get_upsert_sql(connection, model, key_field_name, field_names, rows):
+    meta = model._meta
+    qn = connection.ops.quote_name
+    table = qn(meta.db_table)
+    key_field = meta.get_field(key_field_name)
+    fields = [field for field in meta.concrete_fields if not field.primary_key]
+    timestamps = _get_timestamps(model)
+
+    params = []
+    for key, values in rows:
+        for field in fields:
+            if field is key_field:
+                value = key
+            elif field.name in timestamps:
+                value = timestamps[field.name]
+            elif field.name in values:
+                value = values[field.name]
+            else:
+                value = field.get_default()
+            params.append(field.get_db_prep_save(value, connection))
+
+    columns = ', '.join(qn(field.column) for field in fields)
+    placeholders = '(%s)' % ', '.join(['%s'] * len(fields))
+    sql = 'INSERT INTO %s (%s) VALUES %s' % (
+        table, columns, ', '.join([placeholders] * len(rows)))
+
+    update_columns = [qn(meta.get_field(name).column) for name in field_names]
+    timestamp_columns = [qn(meta.get_field(name).column) for name in timestamps]
+    if connection.vendor == 'mysql':
+        assignments = ['%s = %s + VALUES(%s)' % (column, column, column)
+                       for column in update_columns]
+        assignments += ['%s = VALUES(%s)' % (column, column) for column in timestamp_columns]
+        sql += ' ON DUPLICATE KEY UPDATE %s' % ', '.join(assignments)
+    else:
+        assignments = ['%s = %s.%s + EXCLUDED.%s' % (column, table, column, column)
+                       for column in update_columns]
+        assignments += ['%s = EXCLUDED.%s' % (column, column) for column in timestamp_columns]
+        sql += ' ON CONFLICT (%s) DO UPDATE SET %s' % (
+            qn(key_field.column), ', '.join(assignments))
+    return sql, params
+
+
+def _get_timestamps(model):
+    timestamp = now()
+    return {field.name: timestamp for field in model._meta.concrete_fields
+            if getattr(field, 'auto_now', False)}
+
+
+def _update_or_create(model, key_field_name, key, values):
+    lookup = {model._meta.get_field(key_field_name).attname: key}
+    affected = model._default_manager.filter(**lookup).update(
+        **{name: F(name) + amount for name, amount in values.items()},
+        **_get_timestamps(model))
+    if not affected:
+        model._default_manager.create(**lookup, **values)
+
+
+class CounterBuffer(object):
+    """
+    Collects increments of analytics counters, and new analytics records, in
+    process memory and writes them to the database in batches.
+
+    Counters are written with :py:func:`upsert_counters`, records with
+    ``bulk_create``. ``flush_if_due`` writes the buffer once
+    ``OSCAR_ANALYTICS_FLUSH_INTERVAL`` seconds have passed since the last
+    flush; it's called when a request has finished (see
+    ``oscar.apps.analytics.receivers``), so requests don't wait for it. The
+    buffer is also written straight away when it holds ``max_size`` entries,
+    or when the interval is ``0``.
+
+    Buffered entries are lost if the process is killed before they are
+    flushed, which is an acceptable trade-off for analytics.
+    """
+    #: The number of entries after which the buffer is flushed regardless
+    #: of the interval
+    max_size = 1000
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._last_flush = time.monotonic()
+        self._reset()
+
+    def _reset(self):
+        # Maps (model, key field name) tuples to {key: Counter} dicts
+        self._counters = defaultdict(lambda: defaultdict(Counter))
+        # Maps models to lists of unsaved instances
+        self._instances = defaultdict(list)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def increment(self, model, key_field_name, key, field_name, amount=1):
+        """
+        Add ``amount`` to the ``field_name`` counter of the record of ``model``
+        whose ``key_field_name`` is ``key``
+        """
+        with self._lock:
+            self._counters[model, key_field_name][key][field_name] += amount
+            self._size += 1
+        self.flush_if_full()
+
+    def add(self, instance):
+        """
+        Add an unsaved record, to be saved with the next flush
+        """
+        with self._lock:
+            self._instances[type(instance)].append(instance)
+            self._size += 1
+        self.flush_if_full()
+
+    def is_full(self):
+        return self._size >= self.max_size or not settings.OSCAR_ANALYTICS_FLUSH_INTERVAL
+
+    def flush_if_full(self):
+        if self.is_full():
+            self.flush()
+
+    def is_due(self):
+        interval = settings.OSCAR_ANALYTICS_FLUSH_INTERVAL
+        return self._size > 0 and time.monotonic() - self._last_flush >= interval
+
+    def flush_if_due(self):
+        if self.is_due():
+            self.flush()
+
+    def flush(self):
+        """
+        Write all buffered counters and records to the database
+        """
+        with self._lock:
+            if not self._size:
+                return
+            counters, instances = self._counters, self._instances
+            self._reset()
+            self._last_flush = time.monotonic()
+
+        try:
+            with transaction.atomic():
+                for (model, key_field_name), increments in counters.items():
+                    upsert_counters(model, key_field_name, increments)
+                for model, objs in instances.items():
+                    model._default_manager.bulk_create(objs)
+        except DatabaseError:
+            logger.exception("Error when writing analytics records")
@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-17 08:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_auto_20200801_0817'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productrecord',
+            name='date_scored',
+            field=models.DateTimeField(blank=True, db_index=True, null=True, verbose_name='Date scored'),
+        ),
+        migrations.AddField(
+            model_name='productrecord',
+            name='date_updated',
+            field=models.DateTimeField(auto_now=True, db_index=True, null=True, verbose_name='Date updated'),
+        ),
+        migrations.AddField(
+            model_name='productrecord',
+            name='scored_total',
+            field=models.FloatField(default=0.0, verbose_name='Scored total'),
+        ),
+    ]
@@ -0,0 +1,54 @@
+# Generated by Django 3.2.25 on 2026-10-17 09:55
+
+from decimal import Decimal
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('partner', '0001_initial'),
+        ('analytics', '0004_productrecord_scoring'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='HourlyStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField(db_index=True, verbose_name='Start of period')),
+                ('num_orders', models.IntegerField(default=0, verbose_name='Orders')),
+                ('num_lines', models.IntegerField(default=0, verbose_name='Order lines')),
+                ('total_incl_tax', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='Revenue (inc. tax)')),
+                ('num_customers', models.IntegerField(default=0, verbose_name='Customers')),
+                ('num_open_baskets', models.IntegerField(default=0, verbose_name='Open baskets')),
+                ('partner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='partner.partner', verbose_name='Partner')),
+            ],
+            options={
+                'verbose_name': 'Hourly statistics',
+                'verbose_name_plural': 'Hourly statistics',
+                'ordering': ['period_start'],
+                'abstract': False,
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyStatistics',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('period_start', models.DateTimeField(db_index=True, verbose_name='Start of period')),
+                ('num_orders', models.IntegerField(default=0, verbose_name='Orders')),
+                ('num_lines', models.IntegerField(default=0, verbose_name='Order lines')),
+                ('total_incl_tax', models.DecimalField(decimal_places=2, default=Decimal('0.00'), max_digits=12, verbose_name='Revenue (inc. tax)')),
+                ('num_customers', models.IntegerField(default=0, verbose_name='Customers')),
+                ('num_open_baskets', models.IntegerField(default=0, verbose_name='Open baskets')),
+                ('partner', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='+', to='partner.partner', verbose_name='Partner')),
+            ],
+            options={
+                'verbose_name': 'Daily statistics',
+                'verbose_name_plural': 'Daily statistics',
+                'ordering': ['period_start'],
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 14:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0005_statistics'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='productrecord',
+            name='scored_half_life',
+            field=models.FloatField(blank=True, null=True, verbose_name='Scored half-life'),
+        ),
+    ]
@@ -1,6 +1,6 @@
 from oscar.apps.analytics.abstract_models import (
-    AbstractProductRecord, AbstractUserProductView,
-    AbstractUserRecord, AbstractUserSearch)
+    AbstractDailyStatistics, AbstractHourlyStatistics, AbstractProductRecord,
+    AbstractUserProductView, AbstractUserRecord, AbstractUserSearch)
 from oscar.core.loading import is_model_registered
 
 __all__ = []
@@ -32,3 +32,17 @@ if not is_model_registered('analytics', 'UserSearch'):
         pass
 
     __all__.append('UserSearch')
+
+
+if not is_model_registered('analytics', 'HourlyStatistics'):
+    class HourlyStatistics(AbstractHourlyStatistics):
+        pass
+
+    __all__.append('HourlyStatistics')
+
+
+if not is_model_registered('analytics', 'DailyStatistics'):
+    class DailyStatistics(AbstractDailyStatistics):
+        pass
+
+    __all__.append('DailyStatistics')
@@ -1,56 +1,41 @@
+import atexit
 import logging
 
+from django.conf import settings
+from django.core.signals import request_finished
 from django.db import IntegrityError
 from django.db.models import F
+from django.db.models.signals import post_delete, post_save, pre_save
 from django.dispatch import receiver
 
 from oscar.apps.basket.signals import basket_addition
 from oscar.apps.catalogue.signals import product_viewed
 from oscar.apps.order.signals import order_placed
 from oscar.apps.search.signals import user_search
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_classes, get_model
 
+Basket = get_model('basket', 'Basket')
 ProductRecord = get_model('analytics', 'ProductRecord')
 UserProductView = get_model('analytics', 'UserProductView')
 UserRecord = get_model('analytics', 'UserRecord')
 UserSearch = get_model('analytics', 'UserSearch')
+CounterBuffer = get_class('analytics.counters', 'CounterBuffer')
+record_order, record_open_basket = get_classes(
+    'analytics.statistics', ['record_order', 'record_open_basket'])
 
 # Helpers
 
 logger = logging.getLogger('oscar.analytics')
 
-
-def _update_counter(model, field_name, filter_kwargs, increment=1):
-    """
-    Efficiently updates a counter field by a given increment. Uses Django's
-    update() call to fetch and update in one query.
-
-    TODO: This has a race condition, we should use UPSERT here
-
-    :param model: The model class of the recording model
-    :param field_name: The name of the field to update
-    :param filter_kwargs: Parameters to the ORM's filter() function to get the
-                          correct instance
-    """
-    try:
-        record = model.objects.filter(**filter_kwargs)
-        affected = record.update(**{field_name: F(field_name) + increment})
-        if not affected:
-            filter_kwargs[field_name] = increment
-            model.objects.create(**filter_kwargs)
-    except IntegrityError:      # pragma: no cover
-        # get_or_create has a race condition (we should use upsert in supported)
-        # databases. For now just ignore these errors
-        logger.error(
-            "IntegrityError when updating analytics counter for %s", model)
+#: Buffer for the counters and product views of this process
+counters = CounterBuffer()
+atexit.register(counters.flush)
 
 
 def _record_products_in_order(order):
-    # surely there's a way to do this without causing a query for each line?
-    for line in order.lines.all():
-        _update_counter(
-            ProductRecord, 'num_purchases',
-            {'product': line.product}, line.quantity)
+    for product_id, quantity in order.lines.values_list('product_id', 'quantity'):
+        if product_id is not None:
+            counters.increment(ProductRecord, 'product', product_id, 'num_purchases', quantity)
 
 
 def _record_user_order(user, order):
@@ -79,10 +64,10 @@ def _record_user_order(user, order):
 def receive_product_view(sender, product, user, **kwargs):
     if kwargs.get('raw', False):
         return
-    _update_counter(ProductRecord, 'num_views', {'product': product})
+    counters.increment(ProductRecord, 'product', product.pk, 'num_views')
     if user and user.is_authenticated:
-        _update_counter(UserRecord, 'num_product_views', {'user': user})
-        UserProductView.objects.create(product=product, user=user)
+        counters.increment(UserRecord, 'user', user.pk, 'num_product_views')
+        counters.add(UserProductView(product_id=product.pk, user_id=user.pk))
 
 
 @receiver(user_search)
@@ -95,10 +80,9 @@ def receive_product_search(sender, query, user, **kwargs):
 def receive_basket_addition(sender, product, user, **kwargs):
     if kwargs.get('raw', False):
         return
-    _update_counter(
-        ProductRecord, 'num_basket_additions', {'product': product})
+    counters.increment(ProductRecord, 'product', product.pk, 'num_basket_additions')
     if user and user.is_authenticated:
-        _update_counter(UserRecord, 'num_basket_additions', {'user': user})
+        counters.increment(UserRecord, 'user', user.pk, 'num_basket_additions')
 
 
 @receiver(order_placed)
@@ -108,3 +92,36 @@ def receive_order_placed(sender, order, user, **kwargs):
     _record_products_in_order(order)
     if user and user.is_authenticated:
         _record_user_order(user, order)
+    if settings.OSCAR_MATERIALISE_DASHBOARD_STATISTICS:
+        record_order(order)
+
+
+@receiver(pre_save, sender=Basket)
+def receive_basket_pre_save(sender, instance, **kwargs):
+    if kwargs.get('raw', False) or not settings.OSCAR_MATERIALISE_DASHBOARD_STATISTICS:
+        return
+    # Remember whether the basket was open, to count it when it's opened or
+    # closed after it has been saved
+    instance._was_open = instance.pk is not None and Basket.objects.filter(
+        pk=instance.pk, status=Basket.OPEN).exists()
+
+
+@receiver(post_save, sender=Basket)
+def receive_basket_saved(sender, instance, **kwargs):
+    if not hasattr(instance, '_was_open'):
+        return
+    was_open = instance.__dict__.pop('_was_open')
+    is_open = instance.status == Basket.OPEN
+    if is_open != was_open:
+        record_open_basket(instance, 1 if is_open else -1)
+
+
+@receiver(post_delete, sender=Basket)
+def receive_basket_deleted(sender, instance, **kwargs):
+    if settings.OSCAR_MATERIALISE_DASHBOARD_STATISTICS and instance.status == Basket.OPEN:
+        record_open_basket(instance, -1)
+
+
+@receiver(request_finished)
+def flush_counters(sender, **kwargs):
+    counters.flush_if_due()
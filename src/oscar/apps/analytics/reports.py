@@ -14,20 +14,19 @@ UserRecord = get_model('analytics', 'UserRecord')
 class ProductReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'conditional-offer-performance.csv'
 
-    def generate_csv(self, response, products):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, products):
         header_row = [_('Product'),
                       _('Views'),
                       _('Basket additions'),
                       _('Purchases')]
-        writer.writerow(header_row)
+        yield header_row
 
         for record in products:
             row = [record.product,
                    record.num_views,
                    record.num_basket_additions,
                    record.num_purchases]
-            writer.writerow(row)
+            yield row
 
 
 class ProductReportHTMLFormatter(ReportHTMLFormatter):
@@ -43,6 +42,9 @@ class ProductReportGenerator(ReportGenerator):
         'CSV_formatter': ProductReportCSVFormatter,
         'HTML_formatter': ProductReportHTMLFormatter}
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('product')
+
     def report_description(self):
         return self.description
 
@@ -53,8 +55,7 @@ class ProductReportGenerator(ReportGenerator):
 class UserReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'user-analytics.csv'
 
-    def generate_csv(self, response, users):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, users):
         header_row = [_('Name'),
                       _('Date registered'),
                       _('Product views'),
@@ -64,7 +65,7 @@ class UserReportCSVFormatter(ReportCSVFormatter):
                       _('Order items'),
                       _('Total spent'),
                       _('Date of last order')]
-        writer.writerow(header_row)
+        yield header_row
 
         for record in users:
             row = [record.user.get_full_name(),
@@ -76,7 +77,7 @@ class UserReportCSVFormatter(ReportCSVFormatter):
                    record.num_order_items,
                    record.total_spent,
                    self.format_datetime(record.date_last_order)]
-            writer.writerow(row)
+            yield row
 
 
 class UserReportHTMLFormatter(ReportHTMLFormatter):
@@ -1,4 +1,10 @@
-from django.db.models import F
+import math
+from datetime import datetime
+
+from django.conf import settings
+from django.db.models import F, Max, Value
+from django.db.models.functions import Ln
+from django.utils.timezone import now, utc
 
 from oscar.core.loading import get_model
 
@@ -6,6 +12,24 @@ ProductRecord = get_model('analytics', 'ProductRecord')
 
 
 class Calculator(object):
+    """
+    Calculates the scores of products from their analytics counters.
+
+    Without time decay, the score is the weighted average of the counters.
+
+    With time decay (see ``OSCAR_PRODUCT_SCORE_HALF_LIFE``), the weight of
+    each view, basket addition and purchase halves every half-life. Rather
+    than decaying every score on every run, activity is weighted by how long
+    after ``decay_epoch`` it was recorded, and the natural logarithm of the
+    total is stored. The scores of products without any new activity then
+    stay correctly ordered relative to all others, and only records whose
+    counters changed need to be written.
+
+    The half-life is stored along with the scores. As scores with and without
+    time decay, or with different half-lives, can't be combined, all scores
+    are calculated again when it has changed, even if only the changed
+    scores were asked for.
+    """
 
     # Map of field name to weight
     weights = {
@@ -14,16 +38,133 @@ class Calculator(object):
         'num_purchases': 5
     }
 
-    def __init__(self, logger):
+    #: The reference date for scores with time decay
+    decay_epoch = datetime(2020, 1, 1, tzinfo=utc)
+
+    #: The number of records written per query when calculating scores with
+    #: time decay incrementally
+    batch_size = 1000
+
+    def __init__(self, logger, half_life=None):
         self.logger = logger
+        if half_life is None:
+            half_life = settings.OSCAR_PRODUCT_SCORE_HALF_LIFE
+        self.half_life = half_life or None
+
+    def run(self, incremental=False):
+        if incremental and self.half_life_changed():
+            self.logger.info("The score half-life has changed, calculating all scores")
+            incremental = False
+        if incremental:
+            self.calculate_changed_scores()
+        else:
+            self.calculate_scores()
+
+    @property
+    def total_weight(self):
+        return float(sum(self.weights.values()))
 
-    def run(self):
-        self.calculate_scores()
+    def half_life_changed(self):
+        """
+        Return whether the scores were last calculated with another half-life.
+        Full runs calculate all scores with the same half-life, and
+        incremental runs only continue with it, so it's enough to check the
+        most recently calculated score.
+        """
+        last_scored = ProductRecord.objects.filter(date_scored__isnull=False).order_by(
+            '-date_scored').values_list('scored_half_life', flat=True)[:1]
+        return any(half_life != self.half_life for half_life in last_scored)
+
+    def get_weighted_total(self):
+        return sum(self.weights[name] * F(name) for name in self.weights.keys())
+
+    def get_growth(self, date):
+        """
+        Return the logarithm of the weight of activity recorded at the given
+        date, relative to activity at the decay epoch
+        """
+        half_lives = (date - self.decay_epoch).total_seconds() / (self.half_life * 24 * 60 * 60)
+        return half_lives * math.log(2)
 
     def calculate_scores(self):
+        """
+        Calculate the scores of all records. With time decay, all activity so
+        far is treated as recent.
+        """
         self.logger.info("Calculating product scores")
-        total_weight = float(sum(self.weights.values()))
-        weighted_fields = [
-            self.weights[name] * F(name) for name in self.weights.keys()]
-        ProductRecord.objects.update(
-            score=sum(weighted_fields) / total_weight)
+        started = now()
+        records = ProductRecord.objects.all()
+        weighted_total = self.get_weighted_total()
+        if not self.half_life:
+            records.update(
+                score=weighted_total / self.total_weight,
+                scored_total=weighted_total, scored_half_life=None, date_scored=started)
+            return
+
+        records = records.annotate(weighted_total=weighted_total)
+        records.filter(weighted_total__lte=0).update(
+            score=0, scored_total=0, scored_half_life=self.half_life, date_scored=started)
+        records.filter(weighted_total__gt=0).update(
+            score=Ln(weighted_total / self.total_weight) + Value(self.get_growth(started)),
+            scored_total=weighted_total, scored_half_life=self.half_life, date_scored=started)
+
+    def get_changed_records(self):
+        """
+        Return the records whose counters changed since the last run
+        """
+        records = ProductRecord.objects.all()
+        last_run = records.aggregate(last_run=Max('date_scored'))['last_run']
+        if last_run is not None:
+            records = records.filter(date_updated__gte=last_run)
+        return records
+
+    def calculate_changed_scores(self):
+        """
+        Calculate the scores of the records whose counters changed since the
+        last run
+        """
+        self.logger.info("Calculating changed product scores")
+        started = now()
+        records = self.get_changed_records()
+        weighted_total = self.get_weighted_total()
+        if not self.half_life:
+            num_records = records.update(
+                score=weighted_total / self.total_weight,
+                scored_total=weighted_total, scored_half_life=None, date_scored=started)
+            self.logger.info("Updated %d product scores", num_records)
+            return
+
+        growth = self.get_growth(started)
+        records = records.annotate(weighted_total=weighted_total).only(
+            'id', 'score', 'scored_total')
+        batch = []
+        num_records = 0
+        for record in records.iterator():
+            self.add_activity(record, record.weighted_total, growth)
+            record.scored_half_life = self.half_life
+            record.date_scored = started
+            batch.append(record)
+            if len(batch) >= self.batch_size:
+                num_records += self.save_scores(batch)
+                batch = []
+        num_records += self.save_scores(batch)
+        self.logger.info("Updated %d product scores", num_records)
+
+    def add_activity(self, record, weighted_total, growth):
+        """
+        Add the activity recorded since the last run to the score of a record
+        """
+        delta = (weighted_total - record.scored_total) / self.total_weight
+        if delta > 0:
+            activity = math.log(delta) + growth
+            if record.scored_total > 0:
+                # log(exp(score) + exp(activity)), without overflowing
+                high, low = max(record.score, activity), min(record.score, activity)
+                record.score = high + math.log1p(math.exp(low - high))
+            else:
+                record.score = activity
+        record.scored_total = weighted_total
+
+    def save_scores(self, records):
+        ProductRecord.objects.bulk_update(records, ['score', 'scored_total', 'scored_half_life', 'date_scored'])
+        return len(records)
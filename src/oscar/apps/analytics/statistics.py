@@ -0,0 +1,178 @@
+from collections import Counter, defaultdict
+from decimal import Decimal as D
+
+from django.db.models import Count, Exists, F, OuterRef, Sum
+from django.db.models.functions import TruncHour
+from django.utils import timezone
+
+from oscar.core.compat import get_user_model
+from oscar.core.loading import get_model
+
+Basket = get_model('basket', 'Basket')
+DailyStatistics = get_model('analytics', 'DailyStatistics')
+HourlyStatistics = get_model('analytics', 'HourlyStatistics')
+Line = get_model('order', 'Line')
+Order = get_model('order', 'Order')
+Partner = get_model('partner', 'Partner')
+User = get_user_model()
+
+STATISTICS_FIELDS = ['num_orders', 'num_lines', 'total_incl_tax', 'num_customers', 'num_open_baskets']
+
+
+# Periods are in UTC, so they line up regardless of the time zones of the
+# dates they are computed from
+
+def get_hour(dt):
+    if timezone.is_aware(dt):
+        dt = dt.astimezone(timezone.utc)
+    return dt.replace(minute=0, second=0, microsecond=0)
+
+
+def get_day(dt):
+    return get_hour(dt).replace(hour=0)
+
+
+def add_statistics(partner_id, dt, **increments):
+    """
+    Add the increments to the hourly and daily statistics of the partner (or
+    the whole shop, if ``partner_id`` is ``None``) for the period of ``dt``.
+
+    The rows are updated, or created if they don't exist yet. Concurrent
+    updates can create more than one row for the same period, which doesn't
+    matter as the statistics are always summed up.
+    """
+    for model, period_start in [(HourlyStatistics, get_hour(dt)), (DailyStatistics, get_day(dt))]:
+        affected = model.objects.filter(partner_id=partner_id, period_start=period_start).update(
+            **{name: F(name) + amount for name, amount in increments.items()})
+        if not affected:
+            model.objects.create(partner_id=partner_id, period_start=period_start, **increments)
+
+
+def record_order(order):
+    """
+    Add a placed order to the statistics of the shop and of the partners of
+    its lines
+    """
+    num_lines = Counter(order.lines.values_list('partner_id', flat=True))
+    partner_ids = sorted(pk for pk in num_lines if pk is not None)
+
+    add_statistics(None, order.date_placed, num_orders=1, num_lines=sum(num_lines.values()),
+                   total_incl_tax=order.total_incl_tax)
+    for partner_id in partner_ids:
+        add_statistics(partner_id, order.date_placed, num_orders=1, num_lines=num_lines[partner_id],
+                       total_incl_tax=order.total_incl_tax)
+
+    # Customers are counted with their first order, overall and per partner
+    if order.user_id is None:
+        return
+    previous_orders = Order.objects.filter(user_id=order.user_id).exclude(pk=order.pk)
+    if not previous_orders.exists():
+        add_statistics(None, order.user.date_joined, num_customers=1)
+    previous_partner_ids = set(Line.objects.filter(
+        order__in=previous_orders, partner_id__in=partner_ids).values_list('partner_id', flat=True))
+    for partner_id in partner_ids:
+        if partner_id not in previous_partner_ids:
+            add_statistics(partner_id, order.user.date_joined, num_customers=1)
+
+
+def record_open_basket(basket, amount):
+    """
+    Add ``amount`` to the open baskets of the period the basket was created in
+    """
+    add_statistics(None, basket.date_created, num_open_baskets=amount)
+
+
+class ShopStatistics(object):
+    """
+    Reads the statistics of the whole shop, or of a single partner.
+    """
+
+    def __init__(self, partner_id=None):
+        self.partner_id = partner_id
+
+    def get_totals(self, since=None):
+        """
+        Return the summed up statistics, either of all time or of the hours
+        since ``since``, rounded down to the hour
+        """
+        if since is None:
+            rows = DailyStatistics.objects.filter(partner_id=self.partner_id)
+        else:
+            rows = HourlyStatistics.objects.filter(
+                partner_id=self.partner_id, period_start__gte=get_hour(since))
+        totals = rows.aggregate(**{name: Sum(name) for name in STATISTICS_FIELDS})
+        totals = {name: value or 0 for name, value in totals.items()}
+        totals['total_incl_tax'] = D(totals['total_incl_tax'])
+        return totals
+
+    def get_hourly_revenue(self, start, end):
+        """
+        Return a dict mapping the start of each hour between ``start`` and
+        ``end`` to its revenue
+        """
+        rows = HourlyStatistics.objects.filter(
+            partner_id=self.partner_id, period_start__gte=start, period_start__lt=end,
+        ).values_list('period_start').annotate(total=Sum('total_incl_tax'))
+        return dict(rows)
+
+
+class StatisticsBuilder(object):
+    """
+    Computes the statistics from the existing orders, customers and baskets,
+    e.g. when the statistics are enabled in an existing shop.
+    """
+
+    def __init__(self):
+        # Maps (partner id, hour) tuples to the statistics of the hour
+        self.hours = defaultdict(Counter)
+
+    def build(self):
+        self.add_orders(Order.objects.all(), None)
+        self.add_lines(Line.objects.all(), None)
+        self.add_customers(User.objects.filter(Exists(Order.objects.filter(user=OuterRef('pk')))), None)
+        self.add_baskets(Basket.objects.filter(status=Basket.OPEN))
+        for partner_id in Partner.objects.values_list('pk', flat=True):
+            partner_lines = Line.objects.filter(partner_id=partner_id)
+            self.add_orders(Order.objects.filter(Exists(partner_lines.filter(order=OuterRef('pk')))), partner_id)
+            self.add_lines(partner_lines, partner_id)
+            self.add_customers(User.objects.filter(
+                Exists(partner_lines.filter(order__user=OuterRef('pk')))), partner_id)
+        return self.hours
+
+    def add_orders(self, orders, partner_id):
+        rows = orders.annotate(hour=TruncHour('date_placed', tzinfo=timezone.utc)).values_list('hour').annotate(
+            num_orders=Count('pk'), total_incl_tax=Sum('total_incl_tax')).order_by()
+        for hour, num_orders, total_incl_tax in rows:
+            self.hours[partner_id, hour].update(num_orders=num_orders, total_incl_tax=total_incl_tax)
+
+    def add_lines(self, lines, partner_id):
+        rows = lines.annotate(hour=TruncHour('order__date_placed', tzinfo=timezone.utc)).values_list('hour').annotate(
+            num_lines=Count('pk')).order_by()
+        for hour, num_lines in rows:
+            self.hours[partner_id, hour].update(num_lines=num_lines)
+
+    def add_customers(self, users, partner_id):
+        rows = users.annotate(hour=TruncHour('date_joined', tzinfo=timezone.utc)).values_list('hour').annotate(
+            num_customers=Count('pk')).order_by()
+        for hour, num_customers in rows:
+            self.hours[partner_id, hour].update(num_customers=num_customers)
+
+    def add_baskets(self, baskets):
+        rows = baskets.annotate(hour=TruncHour('date_created', tzinfo=timezone.utc)).values_list('hour').annotate(
+            num_open_baskets=Count('pk')).order_by()
+        for hour, num_open_baskets in rows:
+            self.hours[None, hour].update(num_open_baskets=num_open_baskets)
+
+    def save(self, batch_size=1000):
+        """
+        Replace the existing statistics with the built ones
+        """
+        days = defaultdict(Counter)
+        for (partner_id, hour), statistics in self.hours.items():
+            days[partner_id, get_day(hour)].update(statistics)
+
+        for model, periods in [(HourlyStatistics, self.hours), (DailyStatistics, days)]:
+            model.objects.all().delete()
+            model.objects.bulk_create([
+                model(partner_id=partner_id, period_start=period_start, **statistics)
+                for (partner_id, period_start), statistics in periods.items()], batch_size=batch_size)
@@ -3,7 +3,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class BasketConfig(OscarConfig):
@@ -14,11 +13,13 @@ class BasketConfig(OscarConfig):
     namespace = 'basket'
 
     def ready(self):
-        self.summary_view = get_class('basket.views', 'BasketView')
-        self.saved_view = get_class('basket.views', 'SavedView')
-        self.add_view = get_class('basket.views', 'BasketAddView')
-        self.add_voucher_view = get_class('basket.views', 'VoucherAddView')
-        self.remove_voucher_view = get_class('basket.views', 'VoucherRemoveView')
+        from . import receivers  # noqa
+
+        self.summary_view = self.get_view_class('basket.views', 'BasketView')
+        self.saved_view = self.get_view_class('basket.views', 'SavedView')
+        self.add_view = self.get_view_class('basket.views', 'BasketAddView')
+        self.add_voucher_view = self.get_view_class('basket.views', 'VoucherAddView')
+        self.remove_voucher_view = self.get_view_class('basket.views', 'VoucherRemoveView')
 
     def get_urls(self):
         urls = [
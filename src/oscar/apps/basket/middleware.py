@@ -6,8 +6,9 @@ from django.utils.translation import gettext_lazy as _
 
 from oscar.core.loading import get_class, get_model
 
-Applicator = get_class('offer.applicator', 'Applicator')
 Basket = get_model('basket', 'basket')
+BasketSummary = get_class('basket.utils', 'BasketSummary')
+OfferApplicationCache = get_class('basket.utils', 'OfferApplicationCache')
 Selector = get_class('partner.strategy', 'Selector')
 
 selector = Selector()
@@ -40,6 +41,10 @@ class BasketMiddleware:
             basket.strategy = request.strategy
             self.apply_offers_to_basket(request, basket)
 
+            summary_key = self.get_basket_summary_key(request)
+            if summary_key is not None:
+                BasketSummary.store(summary_key, basket)
+
             return basket
 
         def load_basket_hash():
@@ -53,10 +58,18 @@ class BasketMiddleware:
             if basket.id:
                 return self.get_basket_hash(basket.id)
 
+        def load_basket_summary():
+            """
+            Return the line count and totals of the basket, without loading
+            the basket if they are cached.
+            """
+            return self.get_basket_summary(request)
+
         # Use Django's SimpleLazyObject to only perform the loading work
         # when the attribute is accessed.
         request.basket = SimpleLazyObject(load_full_basket)
         request.basket_hash = SimpleLazyObject(load_basket_hash)
+        request.basket_summary = SimpleLazyObject(load_basket_summary)
 
         response = self.get_response(request)
         return self.process_response(request, response)
@@ -176,6 +189,44 @@ class BasketMiddleware:
 
         return basket
 
+    def get_basket_summary_key(self, request):
+        """
+        Return the cache key of the basket summary for this request.
+
+        Returns ``None`` when the summary can't be looked up without loading
+        the basket, e.g. when a cookie basket has to be merged into the
+        user's basket.
+        """
+        cookie_key = self.get_cookie_key(request)
+        if hasattr(request, 'user') and request.user.is_authenticated:
+            if cookie_key in request.COOKIES:
+                return None
+            return BasketSummary.get_cache_key(owner_id=request.user.pk)
+        if cookie_key in request.COOKIES:
+            try:
+                basket_id = Signer().unsign(request.COOKIES[cookie_key])
+            except BadSignature:
+                return None
+            return BasketSummary.get_cache_key(basket_id=basket_id)
+        return None
+
+    def get_basket_summary(self, request):
+        """
+        Return the summary of the open basket for this request
+        """
+        is_anonymous = not (hasattr(request, 'user') and request.user.is_authenticated)
+        if is_anonymous and self.get_cookie_key(request) not in request.COOKIES:
+            # No basket has been created yet
+            return BasketSummary()
+
+        summary_key = self.get_basket_summary_key(request)
+        if summary_key is not None and settings.OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT:
+            summary = BasketSummary.load(summary_key, request.strategy)
+            if summary is not None:
+                return summary
+        # Loading the basket stores its summary
+        return BasketSummary.from_basket(request.basket)
+
     def merge_baskets(self, master, slave):
         """
         Merge one basket into another.
@@ -204,7 +255,7 @@ class BasketMiddleware:
 
     def apply_offers_to_basket(self, request, basket):
         if not basket.is_empty:
-            Applicator().apply(basket, request.user, request)
+            OfferApplicationCache(request).apply(basket)
 
     def get_basket_hash(self, basket_id):
         return Signer().sign(basket_id)
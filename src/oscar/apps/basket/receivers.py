@@ -0,0 +1,37 @@
+from django.core.exceptions import ObjectDoesNotExist
+from django.db.models.signals import m2m_changed, post_delete, post_save
+
+from oscar.core.loading import get_class, get_model
+
+Basket = get_model('basket', 'Basket')
+Line = get_model('basket', 'Line')
+BasketSummary = get_class('basket.utils', 'BasketSummary')
+
+
+def invalidate_basket_summary(sender, instance, **kwargs):
+    """
+    Drop the cached summary of a basket when the basket, its lines or its
+    vouchers have changed.
+    """
+    if not kwargs.get('action', 'post_').startswith('post_'):
+        return
+    if isinstance(instance, Basket):
+        baskets = [instance]
+    elif isinstance(instance, Line):
+        try:
+            baskets = [instance.basket]
+        except ObjectDoesNotExist:
+            # The basket is being deleted as well
+            return
+    else:
+        # A voucher was added to or removed from baskets
+        baskets = Basket.objects.filter(pk__in=kwargs.get('pk_set') or [])
+    for basket in baskets:
+        BasketSummary.invalidate(basket)
+
+
+for sender in [Basket, Line]:
+    post_save.connect(invalidate_basket_summary, sender=sender)
+    post_delete.connect(invalidate_basket_summary, sender=sender)
+
+m2m_changed.connect(invalidate_basket_summary, sender=Basket.vouchers.through)
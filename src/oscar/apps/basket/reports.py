@@ -13,8 +13,7 @@ Basket = get_model('basket', 'Basket')
 class OpenBasketReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'open-baskets-%s-%s.csv'
 
-    def generate_csv(self, response, baskets):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, baskets):
         header_row = [_('User ID'),
                       _('Name'),
                       _('Email'),
@@ -24,7 +23,7 @@ class OpenBasketReportCSVFormatter(ReportCSVFormatter):
                       _('Date of creation'),
                       _('Time since creation'),
                       ]
-        writer.writerow(header_row)
+        yield header_row
 
         for basket in baskets:
             if basket.owner:
@@ -38,7 +37,7 @@ class OpenBasketReportCSVFormatter(ReportCSVFormatter):
                        basket.num_lines, basket.num_items,
                        self.format_datetime(basket.date_created),
                        self.format_timedelta(basket.time_since_creation)]
-            writer.writerow(row)
+            yield row
 
     def filename(self, **kwargs):
         return self.filename_template % (kwargs['start_date'],
@@ -56,7 +55,7 @@ class OpenBasketReportGenerator(ReportGenerator):
     code = 'open_baskets'
     description = _('Open baskets')
     date_range_field_name = 'date_created'
-    queryset = Basket._default_manager.filter(status=Basket.OPEN)
+    queryset = Basket._default_manager.filter(status=Basket.OPEN).select_related('owner')
 
     formatters = {
         'CSV_formatter': OpenBasketReportCSVFormatter,
@@ -72,8 +71,7 @@ class OpenBasketReportGenerator(ReportGenerator):
 class SubmittedBasketReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'submitted_baskets-%s-%s.csv'
 
-    def generate_csv(self, response, baskets):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, baskets):
         header_row = [_('User ID'),
                       _('User'),
                       _('Basket status'),
@@ -82,7 +80,7 @@ class SubmittedBasketReportCSVFormatter(ReportCSVFormatter):
                       _('Date created'),
                       _('Time between creation and submission'),
                       ]
-        writer.writerow(header_row)
+        yield header_row
 
         for basket in baskets:
             row = [basket.owner_id,
@@ -92,7 +90,7 @@ class SubmittedBasketReportCSVFormatter(ReportCSVFormatter):
                    basket.num_items,
                    self.format_datetime(basket.date_created),
                    basket.time_before_submit]
-            writer.writerow(row)
+            yield row
 
     def filename(self, **kwargs):
         return self.filename_template % (kwargs['start_date'],
@@ -110,7 +108,7 @@ class SubmittedBasketReportGenerator(ReportGenerator):
     code = 'submitted_baskets'
     description = _('Submitted baskets')
     date_range_field_name = 'date_submitted'
-    queryset = Basket._default_manager.filter(status=Basket.SUBMITTED)
+    queryset = Basket._default_manager.filter(status=Basket.SUBMITTED).select_related('owner')
 
     formatters = {
         'CSV_formatter': SubmittedBasketReportCSVFormatter,
@@ -1,12 +1,20 @@
+import hashlib
+import pickle
 from collections import defaultdict
+from decimal import Decimal as D
 
+from django.conf import settings
 from django.contrib import messages
+from django.core.cache import cache
 from django.template.loader import render_to_string
+from django.utils.timezone import now
 
 from oscar.core.loading import get_class, get_model
 
 Applicator = get_class('offer.applicator', 'Applicator')
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
+SiteOfferSnapshot = get_class('offer.snapshot', 'SiteOfferSnapshot')
+RangeMembershipIndex = get_class('offer.membership', 'RangeMembershipIndex')
 
 
 class BasketMessageGenerator(object):
@@ -187,3 +195,216 @@ class LineOfferConsumer(object):
                     return 0
 
         return max_affected_items - self.consumed(offer)
+
+
+class OfferApplicationCache(object):
+    """
+    Caches the result of applying offers to a basket.
+
+    The line discounts and offer applications are stored under a hash of
+    everything that affects them: the basket's lines and quantities, the
+    products and stock records, the vouchers, the user, the strategy and the
+    versions of the site offers and range memberships. A cached result is
+    restored onto the basket without running any conditions or benefits;
+    when any of the inputs change, the hash changes too and the offers are
+    applied again.
+
+    Entries expire at the latest when a site offer or one of the basket's
+    vouchers starts or ends. Projects that make offers depend on other state
+    (e.g. with session offers) should extend ``get_key_parts``.
+    """
+    cache_key_template = 'oscar_basket_offers_%s'
+
+    def __init__(self, request):
+        self.request = request
+
+    def get_timeout(self, basket):
+        timeout = settings.OSCAR_BASKET_OFFERS_CACHE_TIMEOUT
+        changes = [SiteOfferSnapshot().get_next_change()]
+        for voucher in basket.vouchers.all():
+            changes.extend([voucher.start_datetime, voucher.end_datetime])
+        cutoff = now()
+        changes = [change for change in changes if change and change > cutoff]
+        if changes:
+            seconds = int((min(changes) - cutoff).total_seconds())
+            timeout = min(timeout, seconds)
+        return timeout
+
+    def get_key_parts(self, basket):
+        strategy = basket.strategy
+        user = self.request.user
+        parts = [
+            basket.id,
+            user.pk if user.is_authenticated else None,
+            '%s.%s' % (type(strategy).__module__, type(strategy).__qualname__),
+            SiteOfferSnapshot.get_version(),
+            RangeMembershipIndex.get_version(),
+            sorted(basket.vouchers.values_list('id', flat=True)),
+        ]
+        for line in basket.all_lines():
+            stockrecord = line.stockrecord
+            parts.append((
+                line.id, line.line_reference, line.quantity,
+                line.product_id, line.product.date_updated,
+                line.stockrecord_id, stockrecord.date_updated if stockrecord else None,
+            ))
+        return parts
+
+    def get_cache_key(self, basket):
+        parts = self.get_key_parts(basket)
+        digest = hashlib.md5(repr(parts).encode('utf8')).hexdigest()
+        return self.cache_key_template % digest
+
+    def restore(self, basket, cache_key):
+        """
+        Restore the cached result onto the basket. Returns ``True`` if a cached
+        result was found.
+        """
+        entry = cache.get(cache_key)
+        if entry is None:
+            return False
+        line_states, applications = pickle.loads(entry)
+        lines = list(basket.all_lines())
+        if set(line_states) != {line.id for line in lines}:
+            return False
+        for line in lines:
+            discount_excl_tax, discount_incl_tax, offers, affected_quantity, consumptions \
+                = line_states[line.id]
+            line._discount_excl_tax = discount_excl_tax
+            line._discount_incl_tax = discount_incl_tax
+            line.consumer = LineOfferConsumer(line)
+            line.consumer._offers = offers
+            line.consumer._affected_quantity = affected_quantity
+            line.consumer._consumptions.update(consumptions)
+        basket.offer_applications = applications
+        return True
+
+    def store(self, basket, cache_key):
+        line_states = {}
+        for line in basket.all_lines():
+            consumer = line.consumer
+            line_states[line.id] = (
+                line._discount_excl_tax, line._discount_incl_tax, consumer._offers,
+                consumer._affected_quantity, dict(consumer._consumptions))
+        try:
+            entry = pickle.dumps((line_states, basket.offer_applications), pickle.HIGHEST_PROTOCOL)
+        except (pickle.PicklingError, AttributeError, TypeError):
+            # Custom results or offers that can't be pickled aren't cached
+            return
+        timeout = self.get_timeout(basket)
+        if timeout > 0:
+            cache.set(cache_key, entry, timeout)
+
+    def apply(self, basket):
+        """
+        Apply offers to the basket, using a cached result when possible
+        """
+        if not settings.OSCAR_BASKET_OFFERS_CACHE_TIMEOUT:
+            Applicator().apply(basket, self.request.user, self.request)
+            return
+
+        cache_key = self.get_cache_key(basket)
+        if not self.restore(basket, cache_key):
+            Applicator().apply(basket, self.request.user, self.request)
+            self.store(basket, cache_key)
+
+
+class BasketSummary(object):
+    """
+    The line count and totals of a basket.
+
+    Most pages only show these figures in the header, so they are cached
+    under the basket's owner whenever the basket is loaded with its offers
+    applied. Reading ``request.basket_summary`` then costs a single cache
+    lookup instead of loading the basket, its lines and the offers.
+
+    The entry is deleted whenever the basket, its lines or its vouchers
+    change (see ``oscar.apps.basket.receivers``). It's ignored when the site
+    offers or range memberships have changed since it was stored, or when
+    the request uses a different strategy, and it expires after
+    ``OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT`` seconds to pick up price changes.
+    """
+    cache_key_template = 'oscar_basket_summary_%s'
+
+    def __init__(self, num_lines=0, num_items=0, is_tax_known=True,
+                 total_excl_tax=D('0.00'), total_incl_tax=D('0.00'), currency=None):
+        self.num_lines = num_lines
+        self.num_items = num_items
+        self.is_tax_known = is_tax_known
+        self.total_excl_tax = total_excl_tax
+        self.total_incl_tax = total_incl_tax
+        self.currency = currency
+
+    def __repr__(self):
+        return '<BasketSummary: %d lines, %s>' % (self.num_lines, self.total_excl_tax)
+
+    @property
+    def is_empty(self):
+        return self.num_lines == 0
+
+    @classmethod
+    def from_basket(cls, basket):
+        if basket.is_empty:
+            return cls()
+        # The lines are already loaded by the offer application
+        lines = basket.all_lines()
+        is_tax_known = basket.is_tax_known
+        return cls(
+            num_lines=len(lines),
+            num_items=sum(line.quantity for line in lines),
+            is_tax_known=is_tax_known,
+            total_excl_tax=basket.total_excl_tax,
+            total_incl_tax=basket.total_incl_tax if is_tax_known else None,
+            currency=basket.currency)
+
+    @classmethod
+    def get_cache_key(cls, basket_id=None, owner_id=None):
+        """
+        Return the cache key of the summary of a user's basket, or of an
+        anonymous basket
+        """
+        if owner_id is not None:
+            return cls.cache_key_template % ('user_%s' % owner_id)
+        return cls.cache_key_template % ('basket_%s' % basket_id)
+
+    @classmethod
+    def invalidate(cls, basket):
+        keys = [cls.get_cache_key(basket_id=basket.id)]
+        if basket.owner_id is not None:
+            keys.append(cls.get_cache_key(owner_id=basket.owner_id))
+        cache.delete_many(keys)
+
+    @classmethod
+    def get_fingerprint(cls, strategy, versions):
+        return (
+            '%s.%s' % (type(strategy).__module__, type(strategy).__qualname__),
+            versions.get(SiteOfferSnapshot.version_cache_key),
+            versions.get(RangeMembershipIndex.version_cache_key))
+
+    @classmethod
+    def get_version_keys(cls):
+        return [SiteOfferSnapshot.version_cache_key, RangeMembershipIndex.version_cache_key]
+
+    @classmethod
+    def load(cls, cache_key, strategy):
+        """
+        Return the cached summary, or ``None`` if there is no valid entry
+        """
+        values = cache.get_many([cache_key] + cls.get_version_keys())
+        entry = values.get(cache_key)
+        if entry is None or entry[0] != cls.get_fingerprint(strategy, values):
+            return None
+        return cls(**entry[1])
+
+    @classmethod
+    def store(cls, cache_key, basket):
+        """
+        Cache the summary of a basket that has had offers applied
+        """
+        summary = cls.from_basket(basket)
+        timeout = settings.OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT
+        if timeout:
+            fingerprint = cls.get_fingerprint(
+                basket.strategy, cache.get_many(cls.get_version_keys()))
+            cache.set(cache_key, (fingerprint, vars(summary)), timeout)
+        return summary
@@ -24,6 +24,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 from treebeard.mp_tree import MP_Node
 
+from oscar.apps.catalogue.signals import category_moved
 from oscar.core.loading import get_class, get_classes, get_model
 from oscar.core.utils import slugify
 from oscar.core.validators import non_python_keyword
@@ -149,6 +150,9 @@ class AbstractCategory(MP_Node):
     _slug_separator = '/'
     _full_name_separator = ' > '
 
+    # Ancestors loaded by prefetch_ancestors
+    _ancestors = None
+
     objects = CategoryQuerySet.as_manager()
 
     def __str__(self):
@@ -171,6 +175,10 @@ class AbstractCategory(MP_Node):
         if self.is_root():
             return self.slug
 
+        if parent_slug is None and self._ancestors is not None:
+            return self._slug_separator.join(
+                category.slug for category in self.get_ancestors_and_self())
+
         cache_key = self.get_url_cache_key()
         full_slug = cache.get(cache_key)
         if full_slug is None:
@@ -225,6 +233,17 @@ class AbstractCategory(MP_Node):
         # Correctly populate ancestors_are_public
         self.refresh_from_db()
 
+    def move(self, target, pos=None):
+        """
+        Moves the category and its descendants. Treebeard performs the move
+        with bulk updates, so no ``post_save`` signal is sent; listeners can
+        use the ``category_moved`` signal instead.
+        """
+        super().move(target, pos)
+        self._ancestors = None
+        category_moved.send(
+            sender=self.__class__, instance=self, target=target, pos=pos)
+
     @classmethod
     def fix_tree(cls, destructive=False):
         super().fix_tree(destructive)
@@ -252,8 +271,40 @@ class AbstractCategory(MP_Node):
         if self.is_root():
             return [self]
 
+        if self._ancestors is not None:
+            return self._ancestors + [self]
+
         return list(self.get_ancestors()) + [self]
 
+    @classmethod
+    def prefetch_ancestors(cls, categories):
+        """
+        Load the ancestors of all given categories with one query, and store
+        them on the categories. ``full_name``, ``full_slug`` and
+        ``get_ancestors_and_self`` then don't need any queries.
+
+        The ancestors are read from the database, so there is nothing to keep
+        in sync when categories are renamed or moved. Use
+        ``Category.objects.annotate_paths()`` to do this for a queryset.
+        """
+        paths = {
+            category.path[:depth * cls.steplen]
+            for category in categories
+            for depth in range(1, category.depth)}
+        ancestors = {}
+        if paths:
+            ancestors = {
+                ancestor.path: ancestor
+                for ancestor in cls._default_manager.filter(path__in=paths).order_by()}
+        nodes = dict(ancestors)
+        nodes.update((category.path, category) for category in categories)
+        # The same category can be passed more than once, e.g. when the
+        # categories of many products are loaded
+        for node in list(ancestors.values()) + list(categories):
+            ancestor_paths = [node.path[:depth * cls.steplen] for depth in range(1, node.depth)]
+            if all(path in nodes for path in ancestor_paths):
+                node._ancestors = [nodes[path] for path in ancestor_paths]
+
     def get_descendants_and_self(self):
         """
         Gets descendants and includes itself. Use treebeard's get_descendants
@@ -262,8 +313,8 @@ class AbstractCategory(MP_Node):
         """
         return self.get_tree(self)
 
-    def get_url_cache_key(self):
-        current_locale = get_language()
+    def get_url_cache_key(self, language=None):
+        current_locale = language or get_language()
         cache_key = 'CATEGORY_URL_%s_%s' % (current_locale, self.pk)
         return cache_key
 
@@ -3,7 +3,6 @@ from django.urls import include, path, re_path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class CatalogueOnlyConfig(OscarConfig):
@@ -18,10 +17,10 @@ class CatalogueOnlyConfig(OscarConfig):
 
         super().ready()
 
-        self.detail_view = get_class('catalogue.views', 'ProductDetailView')
-        self.catalogue_view = get_class('catalogue.views', 'CatalogueView')
-        self.category_view = get_class('catalogue.views', 'ProductCategoryView')
-        self.range_view = get_class('offer.views', 'RangeDetailView')
+        self.detail_view = self.get_view_class('catalogue.views', 'ProductDetailView')
+        self.catalogue_view = self.get_view_class('catalogue.views', 'CatalogueView')
+        self.category_view = self.get_view_class('catalogue.views', 'ProductCategoryView')
+        self.range_view = self.get_view_class('offer.views', 'RangeDetailView')
 
     def get_urls(self):
         urls = super().get_urls()
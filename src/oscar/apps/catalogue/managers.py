@@ -3,6 +3,7 @@ from collections import defaultdict
 from django.db import models
 from django.db.models import Exists, OuterRef
 from django.db.models.constants import LOOKUP_SEP
+from django.db.models.query import ModelIterable
 from treebeard.mp_tree import MP_NodeQuerySet
 
 from oscar.core.loading import get_model
@@ -122,6 +123,26 @@ class ProductQuerySet(models.query.QuerySet):
         return self.filter(parent=None)
 
 
+class CategoryPathsIterable(ModelIterable):
+    """
+    Yields categories with their ancestors loaded, fetching the ancestors of
+    each chunk of categories with one query.
+    """
+    chunk_size = 2000
+
+    def __iter__(self):
+        model = self.queryset.model
+        categories = []
+        for category in super().__iter__():
+            categories.append(category)
+            if len(categories) >= self.chunk_size:
+                model.prefetch_ancestors(categories)
+                yield from categories
+                categories = []
+        model.prefetch_ancestors(categories)
+        yield from categories
+
+
 class CategoryQuerySet(MP_NodeQuerySet):
 
     def browsable(self):
@@ -129,3 +150,13 @@ class CategoryQuerySet(MP_NodeQuerySet):
         Excludes non-public categories
         """
         return self.filter(is_public=True, ancestors_are_public=True)
+
+    def annotate_paths(self):
+        """
+        Load the ancestors of the categories along with them, so that their
+        full names, full slugs and ancestors don't need a query per category
+        (see ``AbstractCategory.prefetch_ancestors``).
+        """
+        clone = self._chain()
+        clone._iterable_class = CategoryPathsIterable
+        return clone
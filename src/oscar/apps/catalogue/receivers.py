@@ -3,9 +3,11 @@ from django.conf import settings
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
-from oscar.core.loading import get_model
+from oscar.apps.catalogue.signals import category_moved
+from oscar.core.loading import get_class, get_model
 
 Category = get_model("catalogue", "Category")
+CategoryTreeSnapshot = get_class('catalogue.snapshot', 'CategoryTreeSnapshot')
 
 
 if settings.OSCAR_DELETE_IMAGE_FILES:
@@ -36,3 +38,19 @@ if settings.OSCAR_DELETE_IMAGE_FILES:
 @receiver(post_save, sender=Category, dispatch_uid='set_ancestors_are_public')
 def post_save_set_ancestors_are_public(sender, instance, **kwargs):
     instance.set_ancestors_are_public()
+
+
+@receiver(post_save, sender=Category, dispatch_uid='invalidate_category_tree_on_save')
+@receiver(category_moved, sender=Category, dispatch_uid='invalidate_category_tree_on_move')
+def invalidate_category_tree(sender, instance, **kwargs):
+    """
+    Mark the cached category tree as stale, along with the cached URLs of the
+    category's subtree, whose full slugs may have changed.
+    """
+    CategoryTreeSnapshot.invalidate_subtree(instance)
+
+
+@receiver(post_delete, sender=Category, dispatch_uid='invalidate_category_tree_on_delete')
+def invalidate_deleted_category_tree(sender, instance, **kwargs):
+    CategoryTreeSnapshot.invalidate()
+    CategoryTreeSnapshot.invalidate_urls([instance])
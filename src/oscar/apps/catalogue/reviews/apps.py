@@ -3,7 +3,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class CatalogueReviewsConfig(OscarConfig):
@@ -14,10 +13,10 @@ class CatalogueReviewsConfig(OscarConfig):
     hidable_feature_name = 'reviews'
 
     def ready(self):
-        self.detail_view = get_class('catalogue.reviews.views', 'ProductReviewDetail')
-        self.create_view = get_class('catalogue.reviews.views', 'CreateProductReview')
-        self.vote_view = get_class('catalogue.reviews.views', 'AddVoteView')
-        self.list_view = get_class('catalogue.reviews.views', 'ProductReviewList')
+        self.detail_view = self.get_view_class('catalogue.reviews.views', 'ProductReviewDetail')
+        self.create_view = self.get_view_class('catalogue.reviews.views', 'CreateProductReview')
+        self.vote_view = self.get_view_class('catalogue.reviews.views', 'AddVoteView')
+        self.list_view = self.get_view_class('catalogue.reviews.views', 'ProductReviewList')
 
     def get_urls(self):
         urls = [
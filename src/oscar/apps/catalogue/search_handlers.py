@@ -1,15 +1,27 @@
+import re
+from collections import defaultdict
+from decimal import Decimal
+
 from django.conf import settings
+from django.db.models import (
+    Count, Exists, F, IntegerField, OuterRef, Q, Subquery, TextField)
+from django.db.models.functions import Cast, Coalesce, Floor
 from django.utils.module_loading import import_string
 from django.views.generic.list import MultipleObjectMixin
 
 from oscar.core.loading import get_class, get_classes, get_model
 
 BrowseCategoryForm = get_class('search.forms', 'BrowseCategoryForm')
-SearchResultsPaginationMixin, SearchHandler = get_classes(
+VALID_FACET_QUERIES = get_class('search.forms', 'VALID_FACET_QUERIES')
+SearchHandler, SearchResultsPaginationMixin = get_classes(
     'search.search_handlers', ('SearchHandler', 'SearchResultsPaginationMixin'))
+FacetCountCache, FacetMunger = get_classes('search.facets', ('FacetCountCache', 'FacetMunger'))
 is_solr_supported = get_class('search.features', 'is_solr_supported')
 is_elasticsearch_supported = get_class('search.features', 'is_elasticsearch_supported')
 Product = get_model('catalogue', 'Product')
+ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+ProductCategory = get_model('catalogue', 'ProductCategory')
+StockRecord = get_model('partner', 'StockRecord')
 
 
 def get_product_search_handler_class():
@@ -80,31 +92,207 @@ class ESProductSearchHandler(SearchHandler):
 
 class SimpleProductSearchHandler(SearchResultsPaginationMixin, MultipleObjectMixin):
     """
-    A basic implementation of the full-featured SearchHandler that has no
-    faceting support, but doesn't require a Haystack backend. It only
-    supports category browsing.
+    A database-backed implementation of the full-featured SearchHandler that
+    doesn't require a Haystack backend. It supports category browsing, keyword
+    search on the title, UPC and description, sorting, and the facets
+    configured in ``OSCAR_SEARCH_FACETS``.
+
+    Field facets are resolved with ``facet_lookups``; any other field is taken
+    to be the code of a text, option or integer product attribute. Query facets
+    can be ranges like ``[0 TO 20]``. The facet counts are aggregated with one
+    query per field facet and one for all query facets, cached by
+    ``FacetCountCache`` and passed to the ``FacetMunger`` in the format used
+    by Haystack.
+
+    The price that is faceted on and sorted by (``facet_price``) is the
+    lowest price of the stockrecords of the product, or of its children,
+    across all partners. It isn't necessarily the price the strategy shows,
+    e.g. if the strategy selects another partner's stockrecord, or the price
+    including tax.
 
     Note that is meant as a replacement search handler and not as a view
     mixin; the mixin just does most of what we need it to do.
     """
     paginate_by = settings.OSCAR_PRODUCTS_PER_PAGE
 
+    # Map the facet fields of OSCAR_SEARCH_FACETS to the lookups of the
+    # expressions returned by get_facet_expressions
+    facet_lookups = {
+        'product_class': 'product_class__name',
+        'rating': 'facet_rating',
+        'price': 'facet_price',
+    }
+
+    sort_by_map = {
+        BrowseCategoryForm.TOP_RATED: F('rating').desc(nulls_last=True),
+        BrowseCategoryForm.NEWEST: F('date_created').desc(),
+        BrowseCategoryForm.PRICE_HIGH_TO_LOW: F('facet_price').desc(nulls_last=True),
+        BrowseCategoryForm.PRICE_LOW_TO_HIGH: F('facet_price').asc(nulls_last=True),
+        BrowseCategoryForm.TITLE_A_TO_Z: F('title').asc(),
+        BrowseCategoryForm.TITLE_Z_TO_A: F('title').desc(),
+    }
+
     def __init__(self, request_data, full_path, categories=None):
         self.request_data = request_data
+        self.full_path = full_path
         self.categories = categories
         self.kwargs = {'page': request_data.get('page') or 1}
+        self.selected_multi_facets = self.get_selected_multi_facets()
         self.object_list = self.get_queryset()
 
-    def get_queryset(self):
-        qs = Product.objects.browsable().base_queryset()
+    def get_selected_multi_facets(self):
+        """
+        Validate and return the selected facets as a dict mapping the field
+        names to their values, like ``SearchForm.selected_multi_facets``
+        """
+        selected_multi_facets = defaultdict(list)
+        for facet_kv in self.request_data.getlist('selected_facets'):
+            if ':' not in facet_kv:
+                continue
+            field_name, value = facet_kv.split(':', 1)
+            if field_name in VALID_FACET_QUERIES and value not in VALID_FACET_QUERIES[field_name]:
+                continue
+            if self.get_facet_lookup(field_name[:-len('_exact')]) is not None:
+                selected_multi_facets[field_name].append(value)
+        return selected_multi_facets
+
+    def get_facet_fields(self):
+        fields = [facet['field'] for facet in settings.OSCAR_SEARCH_FACETS['fields'].values()]
+        fields += [facet['field'] for facet in settings.OSCAR_SEARCH_FACETS['queries'].values()]
+        return fields
+
+    def get_facet_lookup(self, field):
+        if field in self.facet_lookups:
+            return self.facet_lookups[field]
+        if field in self.get_facet_fields():
+            return 'facet_attribute_%s' % field
+
+    def get_facet_expressions(self):
+        """
+        Return the annotations needed to filter, count and sort by the facets
+        """
+        prices = StockRecord.objects.filter(
+            Q(product=OuterRef('pk')) | Q(product__parent=OuterRef('pk')), price__isnull=False,
+        ).order_by('price').values('price')[:1]
+        expressions = {
+            'facet_rating': Cast(Floor('rating'), IntegerField()),
+            'facet_price': Subquery(prices),
+        }
+        for field in self.get_facet_fields():
+            if field not in self.facet_lookups:
+                values = ProductAttributeValue.objects.filter(
+                    product=OuterRef('pk'), attribute__code=field,
+                ).annotate(value=Coalesce(
+                    'value_text', 'value_option__option', Cast('value_integer', TextField()),
+                    output_field=TextField(),
+                )).values('value')[:1]
+                expressions[self.get_facet_lookup(field)] = Subquery(values)
+        return expressions
+
+    def get_range_filter(self, lookup, query):
+        """
+        Return a filter for a range query like ``[0 TO 20]``
+        """
+        match = re.match(r'^\[(\S+) TO (\S+)\]$', query)
+        if match is None:
+            return None
+        q = Q(**{'%s__isnull' % lookup: False})
+        start, end = match.groups()
+        if start != '*':
+            q &= Q(**{'%s__gte' % lookup: Decimal(start)})
+        if end != '*':
+            q &= Q(**{'%s__lte' % lookup: Decimal(end)})
+        return q
+
+    def get_filtered_queryset(self):
+        """
+        Return the products matching the categories, keywords and selected
+        facets, without any ordering
+        """
+        qs = Product.objects.browsable()
         if self.categories:
-            qs = qs.filter(categories__in=self.categories).distinct()
+            # Use a subquery rather than a join, which would need a DISTINCT
+            qs = qs.filter(Exists(ProductCategory.objects.filter(
+                product=OuterRef('pk'), category__in=self.categories)))
+        for keyword in self.request_data.get('q', '').split():
+            qs = qs.filter(
+                Q(title__icontains=keyword) | Q(upc__iexact=keyword) | Q(description__icontains=keyword))
+        qs = qs.annotate(**self.get_facet_expressions())
+
+        for field_name, values in self.selected_multi_facets.items():
+            lookup = self.get_facet_lookup(field_name[:-len('_exact')])
+            if field_name in VALID_FACET_QUERIES:
+                q = Q()
+                for value in values:
+                    q |= self.get_range_filter(lookup, value) or Q()
+                qs = qs.filter(q)
+            else:
+                qs = qs.filter(**{'%s__in' % lookup: values})
+        return qs.order_by()
+
+    def get_queryset(self):
+        qs = self.get_filtered_queryset().base_queryset()
+        sort_by = self.sort_by_map.get(self.request_data.get('sort_by'))
+        if sort_by is not None:
+            qs = qs.order_by(sort_by, '-pk')
+        else:
+            qs = qs.order_by(*Product._meta.ordering)
         return qs
 
+    def get_facet_counts(self):
+        """
+        Return the facet counts of the matching products, in the format used
+        by Haystack
+        """
+        qs = self.get_filtered_queryset()
+        cache = FacetCountCache()
+        cache_params = str(qs.query)
+        facet_counts = cache.get(cache_params)
+        if facet_counts is None:
+            facet_counts = {
+                'dates': {},
+                'fields': {
+                    key: self.count_field_facet(qs, self.get_facet_lookup(facet['field']))
+                    for key, facet in settings.OSCAR_SEARCH_FACETS['fields'].items()},
+                'queries': self.count_query_facets(qs),
+            }
+            cache.set(cache_params, facet_counts)
+        return facet_counts
+
+    def count_field_facet(self, qs, lookup):
+        counts = qs.filter(**{'%s__isnull' % lookup: False}).values_list(lookup).annotate(
+            count=Count('pk')).order_by('-count', lookup)
+        return [(str(value), count) for value, count in counts]
+
+    def count_query_facets(self, qs):
+        # Count all query facets with a single query. Generated aliases are
+        # used, as the queries aren't valid SQL column aliases.
+        aggregates, matches = {}, {}
+        for facet in settings.OSCAR_SEARCH_FACETS['queries'].values():
+            lookup = self.get_facet_lookup(facet['field'])
+            for name, query in facet['queries']:
+                q = self.get_range_filter(lookup, query)
+                if q is not None:
+                    alias = 'facet_query_%d' % len(aggregates)
+                    aggregates[alias] = Count('pk', filter=q)
+                    matches[alias] = '%s_exact:%s' % (facet['field'], query)
+        if not aggregates:
+            return {}
+        counts = qs.aggregate(**aggregates)
+        return {matches[alias]: count for alias, count in counts.items()}
+
+    def get_facet_munger(self):
+        return FacetMunger(self.full_path, self.selected_multi_facets, self.get_facet_counts())
+
     def get_search_context_data(self, context_object_name):
         # Set the context_object_name instance property as it's needed
         # internally by MultipleObjectMixin
         self.context_object_name = context_object_name
         context = self.get_context_data(object_list=self.object_list)
         context[context_object_name] = context['page_obj'].object_list
+
+        facet_data = self.get_facet_munger().facet_data()
+        context['facet_data'] = facet_data
+        context['has_facets'] = any(data['results'] for data in facet_data.values())
+        context['selected_facets'] = self.request_data.getlist('selected_facets')
         return context
@@ -1,3 +1,4 @@
 import django.dispatch
 
 product_viewed = django.dispatch.Signal()
+category_moved = django.dispatch.Signal()
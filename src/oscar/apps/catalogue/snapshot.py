@@ -0,0 +1,85 @@
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+
+from oscar.core.cache import VersionedCache
+from oscar.core.loading import get_model
+
+
+class CategoryTreeSnapshot(VersionedCache):
+    """
+    A cache of the annotated category lists rendered by the
+    ``category_tree`` template tag.
+
+    Building the list for a large tree means a full slug and a URL for each
+    category, which is too expensive to do on every page. Lists are cached per
+    language, depth and parent, in the shared cache and in process memory.
+
+    All lists are tagged with a version, which is replaced whenever a
+    category is saved, deleted or moved (see
+    ``oscar.apps.catalogue.receivers``). Lists are then rebuilt when they
+    are next requested.
+    """
+    version_cache_key = 'oscar_category_tree_version'
+    cache_key_template = 'oscar_category_tree_%s'
+
+    # Process-local copies of the lists, mapping cache keys to
+    # (version, annotated list) tuples
+    _local = {}
+
+    def get_cache_key(self, depth=None, parent=None):
+        parent_id = parent.pk if parent is not None else ''
+        return self.cache_key_template % '%s_%s_%s' % (
+            get_language(), '' if depth is None else depth, parent_id)
+
+    def get_annotated_list(self, build, depth=None, parent=None):
+        """
+        Return the annotated list for the given depth and parent, calling
+        ``build(depth, parent)`` if it isn't cached yet.
+
+        The list is shared by all callers, and must not be changed.
+        """
+        version = self.get_version()
+        if version is None:
+            return build(depth, parent)
+
+        cache_key = self.get_cache_key(depth, parent)
+        local = CategoryTreeSnapshot._local.get(cache_key)
+        if local is not None and local[0] == version:
+            return local[1]
+
+        entry = cache.get(cache_key)
+        if entry is None or entry[0] != version:
+            entry = (version, build(depth, parent))
+            cache.set(cache_key, entry, None)
+        CategoryTreeSnapshot._local[cache_key] = entry
+        return entry[1]
+
+    @classmethod
+    def invalidate_urls(cls, categories):
+        """
+        Remove the cached full slugs of the given categories (see
+        ``AbstractCategory.get_full_slug``) in all languages
+        """
+        languages = {code for code, __ in settings.LANGUAGES}
+        languages.add(get_language())
+        cache.delete_many([
+            category.get_url_cache_key(language)
+            for category in categories for language in languages])
+
+    @classmethod
+    def invalidate_subtree(cls, category):
+        """
+        Mark all lists as stale, and remove the cached full slugs of the given
+        category and its descendants
+        """
+        cls.invalidate()
+        Category = get_model('catalogue', 'Category')
+        # The path of the instance is out of date after it has been moved
+        path = Category.objects.filter(pk=category.pk).values_list('path', flat=True).first()
+        if path is None:
+            categories = [category]
+        else:
+            categories = Category.objects.filter(path__startswith=path).only('pk')
+        cls.invalidate_urls(categories)
@@ -119,7 +119,24 @@ class ProductDetailView(DetailView):
             'oscar/%s/detail.html' % self.template_folder]
 
 
-class CatalogueView(TemplateView):
+class PurchaseInfoMixin:
+    """
+    Determine prices and availability for a page of browsed products in one
+    pass, so that the ``purchase_info_for_product`` template tag doesn't have
+    to query the database for every product it renders.
+    """
+
+    def prefetch_purchase_info(self, products):
+        products = [product for product in products if isinstance(product, Product)]
+        strategy = getattr(self.request, 'strategy', None)
+        if strategy is None or not products:
+            return
+        purchase_info_map = getattr(self.request, 'purchase_info_map', {})
+        purchase_info_map.update(strategy.fetch_for_products(products))
+        self.request.purchase_info_map = purchase_info_map
+
+
+class CatalogueView(PurchaseInfoMixin, TemplateView):
     """
     Browse all products in the catalogue
     """
@@ -146,10 +163,11 @@ class CatalogueView(TemplateView):
         search_context = self.search_handler.get_search_context_data(
             self.context_object_name)
         ctx.update(search_context)
+        self.prefetch_purchase_info(ctx[self.context_object_name])
         return ctx
 
 
-class ProductCategoryView(TemplateView):
+class ProductCategoryView(PurchaseInfoMixin, TemplateView):
     """
     Browse products in a given category
     """
@@ -201,7 +219,7 @@ class ProductCategoryView(TemplateView):
         """
         Return a list of the current category and its ancestors
         """
-        return self.category.get_descendants_and_self()
+        return self.category.get_descendants_and_self().annotate_paths()
 
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
@@ -209,4 +227,5 @@ class ProductCategoryView(TemplateView):
         search_context = self.search_handler.get_search_context_data(
             self.context_object_name)
         context.update(search_context)
+        self.prefetch_purchase_info(context[self.context_object_name])
         return context
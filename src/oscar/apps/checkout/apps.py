@@ -4,7 +4,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class CheckoutConfig(OscarConfig):
@@ -15,16 +14,16 @@ class CheckoutConfig(OscarConfig):
     namespace = 'checkout'
 
     def ready(self):
-        self.index_view = get_class('checkout.views', 'IndexView')
-        self.shipping_address_view = get_class('checkout.views', 'ShippingAddressView')
-        self.user_address_update_view = get_class('checkout.views',
-                                                  'UserAddressUpdateView')
-        self.user_address_delete_view = get_class('checkout.views',
-                                                  'UserAddressDeleteView')
-        self.shipping_method_view = get_class('checkout.views', 'ShippingMethodView')
-        self.payment_method_view = get_class('checkout.views', 'PaymentMethodView')
-        self.payment_details_view = get_class('checkout.views', 'PaymentDetailsView')
-        self.thankyou_view = get_class('checkout.views', 'ThankYouView')
+        self.index_view = self.get_view_class('checkout.views', 'IndexView')
+        self.shipping_address_view = self.get_view_class('checkout.views', 'ShippingAddressView')
+        self.user_address_update_view = self.get_view_class('checkout.views',
+                                                            'UserAddressUpdateView')
+        self.user_address_delete_view = self.get_view_class('checkout.views',
+                                                            'UserAddressDeleteView')
+        self.shipping_method_view = self.get_view_class('checkout.views', 'ShippingMethodView')
+        self.payment_method_view = self.get_view_class('checkout.views', 'PaymentMethodView')
+        self.payment_details_view = self.get_view_class('checkout.views', 'PaymentDetailsView')
+        self.thankyou_view = self.get_view_class('checkout.views', 'ThankYouView')
 
     def get_urls(self):
         urls = [
@@ -113,9 +113,10 @@ class AbstractCommunicationEventType(models.Model):
         verbose_name = _("Communication event type")
         verbose_name_plural = _("Communication event types")
 
-    def get_messages(self, ctx=None):
+    def get_templates(self):
         """
-        Return a dict of templates with the context merged in
+        Return a dict of message name to template instance, or ``None`` if
+        there's no template for a message.
 
         We look first at the field templates but fail over to
         a set of file templates that follow a conventional path.
@@ -139,7 +140,20 @@ class AbstractCommunicationEventType(models.Model):
                     templates[name] = get_template(template_name)
                 except TemplateDoesNotExist:
                     templates[name] = None
+        return templates
 
+    def get_messages(self, ctx=None):
+        """
+        Return a dict of templates with the context merged in
+        """
+        return self.render_messages(self.get_templates(), ctx)
+
+    def render_messages(self, templates, ctx=None):
+        """
+        Render the templates returned by ``get_templates`` with the passed
+        context. Senders of many messages can load the templates once and
+        render them for each recipient.
+        """
         # Pass base URL for serving images within HTML emails
         if ctx is None:
             ctx = {}
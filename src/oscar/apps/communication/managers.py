@@ -3,6 +3,16 @@ from django.db import models
 
 class CommunicationTypeManager(models.Manager):
 
+    def get_for_code(self, code):
+        """
+        Return the event type with the passed code, or an unsaved instance
+        that uses the file templates if it doesn't exist in the database.
+        """
+        try:
+            return self.get(code=code)
+        except self.model.DoesNotExist:
+            return self.model(code=code)
+
     def get_and_render(self, code, context):
         """
         Return a dictionary of rendered messages, ready for sending.
@@ -11,8 +21,4 @@ class CommunicationTypeManager(models.Manager):
         in the database.  If not, then an instance is created on the fly and
         used to generate the message contents.
         """
-        try:
-            commtype = self.get(code=code)
-        except self.model.DoesNotExist:
-            commtype = self.model(code=code)
-        return commtype.get_messages(context)
+        return self.get_for_code(code).get_messages(context)
@@ -62,12 +62,13 @@ class Dispatcher(object):
 
     # Internal
 
-    def create_email(self, user, messages, email):
+    def build_email(self, user, messages, email):
         """
-        Create ``Email`` instance in database for logging purposes.
+        Return an unsaved ``Email`` instance for a sent email, or ``None`` if
+        it shouldn't be logged.
         """
         if email and user.is_authenticated:
-            return Email.objects.create(
+            return Email(
                 user=user,
                 email=user.email,
                 subject=email.subject,
@@ -75,6 +76,23 @@ class Dispatcher(object):
                 body_html=messages['html'],
             )
 
+    def create_email(self, user, messages, email):
+        """
+        Create ``Email`` instance in database for logging purposes.
+        """
+        instance = self.build_email(user, messages, email)
+        if instance is not None:
+            instance.save()
+        return instance
+
+    def create_emails(self, sent_emails):
+        """
+        Create ``Email`` instances for a list of ``(user, messages, email)``
+        tuples of sent emails with one query.
+        """
+        instances = [self.build_email(*sent_email) for sent_email in sent_emails]
+        return Email.objects.bulk_create([instance for instance in instances if instance is not None])
+
     def send_user_email_messages(self, user, messages, attachments=None):
         """
         Send message to the registered user / customer and collect data in database.
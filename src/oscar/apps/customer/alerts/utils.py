@@ -1,10 +1,16 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 
-from django.db.models import Max
+from django.conf import settings
+from django.core.mail import get_connection
 from django.template import loader
+from django.utils.timezone import now
 
 from oscar.core.loading import get_class, get_model
 
+CommunicationEventType = get_model('communication', 'CommunicationEventType')
 ProductAlert = get_model('customer', 'ProductAlert')
 Product = get_model('catalogue', 'Product')
 Dispatcher = get_class('communication.utils', 'Dispatcher')
@@ -23,92 +29,250 @@ class AlertsDispatcher:
     PRODUCT_ALERT_EVENT_CODE = 'PRODUCT_ALERT'
     PRODUCT_ALERT_CONFIRMATION_EVENT_CODE = 'PRODUCT_ALERT_CONFIRMATION'
 
-    def __init__(self, logger=None, mail_connection=None):
+    #: Number of products, and of alerts per product, that are processed
+    #: together. The alerts of a batch are closed once their messages are sent.
+    batch_size = 500
+
+    def __init__(self, logger=None, mail_connection=None, workers=1):
         self.dispatcher = Dispatcher(
             logger=logger or alerts_logger,
             mail_connection=mail_connection,
         )
+        # Number of threads sending emails in parallel
+        self.workers = workers
+        self._templates = {}
+        self._pooled = False
+        self._executor = None
+        self._local = threading.local()
+        self._mail_connections = []
+        self._strategies = {}
 
     def get_queryset(self):
         return Product.objects.browsable().filter(productalert__status=ProductAlert.ACTIVE).distinct()
 
-    def send_alerts(self):
+    def send_alerts(self, start_after=None):
         """
         Check all products with active product alerts for
         availability and send out email alerts when a product is
         available to buy.
+
+        Products are processed in order of their id, and the id of each
+        processed product is logged. An interrupted run can be resumed by
+        passing the last logged id as ``start_after``, or simply be started
+        again, as alerts are closed as soon as their messages are sent.
+        """
+        products = self.get_queryset().order_by('pk')
+        if start_after is not None:
+            products = products.filter(pk__gt=start_after)
+        product_ids = list(products.values_list('pk', flat=True))
+        self.dispatcher.logger.info("Found %d products with active alerts", len(product_ids))
+
+        with self.mail_connections():
+            for i in range(0, len(product_ids), self.batch_size):
+                batch = Product.objects.filter(
+                    pk__in=product_ids[i:i + self.batch_size],
+                ).select_related('product_class').prefetch_related('stockrecords').order_by('pk')
+                for product in batch:
+                    self.send_product_alert_email_for_user(product)
+                    self.dispatcher.logger.info("Processed alerts for product #%d", product.pk)
+
+    @contextmanager
+    def mail_connections(self):
+        """
+        Reuse mail connections, worker threads and loaded templates for all
+        alerts sent within the block. Connections are only opened once there
+        are messages to send.
+        """
+        if self._pooled:
+            yield
+            return
+
+        self._pooled = True
+        mail_connection = self.dispatcher.mail_connection
+        try:
+            yield
+        finally:
+            self._pooled = False
+            if self._executor is not None:
+                self._executor.shutdown()
+                self._executor = None
+            self.dispatcher.mail_connection = mail_connection
+            for connection in self._mail_connections:
+                connection.close()
+            self._mail_connections = []
+            self._local = threading.local()
+            self._templates = {}
+            self._strategies = {}
+
+    def open_mail_connection(self):
+        connection = get_connection()
+        connection.open()
+        self._mail_connections.append(connection)
+        return connection
+
+    def get_thread_dispatcher(self):
+        """
+        Return a dispatcher with its own mail connection for the current
+        worker thread.
+        """
+        dispatcher = getattr(self._local, 'dispatcher', None)
+        if dispatcher is None:
+            dispatcher = self._local.dispatcher = Dispatcher(
+                logger=self.dispatcher.logger, mail_connection=self.open_mail_connection())
+        return dispatcher
+
+    def get_strategy(self, user):
+        """
+        Return the strategy of a user, or of anonymous users if ``user`` is
+        ``None``. Strategies are only created once per user and run.
         """
-        products = self.get_queryset()
-        self.dispatcher.logger.info("Found %d products with active alerts", products.count())
-        for product in products:
-            self.send_product_alert_email_for_user(product)
+        key = user.pk if user else None
+        if key not in self._strategies:
+            self._strategies[key] = Selector().strategy(user=user)
+        return self._strategies[key]
 
-    def send_product_alert_email_for_user(self, product):  # noqa: C901 too complex
+    def get_template(self, template_name):
+        if template_name not in self._templates:
+            self._templates[template_name] = loader.get_template(template_name)
+        return self._templates[template_name]
+
+    def get_alert_messages(self, extra_context):
+        """
+        Render the alert messages, loading the templates only once per run
+        """
+        if self.PRODUCT_ALERT_EVENT_CODE not in self._templates:
+            event_type = CommunicationEventType.objects.get_for_code(self.PRODUCT_ALERT_EVENT_CODE)
+            self._templates[self.PRODUCT_ALERT_EVENT_CODE] = (event_type, event_type.get_templates())
+        event_type, templates = self._templates[self.PRODUCT_ALERT_EVENT_CODE]
+        context = self.dispatcher.get_base_context(**extra_context)
+        return event_type.render_messages(templates, context)
+
+    def send_product_alert_email_for_user(self, product):
         """
         Check for notifications for this product and send email to users
         if the product is back in stock. Add a little 'hurry' note if the
         amount of in-stock items is less then the number of notifications.
+
+        Alerts are processed in batches of ``batch_size``; the alerts of a
+        batch are closed with one query after their messages are sent.
         """
         stockrecords = product.stockrecords.all()
-        num_stockrecords = len(stockrecords)
-        if not num_stockrecords:
+        if not stockrecords:
             return
 
         self.dispatcher.logger.info("Sending alerts for '%s'", product)
         alerts = ProductAlert.objects.filter(
             product_id__in=(product.id, product.parent_id),
             status=ProductAlert.ACTIVE,
-        )
+        ).select_related('user').order_by('pk')
 
         # Determine 'hurry mode'
-        if num_stockrecords == 1:
-            num_in_stock = stockrecords[0].num_in_stock
-        else:
-            result = stockrecords.aggregate(max_in_stock=Max('num_in_stock'))
-            num_in_stock = result['max_in_stock']
+        stock_levels = [stockrecord.num_in_stock for stockrecord in stockrecords
+                        if stockrecord.num_in_stock is not None]
+        num_in_stock = max(stock_levels) if stock_levels else None
 
         # 'hurry_mode' is false if 'num_in_stock' is None
         hurry_mode = num_in_stock is not None and alerts.count() > num_in_stock
 
-        messages_to_send = []
-        user_messages_to_send = []
-        num_notifications = 0
-        selector = Selector()
-        for alert in alerts:
-            # Check if the product is available to this user
-            strategy = selector.strategy(user=alert.user)
-            data = strategy.fetch_for_product(product)
-            if not data.availability.is_available_to_buy:
-                continue
-
-            extra_context = {
-                'alert': alert,
-                'hurry': hurry_mode,
-            }
-            if alert.user:
-                # Send a site notification
-                num_notifications += 1
-                self.notify_user_about_product_alert(alert.user, extra_context)
+        num_notifications = num_messages = 0
+        # Whether the product is available, by the id of the alert's user
+        availability = {}
+        last_pk = 0
+        with self.mail_connections():
+            while True:
+                batch = list(alerts.filter(pk__gt=last_pk)[:self.batch_size])
+                if not batch:
+                    break
+                last_pk = batch[-1].pk
+
+                alert_messages = []
+                closed_alerts = []
+                for alert in batch:
+                    # Check if the product is available to this user. It's
+                    # only checked once for all anonymous alerts, and once
+                    # for each user.
+                    if alert.user_id not in availability:
+                        info = self.get_strategy(alert.user).fetch_for_product(product)
+                        availability[alert.user_id] = info.availability.is_available_to_buy
+                    if not availability[alert.user_id]:
+                        continue
+
+                    extra_context = {
+                        'alert': alert,
+                        'hurry': hurry_mode,
+                    }
+                    if alert.user:
+                        # Send a site notification
+                        num_notifications += 1
+                        self.notify_user_about_product_alert(alert.user, extra_context)
+
+                    messages = self.get_alert_messages(extra_context)
+                    if messages and messages['body']:
+                        alert_messages.append((alert, messages))
+                    closed_alerts.append(alert.pk)
+
+                self.send_alert_messages(alert_messages)
+                num_messages += len(alert_messages)
+                ProductAlert.objects.filter(pk__in=closed_alerts).update(
+                    status=ProductAlert.CLOSED, date_closed=now())
+
+        self.dispatcher.logger.info(
+            "Sent %d notifications and %d messages", num_notifications, num_messages)
+
+    def send_alert_messages(self, alert_messages):
+        """
+        Send the messages of a batch of alerts, passed as a list of
+        ``(alert, messages)`` tuples.
 
-            messages = self.dispatcher.get_messages(self.PRODUCT_ALERT_EVENT_CODE, extra_context)
+        With more than one worker, the emails are sent in parallel threads,
+        and the emails sent to users are then saved with one query.
+        """
+        if not alert_messages:
+            return
+
+        with self.mail_connections():
+            if self.workers > 1:
+                self.send_alert_messages_in_threads(alert_messages)
+                return
 
-            if messages and messages['body']:
+            if self.dispatcher.mail_connection is None:
+                self.dispatcher.mail_connection = self.open_mail_connection()
+            for alert, messages in alert_messages:
                 if alert.user:
-                    user_messages_to_send.append((alert.user, messages))
+                    self.dispatcher.dispatch_user_messages(alert.user, messages)
                 else:
-                    messages_to_send.append((alert.get_email_address(), messages))
-            alert.close()
+                    self.dispatcher.dispatch_direct_messages(alert.get_email_address(), messages)
 
-        if messages_to_send or user_messages_to_send:
-            for message in messages_to_send:
-                self.dispatcher.dispatch_direct_messages(*message)
-            for message in user_messages_to_send:
-                self.dispatcher.dispatch_user_messages(*message)
+    def send_alert_messages_in_threads(self, alert_messages):
+        """
+        Send the emails of a batch of alerts in parallel threads. The text
+        messages are sent, and the emails sent to users are saved, in the
+        calling thread.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self.workers)
+        emails = self._executor.map(self.send_alert_email, alert_messages)
+        sent_emails = []
+        for (alert, messages), email in zip(alert_messages, emails):
+            if alert.user:
+                if messages['sms']:
+                    self.dispatcher.send_text_message(alert.user, messages['sms'])
+                sent_emails.append((alert.user, messages, email))
+        if settings.OSCAR_SAVE_SENT_EMAILS_TO_DB:
+            self.dispatcher.create_emails(sent_emails)
 
-        self.dispatcher.logger.info(
-            "Sent %d notifications and %d messages",
-            num_notifications, len(messages_to_send) + len(user_messages_to_send)
-        )
+    def send_alert_email(self, alert_messages):
+        """
+        Send the email of an alert from a worker thread. This doesn't touch
+        the database.
+        """
+        alert, messages = alert_messages
+        email_address = alert.get_email_address()
+        if not email_address:
+            self.dispatcher.logger.warning("Unable to send alert #%d as it has no email address", alert.pk)
+            return None
+        dispatcher = self.get_thread_dispatcher()
+        return dispatcher.dispatch_direct_messages(email_address, messages)
 
     def send_product_alert_confirmation_email_for_user(self, alert, extra_context=None):
         """
@@ -120,8 +284,8 @@ class AlertsDispatcher:
         self.dispatcher.dispatch_direct_messages(alert.email, messages)
 
     def notify_user_about_product_alert(self, user, context):
-        subj_tpl = loader.get_template('oscar/customer/alerts/message_subject.html')
-        message_tpl = loader.get_template('oscar/customer/alerts/message.html')
+        subj_tpl = self.get_template('oscar/customer/alerts/message_subject.html')
+        message_tpl = self.get_template('oscar/customer/alerts/message.html')
         self.dispatcher.notify_user(
             user,
             subj_tpl.render(context).strip(),
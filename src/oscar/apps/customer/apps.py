@@ -4,7 +4,6 @@ from django.utils.translation import gettext_lazy as _
 from django.views import generic
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class CustomerConfig(OscarConfig):
@@ -18,65 +17,65 @@ class CustomerConfig(OscarConfig):
         from . import receivers  # noqa
         from .alerts import receivers  # noqa
 
-        self.summary_view = get_class('customer.views', 'AccountSummaryView')
-        self.order_history_view = get_class('customer.views', 'OrderHistoryView')
-        self.order_detail_view = get_class('customer.views', 'OrderDetailView')
-        self.anon_order_detail_view = get_class('customer.views',
-                                                'AnonymousOrderDetailView')
-        self.order_line_view = get_class('customer.views', 'OrderLineView')
-
-        self.address_list_view = get_class('customer.views', 'AddressListView')
-        self.address_create_view = get_class('customer.views', 'AddressCreateView')
-        self.address_update_view = get_class('customer.views', 'AddressUpdateView')
-        self.address_delete_view = get_class('customer.views', 'AddressDeleteView')
-        self.address_change_status_view = get_class('customer.views',
-                                                    'AddressChangeStatusView')
-
-        self.email_list_view = get_class('customer.views', 'EmailHistoryView')
-        self.email_detail_view = get_class('customer.views', 'EmailDetailView')
-        self.login_view = get_class('customer.views', 'AccountAuthView')
-        self.logout_view = get_class('customer.views', 'LogoutView')
-        self.register_view = get_class('customer.views', 'AccountRegistrationView')
-        self.profile_view = get_class('customer.views', 'ProfileView')
-        self.profile_update_view = get_class('customer.views', 'ProfileUpdateView')
-        self.profile_delete_view = get_class('customer.views', 'ProfileDeleteView')
-        self.change_password_view = get_class('customer.views', 'ChangePasswordView')
-
-        self.notification_inbox_view = get_class('communication.notifications.views',
-                                                 'InboxView')
-        self.notification_archive_view = get_class('communication.notifications.views',
-                                                   'ArchiveView')
-        self.notification_update_view = get_class('communication.notifications.views',
-                                                  'UpdateView')
-        self.notification_detail_view = get_class('communication.notifications.views',
-                                                  'DetailView')
-
-        self.alert_list_view = get_class('customer.alerts.views',
-                                         'ProductAlertListView')
-        self.alert_create_view = get_class('customer.alerts.views',
-                                           'ProductAlertCreateView')
-        self.alert_confirm_view = get_class('customer.alerts.views',
-                                            'ProductAlertConfirmView')
-        self.alert_cancel_view = get_class('customer.alerts.views',
-                                           'ProductAlertCancelView')
-
-        self.wishlists_add_product_view = get_class('customer.wishlists.views',
-                                                    'WishListAddProduct')
-        self.wishlists_list_view = get_class('customer.wishlists.views',
-                                             'WishListListView')
-        self.wishlists_detail_view = get_class('customer.wishlists.views',
-                                               'WishListDetailView')
-        self.wishlists_create_view = get_class('customer.wishlists.views',
-                                               'WishListCreateView')
-        self.wishlists_create_with_product_view = get_class('customer.wishlists.views',
-                                                            'WishListCreateView')
-        self.wishlists_update_view = get_class('customer.wishlists.views',
-                                               'WishListUpdateView')
-        self.wishlists_delete_view = get_class('customer.wishlists.views',
-                                               'WishListDeleteView')
-        self.wishlists_remove_product_view = get_class('customer.wishlists.views',
-                                                       'WishListRemoveProduct')
-        self.wishlists_move_product_to_another_view = get_class(
+        self.summary_view = self.get_view_class('customer.views', 'AccountSummaryView')
+        self.order_history_view = self.get_view_class('customer.views', 'OrderHistoryView')
+        self.order_detail_view = self.get_view_class('customer.views', 'OrderDetailView')
+        self.anon_order_detail_view = self.get_view_class('customer.views',
+                                                          'AnonymousOrderDetailView')
+        self.order_line_view = self.get_view_class('customer.views', 'OrderLineView')
+
+        self.address_list_view = self.get_view_class('customer.views', 'AddressListView')
+        self.address_create_view = self.get_view_class('customer.views', 'AddressCreateView')
+        self.address_update_view = self.get_view_class('customer.views', 'AddressUpdateView')
+        self.address_delete_view = self.get_view_class('customer.views', 'AddressDeleteView')
+        self.address_change_status_view = self.get_view_class('customer.views',
+                                                              'AddressChangeStatusView')
+
+        self.email_list_view = self.get_view_class('customer.views', 'EmailHistoryView')
+        self.email_detail_view = self.get_view_class('customer.views', 'EmailDetailView')
+        self.login_view = self.get_view_class('customer.views', 'AccountAuthView')
+        self.logout_view = self.get_view_class('customer.views', 'LogoutView')
+        self.register_view = self.get_view_class('customer.views', 'AccountRegistrationView')
+        self.profile_view = self.get_view_class('customer.views', 'ProfileView')
+        self.profile_update_view = self.get_view_class('customer.views', 'ProfileUpdateView')
+        self.profile_delete_view = self.get_view_class('customer.views', 'ProfileDeleteView')
+        self.change_password_view = self.get_view_class('customer.views', 'ChangePasswordView')
+
+        self.notification_inbox_view = self.get_view_class('communication.notifications.views',
+                                                           'InboxView')
+        self.notification_archive_view = self.get_view_class('communication.notifications.views',
+                                                             'ArchiveView')
+        self.notification_update_view = self.get_view_class('communication.notifications.views',
+                                                            'UpdateView')
+        self.notification_detail_view = self.get_view_class('communication.notifications.views',
+                                                            'DetailView')
+
+        self.alert_list_view = self.get_view_class('customer.alerts.views',
+                                                   'ProductAlertListView')
+        self.alert_create_view = self.get_view_class('customer.alerts.views',
+                                                     'ProductAlertCreateView')
+        self.alert_confirm_view = self.get_view_class('customer.alerts.views',
+                                                      'ProductAlertConfirmView')
+        self.alert_cancel_view = self.get_view_class('customer.alerts.views',
+                                                     'ProductAlertCancelView')
+
+        self.wishlists_add_product_view = self.get_view_class('customer.wishlists.views',
+                                                              'WishListAddProduct')
+        self.wishlists_list_view = self.get_view_class('customer.wishlists.views',
+                                                       'WishListListView')
+        self.wishlists_detail_view = self.get_view_class('customer.wishlists.views',
+                                                         'WishListDetailView')
+        self.wishlists_create_view = self.get_view_class('customer.wishlists.views',
+                                                         'WishListCreateView')
+        self.wishlists_create_with_product_view = self.get_view_class('customer.wishlists.views',
+                                                                      'WishListCreateView')
+        self.wishlists_update_view = self.get_view_class('customer.wishlists.views',
+                                                         'WishListUpdateView')
+        self.wishlists_delete_view = self.get_view_class('customer.wishlists.views',
+                                                         'WishListDeleteView')
+        self.wishlists_remove_product_view = self.get_view_class('customer.wishlists.views',
+                                                                 'WishListRemoveProduct')
+        self.wishlists_move_product_to_another_view = self.get_view_class(
             'customer.wishlists.views', 'WishListMoveProductToAnotherWishList')
 
     def get_urls(self):
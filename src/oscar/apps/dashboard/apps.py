@@ -3,7 +3,6 @@ from django.urls import include, path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class DashboardConfig(OscarDashboardConfig):
@@ -17,8 +16,8 @@ class DashboardConfig(OscarDashboardConfig):
     }
 
     def ready(self):
-        self.index_view = get_class('dashboard.views', 'IndexView')
-        self.login_view = get_class('dashboard.views', 'LoginView')
+        self.index_view = self.get_view_class('dashboard.views', 'IndexView')
+        self.login_view = self.get_view_class('dashboard.views', 'LoginView')
 
         self.catalogue_app = apps.get_app_config('catalogue_dashboard')
         self.reports_app = apps.get_app_config('reports_dashboard')
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class CatalogueDashboardConfig(OscarDashboardConfig):
@@ -23,53 +22,53 @@ class CatalogueDashboardConfig(OscarDashboardConfig):
     }
 
     def ready(self):
-        self.product_list_view = get_class('dashboard.catalogue.views',
-                                           'ProductListView')
-        self.product_lookup_view = get_class('dashboard.catalogue.views',
-                                             'ProductLookupView')
-        self.product_create_redirect_view = get_class('dashboard.catalogue.views',
-                                                      'ProductCreateRedirectView')
-        self.product_createupdate_view = get_class('dashboard.catalogue.views',
-                                                   'ProductCreateUpdateView')
-        self.product_delete_view = get_class('dashboard.catalogue.views',
-                                             'ProductDeleteView')
+        self.product_list_view = self.get_view_class('dashboard.catalogue.views',
+                                                     'ProductListView')
+        self.product_lookup_view = self.get_view_class('dashboard.catalogue.views',
+                                                       'ProductLookupView')
+        self.product_create_redirect_view = self.get_view_class('dashboard.catalogue.views',
+                                                                'ProductCreateRedirectView')
+        self.product_createupdate_view = self.get_view_class('dashboard.catalogue.views',
+                                                             'ProductCreateUpdateView')
+        self.product_delete_view = self.get_view_class('dashboard.catalogue.views',
+                                                       'ProductDeleteView')
 
-        self.product_class_create_view = get_class('dashboard.catalogue.views',
-                                                   'ProductClassCreateView')
-        self.product_class_update_view = get_class('dashboard.catalogue.views',
-                                                   'ProductClassUpdateView')
-        self.product_class_list_view = get_class('dashboard.catalogue.views',
-                                                 'ProductClassListView')
-        self.product_class_delete_view = get_class('dashboard.catalogue.views',
-                                                   'ProductClassDeleteView')
+        self.product_class_create_view = self.get_view_class('dashboard.catalogue.views',
+                                                             'ProductClassCreateView')
+        self.product_class_update_view = self.get_view_class('dashboard.catalogue.views',
+                                                             'ProductClassUpdateView')
+        self.product_class_list_view = self.get_view_class('dashboard.catalogue.views',
+                                                           'ProductClassListView')
+        self.product_class_delete_view = self.get_view_class('dashboard.catalogue.views',
+                                                             'ProductClassDeleteView')
 
-        self.category_list_view = get_class('dashboard.catalogue.views',
-                                            'CategoryListView')
-        self.category_detail_list_view = get_class('dashboard.catalogue.views',
-                                                   'CategoryDetailListView')
-        self.category_create_view = get_class('dashboard.catalogue.views',
-                                              'CategoryCreateView')
-        self.category_update_view = get_class('dashboard.catalogue.views',
-                                              'CategoryUpdateView')
-        self.category_delete_view = get_class('dashboard.catalogue.views',
-                                              'CategoryDeleteView')
+        self.category_list_view = self.get_view_class('dashboard.catalogue.views',
+                                                      'CategoryListView')
+        self.category_detail_list_view = self.get_view_class('dashboard.catalogue.views',
+                                                             'CategoryDetailListView')
+        self.category_create_view = self.get_view_class('dashboard.catalogue.views',
+                                                        'CategoryCreateView')
+        self.category_update_view = self.get_view_class('dashboard.catalogue.views',
+                                                        'CategoryUpdateView')
+        self.category_delete_view = self.get_view_class('dashboard.catalogue.views',
+                                                        'CategoryDeleteView')
 
-        self.stock_alert_view = get_class('dashboard.catalogue.views',
-                                          'StockAlertListView')
+        self.stock_alert_view = self.get_view_class('dashboard.catalogue.views',
+                                                    'StockAlertListView')
 
-        self.attribute_option_group_create_view = get_class('dashboard.catalogue.views',
-                                                            'AttributeOptionGroupCreateView')
-        self.attribute_option_group_list_view = get_class('dashboard.catalogue.views',
-                                                          'AttributeOptionGroupListView')
-        self.attribute_option_group_update_view = get_class('dashboard.catalogue.views',
-                                                            'AttributeOptionGroupUpdateView')
-        self.attribute_option_group_delete_view = get_class('dashboard.catalogue.views',
-                                                            'AttributeOptionGroupDeleteView')
+        self.attribute_option_group_create_view = self.get_view_class('dashboard.catalogue.views',
+                                                                      'AttributeOptionGroupCreateView')
+        self.attribute_option_group_list_view = self.get_view_class('dashboard.catalogue.views',
+                                                                    'AttributeOptionGroupListView')
+        self.attribute_option_group_update_view = self.get_view_class('dashboard.catalogue.views',
+                                                                      'AttributeOptionGroupUpdateView')
+        self.attribute_option_group_delete_view = self.get_view_class('dashboard.catalogue.views',
+                                                                      'AttributeOptionGroupDeleteView')
 
-        self.option_list_view = get_class('dashboard.catalogue.views', 'OptionListView')
-        self.option_create_view = get_class('dashboard.catalogue.views', 'OptionCreateView')
-        self.option_update_view = get_class('dashboard.catalogue.views', 'OptionUpdateView')
-        self.option_delete_view = get_class('dashboard.catalogue.views', 'OptionDeleteView')
+        self.option_list_view = self.get_view_class('dashboard.catalogue.views', 'OptionListView')
+        self.option_create_view = self.get_view_class('dashboard.catalogue.views', 'OptionCreateView')
+        self.option_update_view = self.get_view_class('dashboard.catalogue.views', 'OptionUpdateView')
+        self.option_delete_view = self.get_view_class('dashboard.catalogue.views', 'OptionDeleteView')
 
     def get_urls(self):
         urls = [
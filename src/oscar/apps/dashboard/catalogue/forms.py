@@ -323,6 +323,11 @@ class ProductCategoryForm(forms.ModelForm):
         model = ProductCategory
         fields = ('category', )
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Categories are labelled with their full names
+        self.fields['category'].queryset = Category.objects.annotate_paths()
+
 
 class ProductImageForm(forms.ModelForm):
 
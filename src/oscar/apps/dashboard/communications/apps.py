@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class CommunicationsDashboardConfig(OscarDashboardConfig):
@@ -13,8 +12,8 @@ class CommunicationsDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.communications.views', 'ListView')
-        self.update_view = get_class('dashboard.communications.views', 'UpdateView')
+        self.list_view = self.get_view_class('dashboard.communications.views', 'ListView')
+        self.update_view = self.get_view_class('dashboard.communications.views', 'UpdateView')
 
     def get_urls(self):
         urls = [
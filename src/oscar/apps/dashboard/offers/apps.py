@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class OffersDashboardConfig(OscarDashboardConfig):
@@ -13,14 +12,14 @@ class OffersDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.offers.views', 'OfferListView')
-        self.metadata_view = get_class('dashboard.offers.views', 'OfferMetaDataView')
-        self.condition_view = get_class('dashboard.offers.views', 'OfferConditionView')
-        self.benefit_view = get_class('dashboard.offers.views', 'OfferBenefitView')
-        self.restrictions_view = get_class('dashboard.offers.views',
-                                           'OfferRestrictionsView')
-        self.delete_view = get_class('dashboard.offers.views', 'OfferDeleteView')
-        self.detail_view = get_class('dashboard.offers.views', 'OfferDetailView')
+        self.list_view = self.get_view_class('dashboard.offers.views', 'OfferListView')
+        self.metadata_view = self.get_view_class('dashboard.offers.views', 'OfferMetaDataView')
+        self.condition_view = self.get_view_class('dashboard.offers.views', 'OfferConditionView')
+        self.benefit_view = self.get_view_class('dashboard.offers.views', 'OfferBenefitView')
+        self.restrictions_view = self.get_view_class('dashboard.offers.views',
+                                                     'OfferRestrictionsView')
+        self.delete_view = self.get_view_class('dashboard.offers.views', 'OfferDeleteView')
+        self.detail_view = self.get_view_class('dashboard.offers.views', 'OfferDetailView')
 
     def get_urls(self):
         urls = [
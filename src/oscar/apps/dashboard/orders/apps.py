@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class OrdersDashboardConfig(OscarDashboardConfig):
@@ -21,12 +20,12 @@ class OrdersDashboardConfig(OscarDashboardConfig):
     }
 
     def ready(self):
-        self.order_list_view = get_class('dashboard.orders.views', 'OrderListView')
-        self.order_detail_view = get_class('dashboard.orders.views', 'OrderDetailView')
-        self.shipping_address_view = get_class('dashboard.orders.views',
-                                               'ShippingAddressUpdateView')
-        self.line_detail_view = get_class('dashboard.orders.views', 'LineDetailView')
-        self.order_stats_view = get_class('dashboard.orders.views', 'OrderStatsView')
+        self.order_list_view = self.get_view_class('dashboard.orders.views', 'OrderListView')
+        self.order_detail_view = self.get_view_class('dashboard.orders.views', 'OrderDetailView')
+        self.shipping_address_view = self.get_view_class('dashboard.orders.views',
+                                                         'ShippingAddressUpdateView')
+        self.line_detail_view = self.get_view_class('dashboard.orders.views', 'LineDetailView')
+        self.order_stats_view = self.get_view_class('dashboard.orders.views', 'OrderStatsView')
 
     def get_urls(self):
         urls = [
@@ -5,8 +5,8 @@ from decimal import InvalidOperation
 from django.conf import settings
 from django.contrib import messages
 from django.core.exceptions import ObjectDoesNotExist
-from django.db.models import Count, Q, Sum, fields
-from django.http import Http404, HttpResponse, HttpResponseRedirect
+from django.db.models import Count, Q, QuerySet, Sum, fields
+from django.http import Http404, HttpResponseRedirect
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse
 from django.utils.translation import gettext_lazy as _
@@ -14,7 +14,7 @@ from django.views.generic import DetailView, FormView, ListView, UpdateView
 
 from oscar.apps.order import exceptions as order_exceptions
 from oscar.apps.payment.exceptions import PaymentError
-from oscar.core.compat import UnicodeCSVWriter
+from oscar.core.csv_utils import StreamingCSVResponse, iterate_in_chunks
 from oscar.core.loading import get_class, get_model
 from oscar.core.utils import datetime_combine, format_datetime
 from oscar.views import sort_queryset
@@ -117,14 +117,14 @@ class OrderListView(EventHandlerMixin, BulkEditMixin, ListView):
     paginate_by = settings.OSCAR_DASHBOARD_ITEMS_PER_PAGE
     actions = ('download_selected_orders', 'change_order_statuses')
     CSV_COLUMNS = {
-        'number', _('Order number'),
-        'value', _('Order value'),
-        'date', _('Date of purchase'),
-        'num_items', _('Number of items'),
-        'status', _('Order status'),
-        'customer', _('Customer email address'),
-        'shipping_address_name', _('Deliver to name'),
-        'billing_address_name', _('Bill to name'),
+        'number': _('Order number'),
+        'value': _('Order value'),
+        'date': _('Date of purchase'),
+        'num_items': _('Number of items'),
+        'status': _('Order status'),
+        'customer': _('Customer email address'),
+        'shipping_address_name': _('Deliver to name'),
+        'billing_address_name': _('Bill to name'),
     }
 
     def dispatch(self, request, *args, **kwargs):
@@ -376,16 +376,17 @@ class OrderListView(EventHandlerMixin, BulkEditMixin, ListView):
         return row
 
     def download_selected_orders(self, request, orders):
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename=%s' \
-            % self.get_download_filename(request)
-        writer = UnicodeCSVWriter(open_file=response)
-
-        writer.writerow(self.CSV_COLUMNS.values())
+        if isinstance(orders, QuerySet):
+            orders = iterate_in_chunks(
+                orders.select_related('shipping_address', 'billing_address'))
+        return StreamingCSVResponse(
+            self.get_csv_rows(orders), self.get_download_filename(request))
+
+    def get_csv_rows(self, orders):
+        yield self.CSV_COLUMNS.values()
         for order in orders:
             row_values = self.get_row_values(order)
-            writer.writerow([row_values.get(column, "") for column in self.CSV_COLUMNS])
-        return response
+            yield [row_values.get(column, "") for column in self.CSV_COLUMNS]
 
     def change_order_statuses(self, request, orders):
         for order in orders:
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class PagesDashboardConfig(OscarDashboardConfig):
@@ -13,10 +12,10 @@ class PagesDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.pages.views', 'PageListView')
-        self.create_view = get_class('dashboard.pages.views', 'PageCreateView')
-        self.update_view = get_class('dashboard.pages.views', 'PageUpdateView')
-        self.delete_view = get_class('dashboard.pages.views', 'PageDeleteView')
+        self.list_view = self.get_view_class('dashboard.pages.views', 'PageListView')
+        self.create_view = self.get_view_class('dashboard.pages.views', 'PageCreateView')
+        self.update_view = self.get_view_class('dashboard.pages.views', 'PageUpdateView')
+        self.delete_view = self.get_view_class('dashboard.pages.views', 'PageDeleteView')
 
     def get_urls(self):
         """
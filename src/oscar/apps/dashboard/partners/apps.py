@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class PartnersDashboardConfig(OscarDashboardConfig):
@@ -13,21 +12,21 @@ class PartnersDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.partners.views', 'PartnerListView')
-        self.create_view = get_class('dashboard.partners.views', 'PartnerCreateView')
-        self.manage_view = get_class('dashboard.partners.views', 'PartnerManageView')
-        self.delete_view = get_class('dashboard.partners.views', 'PartnerDeleteView')
-
-        self.user_link_view = get_class('dashboard.partners.views',
-                                        'PartnerUserLinkView')
-        self.user_unlink_view = get_class('dashboard.partners.views',
-                                          'PartnerUserUnlinkView')
-        self.user_create_view = get_class('dashboard.partners.views',
-                                          'PartnerUserCreateView')
-        self.user_select_view = get_class('dashboard.partners.views',
-                                          'PartnerUserSelectView')
-        self.user_update_view = get_class('dashboard.partners.views',
-                                          'PartnerUserUpdateView')
+        self.list_view = self.get_view_class('dashboard.partners.views', 'PartnerListView')
+        self.create_view = self.get_view_class('dashboard.partners.views', 'PartnerCreateView')
+        self.manage_view = self.get_view_class('dashboard.partners.views', 'PartnerManageView')
+        self.delete_view = self.get_view_class('dashboard.partners.views', 'PartnerDeleteView')
+
+        self.user_link_view = self.get_view_class('dashboard.partners.views',
+                                                  'PartnerUserLinkView')
+        self.user_unlink_view = self.get_view_class('dashboard.partners.views',
+                                                    'PartnerUserUnlinkView')
+        self.user_create_view = self.get_view_class('dashboard.partners.views',
+                                                    'PartnerUserCreateView')
+        self.user_select_view = self.get_view_class('dashboard.partners.views',
+                                                    'PartnerUserSelectView')
+        self.user_update_view = self.get_view_class('dashboard.partners.views',
+                                                    'PartnerUserUpdateView')
 
     def get_urls(self):
         urls = [
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class RangesDashboardConfig(OscarDashboardConfig):
@@ -13,12 +12,12 @@ class RangesDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.ranges.views', 'RangeListView')
-        self.create_view = get_class('dashboard.ranges.views', 'RangeCreateView')
-        self.update_view = get_class('dashboard.ranges.views', 'RangeUpdateView')
-        self.delete_view = get_class('dashboard.ranges.views', 'RangeDeleteView')
-        self.products_view = get_class('dashboard.ranges.views', 'RangeProductListView')
-        self.reorder_view = get_class('dashboard.ranges.views', 'RangeReorderView')
+        self.list_view = self.get_view_class('dashboard.ranges.views', 'RangeListView')
+        self.create_view = self.get_view_class('dashboard.ranges.views', 'RangeCreateView')
+        self.update_view = self.get_view_class('dashboard.ranges.views', 'RangeUpdateView')
+        self.delete_view = self.get_view_class('dashboard.ranges.views', 'RangeDeleteView')
+        self.products_view = self.get_view_class('dashboard.ranges.views', 'RangeProductListView')
+        self.reorder_view = self.get_view_class('dashboard.ranges.views', 'RangeReorderView')
 
     def get_urls(self):
         urlpatterns = [
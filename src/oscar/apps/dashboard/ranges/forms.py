@@ -6,6 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from oscar.core.loading import get_model
 
+Category = get_model('catalogue', 'Category')
 Product = get_model('catalogue', 'Product')
 Range = get_model('offer', 'Range')
 
@@ -21,6 +22,11 @@ class RangeForm(forms.ModelForm):
             'includes_all_products', 'included_categories'
         ]
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Categories are labelled with their full names
+        self.fields['included_categories'].queryset = Category.objects.annotate_paths()
+
 
 class RangeProductForm(forms.Form):
     query = forms.CharField(
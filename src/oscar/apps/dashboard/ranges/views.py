@@ -13,7 +13,7 @@ from django.utils.translation import ngettext
 from django.views.generic import (
     CreateView, DeleteView, ListView, UpdateView, View)
 
-from oscar.core.loading import get_classes, get_model
+from oscar.core.loading import get_class, get_classes, get_model
 from oscar.views.generic import BulkEditMixin
 
 Range = get_model('offer', 'Range')
@@ -22,6 +22,7 @@ RangeProductFileUpload = get_model('offer', 'RangeProductFileUpload')
 Product = get_model('catalogue', 'Product')
 RangeForm, RangeProductForm = get_classes('dashboard.ranges.forms',
                                           ['RangeForm', 'RangeProductForm'])
+RangeMembershipIndex = get_class('offer.membership', 'RangeMembershipIndex')
 
 
 class RangeListView(ListView):
@@ -30,6 +31,12 @@ class RangeListView(ListView):
     template_name = 'oscar/dashboard/ranges/range_list.html'
     paginate_by = settings.OSCAR_DASHBOARD_ITEMS_PER_PAGE
 
+    def get_context_data(self, **kwargs):
+        ctx = super().get_context_data(**kwargs)
+        # Load the product counts of the whole page in one go
+        RangeMembershipIndex.load_many(ctx['ranges'])
+        return ctx
+
 
 class RangeCreateView(CreateView):
     model = Range
@@ -179,6 +186,11 @@ class RangeProductListView(BulkEditMixin, ListView):
             return
         f = request.FILES['file_upload']
         upload = self.create_upload_object(request, range, f)
+        if not settings.OSCAR_EAGER_RANGE_PRODUCT_UPLOADS:
+            messages.info(
+                request,
+                _("The file %s has been uploaded and will be processed shortly") % upload.filepath)
+            return
         products = upload.process(TextIOWrapper(f, encoding=request.encoding))
         if not upload.was_processing_successful():
             messages.error(request, upload.error_message)
@@ -191,12 +203,16 @@ class RangeProductListView(BulkEditMixin, ListView):
         self.check_imported_products_sku_duplicates(request, products)
 
     def create_upload_object(self, request, range, f):
-        upload = RangeProductFileUpload.objects.create(
+        upload = RangeProductFileUpload(
             range=range,
             uploaded_by=request.user,
             filepath=f.name,
             size=f.size
         )
+        if not settings.OSCAR_EAGER_RANGE_PRODUCT_UPLOADS:
+            # Store the file for the oscar_process_range_uploads command
+            upload.file = f
+        upload.save()
         return upload
 
     def check_imported_products_sku_duplicates(self, request, queryset):
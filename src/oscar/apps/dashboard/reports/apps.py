@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class ReportsDashboardConfig(OscarDashboardConfig):
@@ -13,7 +12,7 @@ class ReportsDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.index_view = get_class('dashboard.reports.views', 'IndexView')
+        self.index_view = self.get_view_class('dashboard.reports.views', 'IndexView')
 
     def get_urls(self):
         urls = [
@@ -6,6 +6,7 @@ from django.utils.translation import gettext_lazy as _
 
 from oscar.core import utils
 from oscar.core.compat import UnicodeCSVWriter
+from oscar.core.csv_utils import StreamingCSVResponse, iterate_in_chunks
 
 
 class ReportGenerator(object):
@@ -109,16 +110,36 @@ class ReportFormatter(object):
 
 
 class ReportCSVFormatter(ReportFormatter):
+    """
+    Formats reports as CSV files. Subclasses implement ``generate_rows``,
+    and the rows are streamed to the client as they are generated, with
+    querysets read in chunks.
+    """
 
     def get_csv_writer(self, file_handle, **kwargs):
         return UnicodeCSVWriter(open_file=file_handle, **kwargs)
 
+    def generate_rows(self, objects):
+        """
+        Yield the header row and the rows of the report for the given objects
+        """
+        raise NotImplementedError
+
+    def generate_csv(self, response, objects):
+        writer = self.get_csv_writer(response)
+        writer.writerows(self.generate_rows(objects))
+
     def generate_response(self, objects, **kwargs):
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = 'attachment; filename=%s' \
-            % self.filename(**kwargs)
-        self.generate_csv(response, objects)
-        return response
+        filename = self.filename(**kwargs)
+        if type(self).generate_csv is not ReportCSVFormatter.generate_csv:
+            # Formatters that override generate_csv write the whole file
+            # themselves, so it can't be streamed
+            response = HttpResponse(content_type='text/csv')
+            response['Content-Disposition'] = 'attachment; filename=%s' % filename
+            self.generate_csv(response, objects)
+            return response
+        return StreamingCSVResponse(
+            self.generate_rows(iterate_in_chunks(objects)), filename)
 
 
 class ReportHTMLFormatter(ReportFormatter):
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class ReviewsDashboardConfig(OscarDashboardConfig):
@@ -13,9 +12,9 @@ class ReviewsDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.reviews.views', 'ReviewListView')
-        self.update_view = get_class('dashboard.reviews.views', 'ReviewUpdateView')
-        self.delete_view = get_class('dashboard.reviews.views', 'ReviewDeleteView')
+        self.list_view = self.get_view_class('dashboard.reviews.views', 'ReviewListView')
+        self.update_view = self.get_view_class('dashboard.reviews.views', 'ReviewUpdateView')
+        self.delete_view = self.get_view_class('dashboard.reviews.views', 'ReviewDeleteView')
 
     def get_urls(self):
         urls = [
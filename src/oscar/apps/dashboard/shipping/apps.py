@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class ShippingDashboardConfig(OscarDashboardConfig):
@@ -13,20 +12,20 @@ class ShippingDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff']
 
     def ready(self):
-        self.weight_method_list_view = get_class(
+        self.weight_method_list_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBasedListView')
-        self.weight_method_create_view = get_class(
+        self.weight_method_create_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBasedCreateView')
-        self.weight_method_edit_view = get_class(
+        self.weight_method_edit_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBasedUpdateView')
-        self.weight_method_delete_view = get_class(
+        self.weight_method_delete_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBasedDeleteView')
         # This doubles as the weight_band create view
-        self.weight_method_detail_view = get_class(
+        self.weight_method_detail_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBasedDetailView')
-        self.weight_band_edit_view = get_class(
+        self.weight_band_edit_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBandUpdateView')
-        self.weight_band_delete_view = get_class(
+        self.weight_band_delete_view = self.get_view_class(
             'dashboard.shipping.views', 'WeightBandDeleteView')
 
     def get_urls(self):
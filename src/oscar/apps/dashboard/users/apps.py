@@ -2,7 +2,6 @@ from django.urls import path, re_path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class UsersDashboardConfig(OscarDashboardConfig):
@@ -13,16 +12,16 @@ class UsersDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.index_view = get_class('dashboard.users.views', 'IndexView')
-        self.user_detail_view = get_class('dashboard.users.views', 'UserDetailView')
-        self.password_reset_view = get_class('dashboard.users.views',
-                                             'PasswordResetView')
-        self.alert_list_view = get_class('dashboard.users.views',
-                                         'ProductAlertListView')
-        self.alert_update_view = get_class('dashboard.users.views',
-                                           'ProductAlertUpdateView')
-        self.alert_delete_view = get_class('dashboard.users.views',
-                                           'ProductAlertDeleteView')
+        self.index_view = self.get_view_class('dashboard.users.views', 'IndexView')
+        self.user_detail_view = self.get_view_class('dashboard.users.views', 'UserDetailView')
+        self.password_reset_view = self.get_view_class('dashboard.users.views',
+                                                       'PasswordResetView')
+        self.alert_list_view = self.get_view_class('dashboard.users.views',
+                                                   'ProductAlertListView')
+        self.alert_update_view = self.get_view_class('dashboard.users.views',
+                                                     'ProductAlertUpdateView')
+        self.alert_delete_view = self.get_view_class('dashboard.users.views',
+                                                     'ProductAlertDeleteView')
 
     def get_urls(self):
         urls = [
@@ -3,6 +3,7 @@ from datetime import timedelta
 from decimal import ROUND_UP
 from decimal import Decimal as D
 
+from django.conf import settings
 from django.contrib import messages
 from django.contrib.auth import views as auth_views
 from django.contrib.auth.forms import AuthenticationForm
@@ -13,9 +14,10 @@ from django.utils.timezone import now
 from django.views.generic import TemplateView
 
 from oscar.core.compat import get_user_model
-from oscar.core.loading import get_class, get_model
+from oscar.core.loading import get_class, get_classes, get_model
 
 RelatedFieldWidgetWrapper = get_class('dashboard.widgets', 'RelatedFieldWidgetWrapper')
+ShopStatistics, get_hour = get_classes('analytics.statistics', ['ShopStatistics', 'get_hour'])
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Voucher = get_model('voucher', 'Voucher')
 Basket = get_model('basket', 'Basket')
@@ -53,7 +55,24 @@ class IndexView(TemplateView):
         """
         return Voucher.objects.filter(end_datetime__gt=now())
 
-    def get_hourly_report(self, orders, hours=24, segments=10):
+    def get_statistics(self):
+        """
+        Get the materialised statistics of the shop for staff users, or of
+        the partner of users with a single partner. Returns ``None`` if the
+        statistics aren't materialised, or if they can't be used for the
+        user, in which case they are computed on the fly.
+        """
+        if not settings.OSCAR_MATERIALISE_DASHBOARD_STATISTICS:
+            return None
+        user = self.request.user
+        if user.is_staff:
+            return ShopStatistics()
+        partner_ids = list(user.partners.values_list('id', flat=True)[:2])
+        if len(partner_ids) == 1:
+            return ShopStatistics(partner_ids[0])
+        return None
+
+    def get_hourly_report(self, orders, hours=24, segments=10, statistics=None):
         """
         Get report of order revenue split up in hourly chunks. A report is
         generated for the last *hours* (default=24) from the current time.
@@ -61,25 +80,17 @@ class IndexView(TemplateView):
         ``y-range`` as the labelling for the y-axis in a template and
         ``order_total_hourly``, a list of properties for hourly chunks.
         *segments* defines the number of labelling segments used for the y-axis
-        when generating the y-axis labels (default=10).
+        when generating the y-axis labels (default=10). The revenue is read
+        from the hourly rollups of *statistics*, if passed.
         """
         # Get datetime for 24 hours ago
         time_now = now().replace(minute=0, second=0)
         start_time = time_now - timedelta(hours=hours - 1)
 
-        order_total_hourly = []
-        for hour in range(0, hours, 2):
-            end_time = start_time + timedelta(hours=2)
-            hourly_orders = orders.filter(date_placed__gte=start_time,
-                                          date_placed__lt=end_time)
-            total = hourly_orders.aggregate(
-                Sum('total_incl_tax')
-            )['total_incl_tax__sum'] or D('0.0')
-            order_total_hourly.append({
-                'end_time': end_time,
-                'total_incl_tax': total
-            })
-            start_time = end_time
+        if statistics is not None:
+            order_total_hourly = self.get_materialised_order_totals(statistics, start_time, hours)
+        else:
+            order_total_hourly = self.get_order_totals(orders, start_time, hours)
 
         max_value = max([x['total_incl_tax'] for x in order_total_hourly])
         divisor = 1
@@ -108,8 +119,91 @@ class IndexView(TemplateView):
         }
         return ctx
 
+    def get_order_totals(self, orders, start_time, hours):
+        order_total_hourly = []
+        for hour in range(0, hours, 2):
+            end_time = start_time + timedelta(hours=2)
+            hourly_orders = orders.filter(date_placed__gte=start_time,
+                                          date_placed__lt=end_time)
+            total = hourly_orders.aggregate(
+                Sum('total_incl_tax')
+            )['total_incl_tax__sum'] or D('0.0')
+            order_total_hourly.append({
+                'end_time': end_time,
+                'total_incl_tax': total
+            })
+            start_time = end_time
+        return order_total_hourly
+
+    def get_materialised_order_totals(self, statistics, start_time, hours):
+        hour = timedelta(hours=1)
+        first_hour = get_hour(start_time)
+        revenue = statistics.get_hourly_revenue(first_hour, first_hour + hours * hour)
+
+        order_total_hourly = []
+        for offset in range(0, hours, 2):
+            period_start = first_hour + offset * hour
+            order_total_hourly.append({
+                'end_time': start_time + (offset + 2) * hour,
+                'total_incl_tax': sum(
+                    (revenue.get(period_start + i * hour, D('0.0')) for i in range(2)), D('0.0')),
+            })
+        return order_total_hourly
+
+    def get_order_stats(self, orders, lines, customers, datetime_24hrs_ago):
+        orders_last_day = orders.filter(date_placed__gt=datetime_24hrs_ago)
+        total_lines_last_day = lines.filter(order__in=orders_last_day).count()
+        return {
+            'total_orders_last_day': orders_last_day.count(),
+            'total_lines_last_day': total_lines_last_day,
+
+            'average_order_costs': orders_last_day.aggregate(
+                Avg('total_incl_tax')
+            )['total_incl_tax__avg'] or D('0.00'),
+
+            'total_revenue_last_day': orders_last_day.aggregate(
+                Sum('total_incl_tax')
+            )['total_incl_tax__sum'] or D('0.00'),
+
+            'hourly_report_dict': self.get_hourly_report(orders),
+            'total_customers_last_day': customers.filter(
+                date_joined__gt=datetime_24hrs_ago,
+            ).count(),
+
+            'total_customers': customers.count(),
+            'total_orders': orders.count(),
+            'total_lines': lines.count(),
+            'total_revenue': orders.aggregate(
+                Sum('total_incl_tax')
+            )['total_incl_tax__sum'] or D('0.00'),
+        }
+
+    def get_materialised_stats(self, statistics, datetime_24hrs_ago):
+        last_day = statistics.get_totals(since=datetime_24hrs_ago)
+        totals = statistics.get_totals()
+        average_order_costs = D('0.00')
+        if last_day['num_orders']:
+            average_order_costs = last_day['total_incl_tax'] / last_day['num_orders']
+        return {
+            'total_orders_last_day': last_day['num_orders'],
+            'total_lines_last_day': last_day['num_lines'],
+            'average_order_costs': average_order_costs,
+            'total_revenue_last_day': last_day['total_incl_tax'],
+            'hourly_report_dict': self.get_hourly_report(None, statistics=statistics),
+            'total_customers_last_day': last_day['num_customers'],
+
+            'total_customers': totals['num_customers'],
+            'total_orders': totals['num_orders'],
+            'total_lines': totals['num_lines'],
+            'total_revenue': totals['total_incl_tax'],
+
+            'total_open_baskets_last_day': last_day['num_open_baskets'],
+            'total_open_baskets': totals['num_open_baskets'],
+        }
+
     def get_stats(self):
         datetime_24hrs_ago = now() - timedelta(hours=24)
+        statistics = self.get_statistics()
 
         orders = Order.objects.all()
         alerts = StockAlert.objects.all()
@@ -134,49 +228,31 @@ class IndexView(TemplateView):
             lines = lines.filter(partner_id__in=partners_ids)
             products = products.filter(stockrecords__partner_id__in=partners_ids)
 
-        orders_last_day = orders.filter(date_placed__gt=datetime_24hrs_ago)
-
         open_alerts = alerts.filter(status=StockAlert.OPEN)
         closed_alerts = alerts.filter(status=StockAlert.CLOSED)
 
-        total_lines_last_day = lines.filter(order__in=orders_last_day).count()
         stats = {
-            'total_orders_last_day': orders_last_day.count(),
-            'total_lines_last_day': total_lines_last_day,
-
-            'average_order_costs': orders_last_day.aggregate(
-                Avg('total_incl_tax')
-            )['total_incl_tax__avg'] or D('0.00'),
-
-            'total_revenue_last_day': orders_last_day.aggregate(
-                Sum('total_incl_tax')
-            )['total_incl_tax__sum'] or D('0.00'),
-
-            'hourly_report_dict': self.get_hourly_report(orders),
-            'total_customers_last_day': customers.filter(
-                date_joined__gt=datetime_24hrs_ago,
-            ).count(),
-
-            'total_open_baskets_last_day': baskets.filter(
-                date_created__gt=datetime_24hrs_ago
-            ).count(),
-
             'total_products': products.count(),
             'total_open_stock_alerts': open_alerts.count(),
             'total_closed_stock_alerts': closed_alerts.count(),
 
-            'total_customers': customers.count(),
-            'total_open_baskets': baskets.count(),
-            'total_orders': orders.count(),
-            'total_lines': lines.count(),
-            'total_revenue': orders.aggregate(
-                Sum('total_incl_tax')
-            )['total_incl_tax__sum'] or D('0.00'),
-
             'order_status_breakdown': orders.order_by(
                 'status'
             ).values('status').annotate(freq=Count('id'))
         }
+        if statistics is None:
+            stats.update(self.get_order_stats(orders, lines, customers, datetime_24hrs_ago))
+        else:
+            stats.update(self.get_materialised_stats(statistics, datetime_24hrs_ago))
+
+        # Open baskets are only rolled up for the whole shop, as their lines
+        # can change partners
+        if statistics is None or not user.is_staff:
+            stats.update(
+                total_open_baskets_last_day=baskets.filter(date_created__gt=datetime_24hrs_ago).count(),
+                total_open_baskets=baskets.count(),
+            )
+
         if user.is_staff:
             stats.update(
                 offer_maps=(ConditionalOffer.objects.filter(end_datetime__gt=now())
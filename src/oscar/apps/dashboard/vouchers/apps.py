@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarDashboardConfig
-from oscar.core.loading import get_class
 
 
 class VouchersDashboardConfig(OscarDashboardConfig):
@@ -13,23 +12,23 @@ class VouchersDashboardConfig(OscarDashboardConfig):
     default_permissions = ['is_staff', ]
 
     def ready(self):
-        self.list_view = get_class('dashboard.vouchers.views', 'VoucherListView')
-        self.create_view = get_class('dashboard.vouchers.views', 'VoucherCreateView')
-        self.update_view = get_class('dashboard.vouchers.views', 'VoucherUpdateView')
-        self.delete_view = get_class('dashboard.vouchers.views', 'VoucherDeleteView')
-        self.stats_view = get_class('dashboard.vouchers.views', 'VoucherStatsView')
+        self.list_view = self.get_view_class('dashboard.vouchers.views', 'VoucherListView')
+        self.create_view = self.get_view_class('dashboard.vouchers.views', 'VoucherCreateView')
+        self.update_view = self.get_view_class('dashboard.vouchers.views', 'VoucherUpdateView')
+        self.delete_view = self.get_view_class('dashboard.vouchers.views', 'VoucherDeleteView')
+        self.stats_view = self.get_view_class('dashboard.vouchers.views', 'VoucherStatsView')
 
-        self.set_list_view = get_class(
+        self.set_list_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetListView')
-        self.set_create_view = get_class(
+        self.set_create_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetCreateView')
-        self.set_update_view = get_class(
+        self.set_update_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetUpdateView')
-        self.set_detail_view = get_class(
+        self.set_detail_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetDetailView')
-        self.set_download_view = get_class(
+        self.set_download_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetDownloadView')
-        self.set_delete_view = get_class(
+        self.set_delete_view = self.get_view_class(
             'dashboard.vouchers.views', 'VoucherSetDeleteView')
 
     def get_urls(self):
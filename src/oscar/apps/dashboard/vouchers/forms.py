@@ -4,13 +4,13 @@ from django.urls import reverse
 from django.utils.safestring import mark_safe
 from django.utils.translation import gettext_lazy as _
 
-from oscar.apps.voucher.utils import get_unused_code
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 from oscar.forms import widgets
 
 Voucher = get_model('voucher', 'Voucher')
 VoucherSet = get_model('voucher', 'VoucherSet')
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
+VoucherSetGenerator = get_class('voucher.generators', 'VoucherSetGenerator')
 
 
 class VoucherForm(forms.ModelForm):
@@ -96,30 +96,10 @@ class VoucherSetForm(forms.ModelForm):
     def save(self, commit=True):
         instance = super().save(commit)
         if commit:
-            usage = self.cleaned_data['usage']
-            offers = self.cleaned_data['offers']
-            if instance is not None:
-                # Update vouchers in this set
-                for i, voucher in enumerate(instance.vouchers.order_by('date_created')):
-                    voucher.name = "%s - %d" % (instance.name, i + 1)
-                    voucher.usage = usage
-                    voucher.start_datetime = instance.start_datetime
-                    voucher.end_datetime = instance.end_datetime
-                    voucher.save()
-                    voucher.offers.set(offers)
-            # Add vouchers to this set
-            vouchers_added = False
-            for i in range(instance.vouchers.count(), instance.count):
-                voucher = Voucher.objects.create(name="%s - %d" % (instance.name, i + 1),
-                                                 code=get_unused_code(length=instance.code_length),
-                                                 voucher_set=instance,
-                                                 usage=usage,
-                                                 start_datetime=instance.start_datetime,
-                                                 end_datetime=instance.end_datetime)
-                voucher.offers.add(*offers)
-                vouchers_added = True
-            if vouchers_added:
-                instance.update_count()
+            # Update the vouchers in this set, and add any missing ones
+            generator = VoucherSetGenerator(
+                instance, usage=self.cleaned_data['usage'], offers=self.cleaned_data['offers'])
+            generator.run(update=True)
         return instance
 
 
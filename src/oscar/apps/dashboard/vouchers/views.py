@@ -1,15 +1,13 @@
-import csv
-
 from django.conf import settings
 from django.contrib import messages
 from django.db import transaction
-from django.http import HttpResponse
 from django.shortcuts import get_object_or_404, redirect
 from django.urls import reverse, reverse_lazy
 from django.utils import timezone
 from django.utils.translation import gettext_lazy as _
 from django.views import generic
 
+from oscar.core.csv_utils import StreamingCSVResponse, iterate_in_chunks
 from oscar.core.loading import get_class, get_model
 from oscar.core.utils import slugify
 from oscar.views import sort_queryset
@@ -316,16 +314,9 @@ class VoucherSetDownloadView(generic.DetailView):
 
     def get(self, request, *args, **kwargs):
         voucher_set = self.get_object()
-
-        response = HttpResponse(content_type='text/csv')
-        response['Content-Disposition'] = (
-            'attachment; filename="%s.csv"' % slugify(voucher_set.name))
-
-        writer = csv.writer(response)
-        for code in voucher_set.vouchers.values_list('code', flat=True):
-            writer.writerow([code])
-
-        return response
+        codes = voucher_set.vouchers.values_list('code')
+        return StreamingCSVResponse(
+            iterate_in_chunks(codes), '%s.csv' % slugify(voucher_set.name))
 
 
 class VoucherSetDeleteView(generic.DeleteView):
@@ -1,11 +1,15 @@
 import csv
 import operator
+from collections import defaultdict
 from decimal import ROUND_DOWN
 from decimal import Decimal as D
+from io import TextIOWrapper
+from itertools import islice
 
 from django.conf import settings
 from django.core import exceptions
 from django.db import models
+from django.db.models import Max
 from django.db.models.query import Q
 from django.template.defaultfilters import date as date_filter
 from django.urls import reverse
@@ -24,6 +28,7 @@ ActiveOfferManager, RangeManager, BrowsableRangeManager \
     = get_classes('offer.managers', ['ActiveOfferManager', 'RangeManager', 'BrowsableRangeManager'])
 ZERO_DISCOUNT = get_class('offer.results', 'ZERO_DISCOUNT')
 load_proxy, unit_price = get_classes('offer.utils', ['load_proxy', 'unit_price'])
+RangeMembershipIndex = get_class('offer.membership', 'RangeMembershipIndex')
 
 
 class BaseOfferMixin(models.Model):
@@ -668,11 +673,11 @@ class AbstractBenefit(BaseOfferMixin, models.Model):
         """
         if range is None:
             range = self.range
+        lines = basket.all_lines()
+        product_ids = range.contains_products(line.product_id for line in lines)
         line_tuples = []
-        for line in basket.all_lines():
-            product = line.product
-
-            if (not range.contains_product(product) or not self.can_apply_benefit(line)):
+        for line in lines:
+            if (line.product_id not in product_ids or not self.can_apply_benefit(line)):
                 continue
 
             price = unit_price(offer, line)
@@ -935,13 +940,33 @@ class AbstractRange(models.Model):
     def contains_product(self, product):
         if self.proxy:
             return self.proxy.contains_product(product)
-        return self.product_queryset.filter(id=product.id).exists()
+        return product.id in self.contains_products([product.id])
+
+    def contains_products(self, product_ids):
+        """
+        Return the set of the passed product ids that are in the range.
+
+        This allows checking all products of a basket in one go, using the
+        range membership index rather than a query per product.
+        """
+        product_ids = set(product_ids)
+        if self.proxy:
+            Product = self.included_products.model
+            products = Product._default_manager.filter(id__in=product_ids)
+            return {product.id for product in products
+                    if self.proxy.contains_product(product)}
+        return self.membership_index.filter(product_ids)
+
+    @cached_property
+    def membership_index(self):
+        return RangeMembershipIndex(self)
 
     def invalidate_cached_queryset(self):
         try:
             del self.product_queryset
         except AttributeError:
             pass
+        self.membership_index.clear()
 
     def num_products(self):
         # Delegate to a proxy class if one is provided
@@ -949,7 +974,7 @@ class AbstractRange(models.Model):
             return self.proxy.num_products()
         if self.includes_all_products:
             return None
-        return self.all_products().count()
+        return self.membership_index.count()
 
     def all_products(self):
         """
@@ -1039,15 +1064,23 @@ class AbstractRangeProductFileUpload(models.Model):
         verbose_name=_("Range"))
     filepath = models.CharField(_("File Path"), max_length=255)
     size = models.PositiveIntegerField(_("Size"))
+    #: The uploaded file, stored when it's processed outside of the request,
+    #: e.g. by the ``oscar_process_range_uploads`` management command
+    file = models.FileField(_("File"), upload_to='range-uploads/%Y/%m/', max_length=255, blank=True)
     uploaded_by = models.ForeignKey(
         AUTH_USER_MODEL,
         on_delete=models.CASCADE,
         verbose_name=_("Uploaded By"))
     date_uploaded = models.DateTimeField(_("Date Uploaded"), auto_now_add=True, db_index=True)
+    #: Updated whenever the upload is saved, including after every chunk that
+    #: is processed, so that uploads which stopped being processed can be told
+    #: apart from uploads that are still being processed
+    date_updated = models.DateTimeField(_("Date Updated"), auto_now=True, null=True)
 
-    PENDING, FAILED, PROCESSED = 'Pending', 'Failed', 'Processed'
+    PENDING, PROCESSING, FAILED, PROCESSED = 'Pending', 'Processing', 'Failed', 'Processed'
     choices = (
         (PENDING, PENDING),
+        (PROCESSING, PROCESSING),
         (FAILED, FAILED),
         (PROCESSED, PROCESSED),
     )
@@ -1064,6 +1097,13 @@ class AbstractRangeProductFileUpload(models.Model):
                                                    null=True)
     num_duplicate_skus = models.PositiveIntegerField(
         _("Number of Duplicate SKUs"), null=True)
+    #: Progress of the processing, updated after every chunk of identifiers
+    num_processed_ids = models.PositiveIntegerField(
+        _("Number of Processed SKUs"), default=0)
+
+    #: Number of SKUs and UPCs that are looked up and added to the range
+    #: together
+    chunk_size = 1000
 
     class Meta:
         abstract = True
@@ -1092,35 +1132,108 @@ class AbstractRangeProductFileUpload(models.Model):
     def process(self, file_obj):
         """
         Process the file upload and add products to the range
+
+        The SKUs and UPCs are read from the file in chunks of ``chunk_size``.
+        The products of each chunk are looked up with one query and added to
+        the range with one insert, in the order of the file. The counters of
+        the upload are saved after every chunk, so they show the progress of
+        long-running uploads. The products are added after the products that
+        are already in the range.
+
+        If processing fails, the upload is marked as failed before the
+        exception is raised again.
         """
-        all_ids = set(self.extract_ids(file_obj))
-        products = self.range.all_products()
-        existing_skus = products.values_list(
-            'stockrecords__partner_sku', flat=True)
-        existing_skus = set(filter(bool, existing_skus))
-        existing_upcs = products.values_list('upc', flat=True)
-        existing_upcs = set(filter(bool, existing_upcs))
-        existing_ids = existing_skus.union(existing_upcs)
-        new_ids = all_ids - existing_ids
+        Product = get_model('catalogue', 'Product')
+        RangeProduct = self.range.included_products.through
+
+        self.status = self.PROCESSING
+        self.num_processed_ids = self.num_new_skus = 0
+        self.num_unknown_skus = self.num_duplicate_skus = 0
+        self.save()
 
+        try:
+            max_display_order = RangeProduct.objects.filter(range=self.range).aggregate(
+                max_display_order=Max('display_order'))['max_display_order']
+            first_display_order = 0 if max_display_order is None else max_display_order + 1
+
+            ids = self.extract_ids(file_obj)
+            seen_ids = set()
+            added_product_ids = []
+            while True:
+                chunk = list(islice(ids, self.chunk_size))
+                if not chunk:
+                    break
+                self.num_processed_ids += len(chunk)
+                chunk = [id for id in dict.fromkeys(chunk) if id not in seen_ids]
+                seen_ids.update(chunk)
+
+                added_product_ids.extend(self.process_chunk(
+                    chunk, added_product_ids, first_display_order + len(added_product_ids)))
+                self.num_new_skus = len(added_product_ids)
+                self.save(update_fields=[
+                    'status', 'num_processed_ids', 'num_new_skus', 'num_unknown_skus', 'num_duplicate_skus',
+                    'date_updated'])
+        except Exception as e:
+            self.mark_as_failed(str(e)[:255])
+            raise
+        finally:
+            # invalidate cache because queryset has changed, also if only
+            # some of the chunks were added
+            self.range.invalidate_cached_queryset()
+            RangeMembershipIndex.invalidate_ranges([self.range_id])
+
+        self.mark_as_processed(self.num_new_skus, self.num_unknown_skus, self.num_duplicate_skus)
+        return Product._default_manager.filter(pk__in=added_product_ids)
+
+    def process_chunk(self, ids, added_product_ids, display_order):
+        """
+        Add the products matching a chunk of SKUs and UPCs to the range, and
+        return their ids. Products added by earlier chunks of the same file
+        are ignored. The added products are numbered from ``display_order``.
+        """
         Product = get_model('catalogue', 'Product')
-        products = Product._default_manager.filter(
-            models.Q(stockrecords__partner_sku__in=new_ids)
-            | models.Q(upc__in=new_ids))
-        for product in products:
-            self.range.add_product(product)
-
-        # Processing stats
-        found_skus = products.values_list(
-            'stockrecords__partner_sku', flat=True)
-        found_skus = set(filter(bool, found_skus))
-        found_upcs = set(filter(bool, products.values_list('upc', flat=True)))
-        found_ids = found_skus.union(found_upcs)
-        missing_ids = new_ids - found_ids
-        dupes = set(all_ids).intersection(existing_ids)
-
-        self.mark_as_processed(products.count(), len(missing_ids), len(dupes))
-        return products
+        RangeProduct = self.range.included_products.through
+        added = set(added_product_ids)
+
+        product_ids = defaultdict(list)
+        matches = Product._default_manager.filter(
+            Q(stockrecords__partner_sku__in=ids) | Q(upc__in=ids),
+        ).values_list('pk', 'upc', 'stockrecords__partner_sku')
+        for pk, upc, partner_sku in matches:
+            for id in {upc, partner_sku}:
+                if id and pk not in added and pk not in product_ids[id]:
+                    product_ids[id].append(pk)
+        in_range = self.range.contains_products({pk for pks in product_ids.values() for pk in pks})
+
+        new_product_ids = []
+        for id in ids:
+            if id not in product_ids:
+                self.num_unknown_skus += 1
+            elif any(pk in in_range for pk in product_ids[id]):
+                self.num_duplicate_skus += 1
+            new_product_ids.extend(
+                pk for pk in product_ids.get(id, []) if pk not in in_range and pk not in new_product_ids)
+        if not new_product_ids:
+            return []
+
+        RangeProduct.objects.bulk_create([
+            RangeProduct(range=self.range, product_id=pk, display_order=order)
+            for order, pk in enumerate(new_product_ids, start=display_order)
+        ], ignore_conflicts=True)
+        # Products that were removed from the range earlier return to it. The
+        # through model is used directly, as excluded_products.remove() would
+        # reset the range's membership index for every chunk.
+        self.range.excluded_products.through.objects.filter(
+            range=self.range, product_id__in=new_product_ids).delete()
+        return new_product_ids
+
+    def process_file(self):
+        """
+        Process the stored file of the upload, outside of the request that
+        uploaded it
+        """
+        with self.file.open('rb') as f:
+            self.process(TextIOWrapper(f, encoding=settings.DEFAULT_CHARSET))
 
     def extract_ids(self, file_obj):
         reader = csv.reader(file_obj)
@@ -1,10 +1,12 @@
 import logging
 from itertools import chain
 
-from oscar.core.loading import get_class, get_model
+from oscar.core.loading import get_class
 
 logger = logging.getLogger('oscar.offers')
 OfferApplications = get_class('offer.results', 'OfferApplications')
+SiteOfferSnapshot = get_class('offer.snapshot', 'SiteOfferSnapshot')
+ProductRangeIndex = get_class('offer.membership', 'ProductRangeIndex')
 
 
 class OfferApplicationError(Exception):
@@ -21,8 +23,44 @@ class Applicator(object):
         are dependent on the user (eg session-based offers).
         """
         offers = self.get_offers(basket, user, request)
+        offers = self.filter_offers(basket, offers)
         self.apply_offers(basket, offers)
 
+    def is_range_restricted(self, offer):
+        """
+        Test whether the offer's condition can only be satisfied by basket
+        lines with a product from the condition range.
+
+        This holds for the built-in condition types. Custom conditions and
+        ranges may use other rules, so they are never restricted.
+        """
+        condition = offer.condition
+        return (not condition.proxy_class
+                and condition.type in (condition.COUNT, condition.VALUE, condition.COVERAGE)
+                and condition.range is not None
+                and not condition.range.proxy_class)
+
+    def filter_offers(self, basket, offers):
+        """
+        Drop the offers that can't apply to the basket, before any condition
+        or benefit code runs.
+
+        Offers with a range-restricted condition are only kept when at least
+        one of the basket's products is in the condition range. The ranges of
+        the basket's products are looked up in the inverted range index, so
+        only the relevant offers are evaluated.
+        """
+        offers = list(offers)
+        if not any(self.is_range_restricted(offer) for offer in offers):
+            return offers
+
+        products = [line.product for line in basket.all_lines()]
+        product_range_ids = ProductRangeIndex().get_range_ids(products)
+        range_ids = set().union(*product_range_ids.values())
+        return [offer for offer in offers
+                if not self.is_range_restricted(offer)
+                or offer.condition.range_id in range_ids]
+
     def apply_offers(self, basket, offers):
         applications = OfferApplications()
         for offer in offers:
@@ -63,13 +101,11 @@ class Applicator(object):
     def get_site_offers(self):
         """
         Return site offers that are available to all users
+
+        The offers are read from a cached snapshot, with their conditions,
+        benefits and ranges already loaded.
         """
-        ConditionalOffer = get_model('offer', 'ConditionalOffer')
-        qs = ConditionalOffer.active.filter(offer_type=ConditionalOffer.SITE)
-        # Using select_related with the condition/benefit ranges doesn't seem
-        # to work.  I think this is because both the related objects have the
-        # FK to range with the same name.
-        return qs.select_related('condition', 'benefit')
+        return SiteOfferSnapshot().get_offers()
 
     def get_basket_offers(self, basket, user):
         """
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class OfferConfig(OscarConfig):
@@ -15,8 +14,8 @@ class OfferConfig(OscarConfig):
     def ready(self):
         from . import receivers  # noqa
 
-        self.detail_view = get_class('offer.views', 'OfferDetailView')
-        self.list_view = get_class('offer.views', 'OfferListView')
+        self.detail_view = self.get_view_class('offer.views', 'OfferDetailView')
+        self.list_view = self.get_view_class('offer.views', 'OfferListView')
 
     def get_urls(self):
         urls = [
@@ -0,0 +1,236 @@
+
+from django.core.cache import cache
+
+from oscar.core.cache import VersionedCache
+from oscar.core.loading import get_model
+
+
+class RangeMembershipIndex(VersionedCache):
+    """
+    Materialised product membership of a range.
+
+    The ids of the products within a range are resolved once, using the
+    range's ``product_queryset``, and stored in the cache. Offer conditions
+    and benefits can then check a whole basket against the range with a
+    single cache lookup instead of running a query per basket line. Ranges
+    with more than ``max_size`` products aren't stored, as their entries
+    would get too large for the cache, and baskets are checked against them
+    with a single query instead.
+
+    Each range has its own version, which is replaced whenever the products,
+    categories or contents of the range change (see
+    ``oscar.apps.offer.receivers``), so that only the entries of the affected
+    ranges are rebuilt. The global version is replaced along with it, and
+    tags the caches that depend on the membership of any range.
+    """
+    version_cache_key = 'oscar_range_membership_version'
+    range_version_cache_key_template = 'oscar_range_membership_version_%s'
+    cache_key_template = 'oscar_range_membership_%s'
+    count_cache_key_template = 'oscar_range_count_%s'
+
+    # The maximum number of product ids stored for a range
+    max_size = 20000
+
+    # Ranges that include all products are stored as the set of excluded
+    # products, other ranges as the set of included products.
+    INCLUDE, EXCLUDE = 'include', 'exclude'
+
+    def __init__(self, range):
+        self.range = range
+        self._membership = None
+        self._count = None
+
+    @classmethod
+    def invalidate_ranges(cls, range_ids):
+        """
+        Mark the entries of the passed ranges as stale
+        """
+        range_ids = set(range_ids)
+        if not range_ids:
+            return
+        cache.set_many({
+            cls.range_version_cache_key_template % pk: cls.new_version()
+            for pk in range_ids}, None)
+        cls.invalidate()
+
+    @classmethod
+    def invalidate_all_ranges(cls):
+        """
+        Mark the entries of all ranges as stale, e.g. after products have been
+        changed without sending signals
+        """
+        Range = get_model('offer', 'Range')
+        cls.invalidate_ranges(Range.objects.values_list('pk', flat=True))
+
+    @classmethod
+    def get_range_versions(cls, range_ids):
+        """
+        Return a dict mapping the passed range ids to the current versions of
+        the ranges, or ``None`` if the cache doesn't persist values.
+        """
+        keys = {cls.range_version_cache_key_template % pk: pk for pk in range_ids}
+        versions = {keys[key]: version for key, version in cache.get_many(keys).items()}
+        if len(versions) == len(keys):
+            return versions
+        if cls.get_version() is None:
+            return None
+        missing = {key: cls.new_version() for key, pk in keys.items() if pk not in versions}
+        cache.set_many(missing, None)
+        versions.update((keys[key], version) for key, version in missing.items())
+        return versions
+
+    def get_cache_key(self):
+        return self.cache_key_template % self.range.pk
+
+    def build(self):
+        """
+        Return a ``(mode, product_ids)`` tuple describing the range's
+        products. ``product_ids`` is ``None`` if there are more than
+        ``max_size`` of them.
+        """
+        if self.range.includes_all_products:
+            mode, product_ids = self.EXCLUDE, self.range.excluded_products.values_list('id', flat=True)
+        else:
+            mode, product_ids = self.INCLUDE, self.range.product_queryset.order_by().values_list('id', flat=True)
+        product_ids = list(product_ids[:self.max_size + 1])
+        if len(product_ids) > self.max_size:
+            return mode, None
+        return mode, frozenset(product_ids)
+
+    def get_membership(self):
+        """
+        Return the membership of the range, loading it from the cache or
+        building it if the cached entry is missing or stale.
+
+        Returns ``None`` if the cache doesn't persist values (e.g. when using
+        the dummy cache backend), so callers can query the database directly.
+        """
+        versions = self.get_range_versions([self.range.pk])
+        if versions is None:
+            return None
+        version = versions[self.range.pk]
+
+        # The membership is kept on the instance as well, which saves
+        # fetching it from the cache for every product that is checked.
+        if self._membership is not None and self._membership[0] == version:
+            return self._membership[1:]
+
+        entry = cache.get(self.get_cache_key())
+        if entry is None or entry[0] != version:
+            entry = (version,) + self.build()
+            cache.set(self.get_cache_key(), entry, None)
+        self._membership = entry
+        return entry[1:]
+
+    @classmethod
+    def count_many(cls, ranges):
+        """
+        Return a dict mapping the ids of the passed ranges to their numbers of
+        products.
+
+        The counts are cached separately from the memberships, and tagged with
+        the same versions, so they are kept for ranges whose products aren't
+        stored as well. They are fetched with a single cache lookup, and only
+        the counts of ranges that changed are recounted, with a query per
+        range.
+        """
+        ranges = {range.pk: range for range in ranges}
+        versions = cls.get_range_versions(ranges)
+        if versions is None:
+            return {pk: range.product_queryset.count() for pk, range in ranges.items()}
+
+        keys = {cls.count_cache_key_template % pk: pk for pk in ranges}
+        entries = cache.get_many(keys)
+        counts, missing = {}, {}
+        for key, pk in keys.items():
+            entry = entries.get(key)
+            if entry is None or entry[0] != versions[pk]:
+                entry = missing[key] = (versions[pk], ranges[pk].product_queryset.count())
+            counts[pk] = entry[1]
+        if missing:
+            cache.set_many(missing, None)
+        return counts
+
+    @classmethod
+    def load_many(cls, ranges):
+        """
+        Load the product counts of the passed ranges in one go, e.g. to list
+        a page of ranges.
+        """
+        ranges = [range for range in ranges if not range.proxy and not range.includes_all_products]
+        if not ranges:
+            return
+        counts = cls.count_many(ranges)
+        for range in ranges:
+            range.membership_index._count = counts[range.pk]
+
+    def count(self):
+        """
+        Return the number of products in the range. Ranges that include all
+        products aren't counted.
+        """
+        if self._count is None:
+            self._count = self.count_many([self.range])[self.range.pk]
+        return self._count
+
+    def clear(self):
+        """
+        Drop the membership and count held by this instance, so they're
+        reloaded on the next lookup
+        """
+        self._membership = None
+        self._count = None
+
+    def filter(self, product_ids):
+        """
+        Return the set of the passed product ids that are in the range
+        """
+        product_ids = set(product_ids)
+        if not product_ids:
+            return set()
+        membership = self.get_membership()
+        if membership is None or membership[1] is None:
+            return set(
+                self.range.product_queryset.filter(id__in=product_ids)
+                .order_by().values_list('id', flat=True))
+        mode, range_product_ids = membership
+        if mode == self.EXCLUDE:
+            return product_ids - range_product_ids
+        return product_ids & range_product_ids
+
+
+class ProductRangeIndex(object):
+    """
+    Inverted range membership: the ids of the ranges that contain a product.
+
+    Entries are stored per product, so the ranges of all products in a basket
+    are fetched with a single cache lookup. They share the version of the
+    ``RangeMembershipIndex`` and are computed on demand with one query per
+    product. Ranges using a custom proxy class aren't taken into account.
+    """
+    cache_key_template = 'oscar_product_ranges_%s_%s'
+
+    def build(self, product):
+        Range = get_model('offer', 'Range')
+        range_ids = Range.objects.contains_product(product).values_list('id', flat=True)
+        return frozenset(range_ids)
+
+    def get_range_ids(self, products):
+        """
+        Return a dict mapping the ids of the passed products to the set of
+        ids of the ranges that contain them
+        """
+        products = {product.id: product for product in products}
+        version = RangeMembershipIndex.get_version()
+        if version is None:
+            return {pk: self.build(product) for pk, product in products.items()}
+
+        keys = {self.cache_key_template % (version, pk): pk for pk in products}
+        range_ids = {keys[key]: value for key, value in cache.get_many(keys).items()}
+        missing = {}
+        for key, pk in keys.items():
+            if pk not in range_ids:
+                range_ids[pk] = missing[key] = self.build(products[pk])
+        if missing:
+            cache.set_many(missing, None)
+        return range_ids
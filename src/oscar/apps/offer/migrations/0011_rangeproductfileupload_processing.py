@@ -0,0 +1,28 @@
+# Generated by Django 3.2.25 on 2026-10-17 09:32
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer', '0010_conditionaloffer_combinations'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rangeproductfileupload',
+            name='file',
+            field=models.FileField(blank=True, max_length=255, upload_to='range-uploads/%Y/%m/', verbose_name='File'),
+        ),
+        migrations.AddField(
+            model_name='rangeproductfileupload',
+            name='num_processed_ids',
+            field=models.PositiveIntegerField(default=0, verbose_name='Number of Processed SKUs'),
+        ),
+        migrations.AlterField(
+            model_name='rangeproductfileupload',
+            name='status',
+            field=models.CharField(choices=[('Pending', 'Pending'), ('Processing', 'Processing'), ('Failed', 'Failed'), ('Processed', 'Processed')], default='Pending', max_length=32, verbose_name='Status'),
+        ),
+    ]
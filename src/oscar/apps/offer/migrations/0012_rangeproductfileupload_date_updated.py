@@ -0,0 +1,18 @@
+# Generated by Django 3.2.25 on 2026-10-17 14:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offer', '0011_rangeproductfileupload_processing'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='rangeproductfileupload',
+            name='date_updated',
+            field=models.DateTimeField(auto_now=True, null=True, verbose_name='Date Updated'),
+        ),
+    ]
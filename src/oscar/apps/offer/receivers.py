@@ -1,11 +1,21 @@
-from django.db.models.signals import post_delete
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save)
 from django.dispatch import receiver
 
-from oscar.core.loading import get_model
+from oscar.apps.catalogue.signals import category_moved
+from oscar.core.loading import get_class, get_model
 
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Condition = get_model('offer', 'Condition')
 Benefit = get_model('offer', 'Benefit')
+Range = get_model('offer', 'Range')
+RangeProduct = get_model('offer', 'RangeProduct')
+Product = get_model('catalogue', 'Product')
+ProductCategory = get_model('catalogue', 'ProductCategory')
+Category = get_model('catalogue', 'Category')
+ExpandUpwardsCategoryQueryset = get_class('catalogue.expressions', 'ExpandUpwardsCategoryQueryset')
+RangeMembershipIndex = get_class('offer.membership', 'RangeMembershipIndex')
+SiteOfferSnapshot = get_class('offer.snapshot', 'SiteOfferSnapshot')
 
 
 @receiver(post_delete, sender=ConditionalOffer)
@@ -29,3 +39,165 @@ def delete_unused_related_conditions_and_benefits(instance, **kwargs):
         # Only delete if not using a proxy, and not used by other offers
         if benefit.proxy_class == '' and not benefit.offers.exists():
             benefit.delete()
+
+
+def get_category_range_ids(category_ids):
+    """
+    Return the ids of the ranges that include the passed categories, or any
+    of their ancestors
+    """
+    categories = Category.objects.filter(pk__in=category_ids).values('id')
+    return Range.objects.filter(
+        included_categories__in=ExpandUpwardsCategoryQueryset(categories),
+        includes_all_products=False,
+    ).values_list('pk', flat=True)
+
+
+def get_product_range_ids(product):
+    return Range.objects.contains_product(product).filter(
+        includes_all_products=False).values_list('pk', flat=True)
+
+
+def invalidate_range(sender, instance, **kwargs):
+    """
+    Mark the membership of a range as stale when the range itself, or one of
+    its explicitly included products, has changed
+    """
+    if isinstance(instance, Range):
+        RangeMembershipIndex.invalidate_ranges([instance.pk])
+        instance.invalidate_cached_queryset()
+    else:
+        RangeMembershipIndex.invalidate_ranges([instance.range_id])
+
+
+def store_previous_product_ranges(sender, instance, **kwargs):
+    """
+    Look up the ranges that contain a product before it's saved, if it's
+    about to change its product class or parent, as it may leave them
+    """
+    if kwargs.get('raw', False) or instance.pk is None:
+        return
+    previous = Product.objects.filter(pk=instance.pk).only(
+        'structure', 'product_class', 'parent').first()
+    if previous is None:
+        return
+    if (previous.product_class_id, previous.parent_id) != (instance.product_class_id, instance.parent_id):
+        instance._previous_range_ids = set(get_product_range_ids(previous))
+
+
+def invalidate_product_ranges(sender, instance, **kwargs):
+    """
+    Mark the memberships of the ranges that contain a product as stale when
+    the product has been saved, or is about to be deleted. This includes the
+    ranges the product has left by changing its product class or parent.
+    """
+    if not kwargs.get('raw', False):
+        range_ids = set(get_product_range_ids(instance))
+        range_ids.update(instance.__dict__.pop('_previous_range_ids', ()))
+        RangeMembershipIndex.invalidate_ranges(range_ids)
+
+
+def invalidate_product_category_ranges(sender, instance, **kwargs):
+    """
+    Mark the memberships of the ranges that include a category as stale when
+    products are added to or removed from it
+    """
+    if not kwargs.get('raw', False):
+        RangeMembershipIndex.invalidate_ranges(get_category_range_ids([instance.category_id]))
+
+
+def invalidate_deleted_category_ranges(sender, instance, **kwargs):
+    """
+    Mark the memberships of the ranges that include a category, or any of
+    its descendants, as stale when it's about to be deleted. Its products
+    are removed from it, and it's removed from the ranges, without sending
+    any further signals once it's deleted.
+    """
+    RangeMembershipIndex.invalidate_ranges(get_category_range_ids(
+        Category.get_tree(instance).values('id')))
+
+
+def invalidate_moved_category_ranges(sender, instance, **kwargs):
+    """
+    Mark the memberships of all ranges that include categories as stale when
+    a category has been moved, as it may have left or joined any of them
+    """
+    RangeMembershipIndex.invalidate_ranges(Range.objects.filter(
+        included_categories__isnull=False, includes_all_products=False).values_list('pk', flat=True))
+
+
+def get_changed_range_ids(sender, instance, model, pk_set, **kwargs):
+    """
+    Return the ids of the ranges whose membership is changed by an
+    ``m2m_changed`` signal of one of the range relations, or of the
+    categories of a product
+    """
+    if sender is Product.categories.through:
+        if isinstance(instance, Product):
+            category_ids = pk_set if pk_set is not None else instance.categories.values('id')
+        else:
+            category_ids = [instance.pk]
+        return set(get_category_range_ids(category_ids))
+    if isinstance(instance, Range):
+        return {instance.pk}
+    if pk_set is not None:
+        return set(pk_set)
+    # The relation is cleared from the side of the product, product class or
+    # category, so look up the ranges it's cleared from
+    return set(sender.objects.filter(
+        **{'%s_id' % instance._meta.model_name: instance.pk}).values_list('range_id', flat=True))
+
+
+def invalidate_changed_ranges(sender, instance, action, **kwargs):
+    """
+    Mark the memberships of the ranges changed by an ``m2m_changed`` signal
+    as stale. Clearing a relation doesn't pass the removed objects, so the
+    ranges are looked up before it's cleared.
+    """
+    if action == 'pre_clear':
+        instance._cleared_range_ids = get_changed_range_ids(sender, instance, **kwargs)
+    elif action == 'post_clear':
+        RangeMembershipIndex.invalidate_ranges(instance.__dict__.pop('_cleared_range_ids', ()))
+    elif action.startswith('post_'):
+        RangeMembershipIndex.invalidate_ranges(get_changed_range_ids(sender, instance, **kwargs))
+    if isinstance(instance, Range) and action.startswith('post_'):
+        instance.invalidate_cached_queryset()
+
+
+for sender in [Range, RangeProduct]:
+    post_save.connect(invalidate_range, sender=sender)
+    post_delete.connect(invalidate_range, sender=sender)
+
+# Deleted products are looked up before they are deleted, as their included
+# products and categories are deleted along with them
+pre_save.connect(store_previous_product_ranges, sender=Product)
+post_save.connect(invalidate_product_ranges, sender=Product)
+pre_delete.connect(invalidate_product_ranges, sender=Product)
+
+post_save.connect(invalidate_product_category_ranges, sender=ProductCategory)
+post_delete.connect(invalidate_product_category_ranges, sender=ProductCategory)
+
+for sender in [Range.included_products.through, Range.excluded_products.through,
+               Range.classes.through, Range.included_categories.through,
+               Product.categories.through]:
+    m2m_changed.connect(invalidate_changed_ranges, sender=sender)
+
+pre_delete.connect(invalidate_deleted_category_ranges, sender=Category)
+category_moved.connect(invalidate_moved_category_ranges, sender=Category)
+
+
+def invalidate_site_offers(sender, **kwargs):
+    """
+    Mark the site offer snapshot as stale when an offer or any of its
+    components has changed.
+    """
+    if kwargs.get('action', 'post_').startswith('post_'):
+        SiteOfferSnapshot.invalidate()
+
+
+for sender in [ConditionalOffer, Condition, Benefit, Range]:
+    post_save.connect(invalidate_site_offers, sender=sender)
+    post_delete.connect(invalidate_site_offers, sender=sender)
+
+m2m_changed.connect(
+    invalidate_site_offers, sender=ConditionalOffer.combinations.through)
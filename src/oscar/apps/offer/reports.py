@@ -16,15 +16,14 @@ OrderDiscount = get_model('order', 'OrderDiscount')
 class OfferReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'conditional-offer-performance.csv'
 
-    def generate_csv(self, response, offer_discounts):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, offer_discounts):
         header_row = [_('Offer'),
                       _('Total discount')
                       ]
-        writer.writerow(header_row)
+        yield header_row
 
         for discount in offer_discounts:
-            writer.writerow([discount["display_offer_name"], discount["total_discount"]])
+            yield [discount["display_offer_name"], discount["total_discount"]]
 
 
 class OfferReportHTMLFormatter(ReportHTMLFormatter):
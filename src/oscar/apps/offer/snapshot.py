@@ -0,0 +1,107 @@
+import pickle
+
+from django.core.cache import cache
+from django.db.models import Q
+from django.utils.timezone import now
+
+from oscar.core.cache import VersionedCache
+from oscar.core.loading import get_model
+
+
+class SiteOfferSnapshot(VersionedCache):
+    """
+    A cached snapshot of the open site offers.
+
+    Site offers are evaluated on every request that touches the basket, but
+    rarely change. The snapshot holds the offers with their conditions,
+    benefits and ranges already loaded. It is kept in the shared cache, and
+    in process memory to save fetching it from the shared cache on every
+    request.
+
+    The snapshot is tagged with a version, which is replaced whenever an
+    offer, condition, benefit or range is saved or deleted (see
+    ``oscar.apps.offer.receivers``). Start and end dates are checked each
+    time the offers are returned, so offers that start or end don't require
+    the snapshot to be rebuilt.
+    """
+    version_cache_key = 'oscar_site_offers_version'
+    cache_key = 'oscar_site_offers'
+
+    # Process-local copy of the snapshot, as a (version, payload) tuple
+    _local = None
+
+    def get_queryset(self):
+        ConditionalOffer = get_model('offer', 'ConditionalOffer')
+        # Offers that haven't started yet are included, as they will become
+        # available without anything being saved.
+        return ConditionalOffer.objects.filter(
+            Q(end_datetime__gte=now()) | Q(end_datetime=None),
+            offer_type=ConditionalOffer.SITE,
+            status=ConditionalOffer.OPEN,
+        ).select_related(
+            'condition', 'benefit', 'condition__range', 'benefit__range')
+
+    def build(self):
+        """
+        Return the pickled offers of the snapshot
+        """
+        return pickle.dumps(list(self.get_queryset()), pickle.HIGHEST_PROTOCOL)
+
+    def get_payload(self, version):
+        local = SiteOfferSnapshot._local
+        if local is not None and local[0] == version:
+            return local[1]
+
+        entry = cache.get(self.cache_key)
+        if entry is None or entry[0] != version:
+            entry = (version, self.build())
+            cache.set(self.cache_key, entry, None)
+        SiteOfferSnapshot._local = entry
+        return entry[1]
+
+    def load_offers(self):
+        version = self.get_version()
+        if version is None:
+            return list(self.get_queryset())
+        return pickle.loads(self.get_payload(version))
+
+    def get_offers(self):
+        """
+        Return the site offers that are currently active, in priority order.
+
+        Every call returns new instances, as offers, conditions and benefits
+        store state while they are applied to a basket.
+        """
+        cutoff = now()
+        return [self.resolve(offer) for offer in self.load_offers()
+                if self.is_active(offer, cutoff)]
+
+    def get_next_change(self):
+        """
+        Return the next date at which a site offer starts or ends, or ``None``
+        if no such date is set.
+        """
+        cutoff = now()
+        dates = [date for offer in self.load_offers()
+                 for date in (offer.start_datetime, offer.end_datetime)
+                 if date and date > cutoff]
+        return min(dates, default=None)
+
+    def is_active(self, offer, cutoff):
+        if offer.start_datetime and offer.start_datetime > cutoff:
+            return False
+        if offer.end_datetime and offer.end_datetime < cutoff:
+            return False
+        return True
+
+    def resolve(self, offer):
+        """
+        Replace the offer's condition and benefit with their proxy instances,
+        keeping the already loaded ranges.
+        """
+        condition, benefit = offer.condition, offer.benefit
+        offer.condition = condition.proxy()
+        offer.condition.range = condition.range
+        offer.benefit = benefit.proxy()
+        offer.benefit.range = benefit.range
+        return offer
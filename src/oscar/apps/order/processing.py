@@ -3,6 +3,9 @@ from decimal import Decimal as D
 from django.utils.translation import gettext_lazy as _
 
 from oscar.apps.order import exceptions
+from oscar.core.loading import get_class
+
+deferred_stock_alerts = get_class('partner.alerts', 'deferred_stock_alerts')
 
 
 class EventHandler(object):
@@ -206,9 +209,10 @@ class EventHandler(object):
             lines = order.lines.all()
         if not line_quantities:
             line_quantities = [line.quantity for line in lines]
-        for line, qty in zip(lines, line_quantities):
-            if line.stockrecord:
-                line.stockrecord.consume_allocation(qty)
+        with deferred_stock_alerts():
+            for line, qty in zip(lines, line_quantities):
+                if line.stockrecord:
+                    line.stockrecord.consume_allocation(qty)
 
     def cancel_stock_allocations(self, order, lines=None, line_quantities=None):
         """
@@ -220,9 +224,10 @@ class EventHandler(object):
             lines = order.lines.all()
         if not line_quantities:
             line_quantities = [line.quantity for line in lines]
-        for line, qty in zip(lines, line_quantities):
-            if line.stockrecord:
-                line.stockrecord.cancel_allocation(qty)
+        with deferred_stock_alerts():
+            for line, qty in zip(lines, line_quantities):
+                if line.stockrecord:
+                    line.stockrecord.cancel_allocation(qty)
 
     # Model instance creation
     # -----------------------
@@ -13,14 +13,13 @@ Order = get_model('order', 'Order')
 class OrderReportCSVFormatter(ReportCSVFormatter):
     filename_template = 'orders-%s-to-%s.csv'
 
-    def generate_csv(self, response, orders):
-        writer = self.get_csv_writer(response)
+    def generate_rows(self, orders):
         header_row = [_('Order number'),
                       _('Name'),
                       _('Email'),
                       _('Total incl. tax'),
                       _('Date placed')]
-        writer.writerow(header_row)
+        yield header_row
         for order in orders:
             row = [
                 order.number,
@@ -28,7 +27,7 @@ class OrderReportCSVFormatter(ReportCSVFormatter):
                 order.email,
                 order.total_incl_tax,
                 self.format_datetime(order.date_placed)]
-            writer.writerow(row)
+            yield row
 
     def filename(self, **kwargs):
         return self.filename_template % (
@@ -50,6 +49,9 @@ class OrderReportGenerator(ReportGenerator):
         'HTML_formatter': OrderReportHTMLFormatter,
     }
 
+    def get_queryset(self):
+        return super().get_queryset().select_related('user')
+
     def generate(self):
         additional_data = {
             'start_date': self.start_date,
@@ -1,3 +1,4 @@
+from collections import defaultdict
 from decimal import Decimal as D
 
 from django.conf import settings
@@ -6,6 +7,7 @@ from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 
 from oscar.apps.order.signals import order_placed
+from oscar.apps.partner.exceptions import InsufficientStock
 from oscar.core.loading import get_class, get_model
 
 from . import exceptions
@@ -17,6 +19,7 @@ CommunicationEvent = get_model('order', 'CommunicationEvent')
 CommunicationEventType = get_model('communication', 'CommunicationEventType')
 Dispatcher = get_class('communication.utils', 'Dispatcher')
 Surcharge = get_model('order', 'Surcharge')
+StockRecord = get_model('partner', 'StockRecord')
 
 
 class OrderNumberGenerator(object):
@@ -38,6 +41,15 @@ class OrderCreator(object):
     """
     Places the order by writing out the various models
     """
+    #: Whether to lock the allocated stockrecords with
+    #: ``SELECT ... FOR UPDATE SKIP LOCKED`` and refuse to place orders that
+    #: would oversell them, raising ``UnableToPlaceOrder``. See
+    #: ``StockRecord.allocate_many``. Orders are also refused if another order
+    #: being placed at the same time holds the lock, even if there is enough
+    #: stock. Orders are placed after payment has been taken, so checkouts
+    #: that enable this need to void or refund the payment when the order is
+    #: refused.
+    skip_locked_stockrecords = False
 
     def place_order(self, basket, total,  # noqa (too complex (12))
                     shipping_method, shipping_charge, user=None,
@@ -66,9 +78,10 @@ class OrderCreator(object):
             order = self.create_order_model(
                 user, basket, shipping_address, shipping_method, shipping_charge,
                 billing_address, total, order_number, status, request, **kwargs)
-            for line in basket.all_lines():
+            lines = basket.all_lines()
+            for line in lines:
                 self.create_line_models(order, line)
-                self.update_stock_records(line)
+            self.allocate_stock(lines)
 
             for voucher in basket.vouchers.select_for_update():
                 if not voucher.is_active():  # basket ignores inactive vouchers
@@ -197,6 +210,28 @@ class OrderCreator(object):
 
         return order_line
 
+    def allocate_stock(self, lines):
+        """
+        Allocate stock for all lines of the order in one go
+        """
+        if type(self).update_stock_records is not OrderCreator.update_stock_records:
+            # Creators that override update_stock_records allocate stock
+            # line by line
+            for line in lines:
+                self.update_stock_records(line)
+            return
+
+        allocations = defaultdict(int)
+        for line in lines:
+            if line.stockrecord_id and line.product.get_product_class().track_stock:
+                allocations[line.stockrecord_id] += line.quantity
+        try:
+            StockRecord.allocate_many(allocations, skip_locked=self.skip_locked_stockrecords)
+        except InsufficientStock as e:
+            raise exceptions.UnableToPlaceOrder(_(
+                "The stock of some of the products in your basket couldn't be "
+                "reserved. Please try again.")) from e
+
     def update_stock_records(self, line):
         """
         Update any relevant stock records for this order line
@@ -1,13 +1,16 @@
 from django.db import models, router
-from django.db.models import F, signals
+from django.db.models import Case, F, Value, When, signals
 from django.db.models.functions import Coalesce, Least
 from django.utils.functional import cached_property
 from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 from django.utils.translation import pgettext_lazy
 
-from oscar.apps.partner.exceptions import InvalidStockAdjustment
+from oscar.apps.partner.exceptions import (
+    InsufficientStock, InvalidStockAdjustment)
+from oscar.apps.partner.signals import stockrecords_allocated
 from oscar.core.compat import AUTH_USER_MODEL
+from oscar.core.loading import get_class
 from oscar.core.utils import get_default_currency
 from oscar.models.fields import AutoSlugField
 
@@ -204,6 +207,49 @@ class AbstractStockRecord(models.Model):
 
     allocate.alters_data = True
 
+    @classmethod
+    def allocate_many(cls, allocations, skip_locked=False):
+        """
+        Record stock allocations for several stockrecords at once.
+
+        ``allocations`` maps stockrecord ids to the quantity to allocate. All
+        allocations are recorded with a single UPDATE statement, and the
+        low-stock alerts of the stockrecords are updated in one batch
+        afterwards (or with the current ``deferred_stock_alerts`` batch).
+        Unlike :py:meth:`.allocate`, no ``pre_save`` and ``post_save`` signals
+        are sent, but a single ``stockrecords_allocated`` signal, and stock
+        tracking isn't checked, so callers should only pass stockrecords of
+        products that track stock.
+
+        If ``skip_locked`` is set, the stockrecords are first locked with
+        ``SELECT ... FOR UPDATE SKIP LOCKED`` and
+        :py:class:`~oscar.apps.partner.exceptions.InsufficientStock` is raised
+        if any of them is locked by another transaction, or doesn't have
+        enough stock for its allocation. This must be called within a
+        transaction.
+        """
+        allocations = {pk: quantity for pk, quantity in allocations.items() if quantity}
+        if not allocations:
+            return
+
+        if skip_locked:
+            stockrecords = cls.objects.select_for_update(skip_locked=True).only(
+                'num_in_stock', 'num_allocated').in_bulk(allocations.keys())
+            for pk, quantity in allocations.items():
+                stockrecord = stockrecords.get(pk)
+                if stockrecord is None or stockrecord.net_stock_level < quantity:
+                    raise InsufficientStock(
+                        _('Insufficient stock for stock record %s') % pk)
+
+        cls.objects.filter(pk__in=allocations.keys()).update(
+            num_allocated=Coalesce(F('num_allocated'), 0) + Case(
+                *[When(pk=pk, then=Value(quantity)) for pk, quantity in allocations.items()],
+                output_field=models.IntegerField()))
+
+        defer_stock_alert_update = get_class('partner.alerts', 'defer_stock_alert_update')
+        defer_stock_alert_update(allocations.keys())
+        stockrecords_allocated.send(sender=cls, stockrecord_ids=list(allocations))
+
     def is_allocation_consumption_possible(self, quantity):
         """
         Test if a proposed stock consumption is permitted
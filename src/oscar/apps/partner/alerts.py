@@ -0,0 +1,128 @@
+import threading
+from contextlib import contextmanager
+
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Coalesce
+from django.utils.timezone import now
+
+from oscar.core.loading import get_model
+
+StockAlert = get_model('partner', 'StockAlert')
+StockRecord = get_model('partner', 'StockRecord')
+
+_local = threading.local()
+
+
+def get_below_threshold_stockrecords(stockrecord_ids):
+    """
+    Return a queryset of the passed stockrecords whose net stock level is
+    below their low-stock threshold.
+
+    This mirrors ``StockRecord.is_below_threshold`` in SQL.
+    """
+    return StockRecord.objects.filter(
+        pk__in=stockrecord_ids, low_stock_threshold__isnull=False,
+    ).annotate(
+        net_stock=Case(
+            When(num_in_stock__isnull=True, then=Value(0)),
+            default=F('num_in_stock') - Coalesce(F('num_allocated'), 0),
+            output_field=IntegerField()),
+    ).filter(net_stock__lt=F('low_stock_threshold'))
+
+
+def update_stock_alerts(stockrecord_ids):
+    """
+    Open and close low-stock alerts for the passed stockrecords with a few
+    set-based queries, rather than a few queries per stockrecord.
+
+    An alert is opened for each stockrecord that is below its threshold and
+    doesn't have an open alert yet, and the open alerts of all other passed
+    stockrecords are closed.
+    """
+    stockrecord_ids = list(stockrecord_ids)
+    if not stockrecord_ids:
+        return
+    below_threshold = get_below_threshold_stockrecords(stockrecord_ids)
+
+    StockAlert.objects.filter(
+        stockrecord_id__in=stockrecord_ids, status=StockAlert.OPEN,
+    ).exclude(
+        stockrecord_id__in=below_threshold.values('pk'),
+    ).update(status=StockAlert.CLOSED, date_closed=now())
+
+    to_open = below_threshold.exclude(
+        alerts__status=StockAlert.OPEN,
+    ).values_list('pk', 'low_stock_threshold')
+    StockAlert.objects.bulk_create([
+        StockAlert(stockrecord_id=pk, threshold=threshold)
+        for pk, threshold in to_open])
+
+
+class StockAlertBatch(object):
+    """
+    Collects the ids of stockrecords whose low-stock alerts need updating, and
+    updates them in chunks of ``chunk_size`` when flushed.
+    """
+    chunk_size = 500
+
+    def __init__(self):
+        self.stockrecord_ids = set()
+
+    def add(self, stockrecord_ids):
+        self.stockrecord_ids.update(stockrecord_ids)
+
+    def flush(self):
+        stockrecord_ids = sorted(self.stockrecord_ids)
+        self.stockrecord_ids = set()
+        for i in range(0, len(stockrecord_ids), self.chunk_size):
+            update_stock_alerts(stockrecord_ids[i:i + self.chunk_size])
+
+
+def get_current_batch():
+    """
+    Return the batch of the innermost ``deferred_stock_alerts`` block, or
+    ``None`` if alerts aren't being deferred.
+    """
+    return getattr(_local, 'batch', None)
+
+
+@contextmanager
+def deferred_stock_alerts():
+    """
+    Defer the low-stock alert updates of all stockrecords saved within the
+    block, and update them in one batch afterwards.
+
+    Use this around code that saves or allocates many stockrecords, like
+    stock feeds::
+
+        with transaction.atomic(), deferred_stock_alerts():
+            for stockrecord in stockrecords:
+                stockrecord.save()
+
+    The batch is flushed when the outermost block exits, so that the alerts
+    are written in the same transaction as the stockrecords when the block is
+    used within one.
+    """
+    batch = get_current_batch()
+    if batch is not None:
+        yield batch
+        return
+
+    batch = _local.batch = StockAlertBatch()
+    try:
+        yield batch
+    finally:
+        _local.batch = None
+    batch.flush()
+
+
+def defer_stock_alert_update(stockrecord_ids):
+    """
+    Update the low-stock alerts of the passed stockrecords with the current
+    batch, or straight away if alerts aren't being deferred.
+    """
+    batch = get_current_batch()
+    if batch is None:
+        update_stock_alerts(stockrecord_ids)
+    else:
+        batch.add(stockrecord_ids)
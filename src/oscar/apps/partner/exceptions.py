@@ -4,3 +4,7 @@ class ImportingError(Exception):
 
 class InvalidStockAdjustment(Exception):
     pass
+
+
+class InsufficientStock(InvalidStockAdjustment):
+    pass
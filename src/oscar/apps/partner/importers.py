@@ -1,11 +1,15 @@
 import csv
 import os
+import time
 from decimal import Decimal as D
+from itertools import islice
 
 from django.db.transaction import atomic
+from django.utils.timezone import now
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.loading import get_class, get_model
+from oscar.core.utils import slugify
 
 ImportingError = get_class('partner.exceptions', 'ImportingError')
 
@@ -17,6 +21,9 @@ ProductClass = get_model('catalogue', 'ProductClass')
 StockRecord = get_model('partner', 'StockRecord')
 
 create_from_breadcrumbs = get_class('catalogue.categories', 'create_from_breadcrumbs')
+RangeMembershipIndex = get_class('offer.membership', 'RangeMembershipIndex')
+defer_stock_alert_update = get_class('partner.alerts', 'defer_stock_alert_update')
+deferred_stock_alerts = get_class('partner.alerts', 'deferred_stock_alerts')
 
 
 class CatalogueImporter(object):
@@ -55,7 +62,7 @@ class CatalogueImporter(object):
         stats = {'new_items': 0,
                  'updated_items': 0}
         row_number = 0
-        with open(file_path, 'rt') as f:
+        with open(file_path, 'rt') as f, deferred_stock_alerts():
             reader = csv.reader(f, escapechar='\\')
             for row in reader:
                 row_number += 1
@@ -118,6 +125,154 @@ class CatalogueImporter(object):
         stock.save()
 
 
+class BulkCatalogueImporter(CatalogueImporter):
+    """
+    CSV product importer for large files.
+
+    Reads the same format as ``CatalogueImporter``, but streams the file in
+    batches of ``batch_size`` rows. Each batch is written in its own
+    transaction, using a few bulk queries for the products, stock records
+    and product categories. Product classes, categories and partners are
+    cached while importing.
+
+    As ``save()`` isn't called, no ``post_save`` signals are sent for the
+    imported objects (e.g. for search indexing). The low-stock alerts of
+    updated stock records are updated once per batch.
+    """
+
+    def __init__(self, logger, delimiter=",", flush=False, batch_size=1000):
+        super().__init__(logger, delimiter, flush)
+        self.batch_size = batch_size
+        self._product_classes = {}
+        self._categories = {}
+        self._partners = {}
+
+    def _import(self, file_path):
+        """Imports given file"""
+        stats = {'new_items': 0,
+                 'updated_items': 0}
+        row_number = 0
+        started = time.monotonic()
+        with open(file_path, 'rt') as f:
+            reader = csv.reader(f, escapechar='\\')
+            while True:
+                rows = list(islice(reader, self.batch_size))
+                if not rows:
+                    break
+                self._import_batch(row_number, rows, stats)
+                row_number += len(rows)
+                elapsed = time.monotonic() - started
+                self.logger.info(
+                    "Imported %d rows (%d rows per second)",
+                    row_number, row_number / elapsed if elapsed else row_number)
+        # Products were added without sending signals
+        RangeMembershipIndex.invalidate_all_ranges()
+        msg = "New items: %d, updated items: %d" % (stats['new_items'],
+                                                    stats['updated_items'])
+        self.logger.info(msg)
+
+    @atomic
+    def _import_batch(self, row_number, rows, stats):
+        items = {}
+        for row_number, row in enumerate(rows, start=row_number + 1):
+            if len(row) != 5 and len(row) != 9:
+                self.logger.error("Row number %d has an invalid number of fields"
+                                  " (%d), skipping..." % (row_number, len(row)))
+                continue
+            upc = row[2]
+            if upc in items:
+                # Later rows update the product of earlier ones
+                stats['updated_items'] += 1
+            items[upc] = row
+
+        products = self._save_products(items, stats)
+        self._save_product_categories(items, products)
+        self._save_stockrecords(items, products)
+
+    def _get_product_class(self, name):
+        if name not in self._product_classes:
+            self._product_classes[name], __ = ProductClass.objects.get_or_create(name=name)
+        return self._product_classes[name]
+
+    def _get_category(self, category_str):
+        if category_str not in self._categories:
+            self._categories[category_str] = create_from_breadcrumbs(category_str)
+        return self._categories[category_str]
+
+    def _get_partner(self, name):
+        if name not in self._partners:
+            self._partners[name], __ = Partner.objects.get_or_create(name=name)
+        return self._partners[name]
+
+    def _save_products(self, items, stats):
+        """
+        Create or update the products of a batch, and return them keyed by UPC
+        """
+        products = Product.objects.in_bulk(list(items), field_name='upc')
+        new_products, updated_products = [], []
+        for upc, row in items.items():
+            product_class, __, __, title, description = row[:5]
+            product = products.get(upc)
+            if product is None:
+                product = Product(upc=upc)
+                new_products.append(product)
+                stats['new_items'] += 1
+            else:
+                updated_products.append(product)
+                stats['updated_items'] += 1
+            product.title = title
+            # Ignore any entries that are NULL
+            product.description = '' if description == 'NULL' else description
+            product.product_class = self._get_product_class(product_class)
+            product.date_updated = now()
+            if not product.slug:
+                product.slug = slugify(product.get_title())
+
+        Product.objects.bulk_update(
+            updated_products, ['title', 'description', 'product_class', 'date_updated'])
+        Product.objects.bulk_create(new_products)
+        if new_products:
+            # Not all databases return the ids of created objects
+            products.update(Product.objects.in_bulk(
+                [product.upc for product in new_products], field_name='upc'))
+        return products
+
+    def _save_product_categories(self, items, products):
+        links = {(products[upc].id, self._get_category(row[1]).id) for upc, row in items.items()}
+        existing = set(ProductCategory.objects.filter(
+            product_id__in={product_id for product_id, __ in links}
+        ).values_list('product_id', 'category_id'))
+        ProductCategory.objects.bulk_create([
+            ProductCategory(product_id=product_id, category_id=category_id)
+            for product_id, category_id in sorted(links - existing)])
+
+    def _save_stockrecords(self, items, products):
+        rows = {row[6]: (upc, row[5:9]) for upc, row in items.items() if len(row) == 9}
+        stockrecords = {}
+        for stock in StockRecord.objects.filter(partner_sku__in=list(rows)):
+            stockrecords.setdefault(stock.partner_sku, stock)
+
+        new_stockrecords, updated_stockrecords = [], []
+        for partner_sku, (upc, (partner_name, __, price, num_in_stock)) in rows.items():
+            stock = stockrecords.get(partner_sku)
+            if stock is None:
+                stock = StockRecord(partner_sku=partner_sku)
+                new_stockrecords.append(stock)
+            else:
+                updated_stockrecords.append(stock)
+            stock.product = products[upc]
+            stock.partner = self._get_partner(partner_name)
+            stock.price = D(price)
+            stock.num_in_stock = num_in_stock
+            stock.date_updated = now()
+
+        StockRecord.objects.bulk_update(
+            updated_stockrecords,
+            ['product', 'partner', 'price', 'num_in_stock', 'date_updated'])
+        StockRecord.objects.bulk_create(new_stockrecords)
+        defer_stock_alert_update([stock.pk for stock in updated_stockrecords])
+
+
 class Validator(object):
 
     def validate(self, file_path):
@@ -1,11 +1,13 @@
 from django.db.models.signals import post_save
 from django.dispatch import receiver
 
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 
 StockAlert = get_model('partner', 'StockAlert')
 StockRecord = get_model('partner', 'StockRecord')
 
+get_current_batch = get_class('partner.alerts', 'get_current_batch')
+
 
 @receiver(post_save, sender=StockRecord)
 def update_stock_alerts(sender, instance, created, **kwargs):
@@ -14,6 +16,11 @@ def update_stock_alerts(sender, instance, created, **kwargs):
     """
     if created or kwargs.get('raw', False):
         return
+    batch = get_current_batch()
+    if batch is not None:
+        # Within deferred_stock_alerts, alerts are updated in one batch later
+        batch.add([instance.pk])
+        return
     stockrecord = instance
     try:
         alert = StockAlert.objects.get(stockrecord=stockrecord,
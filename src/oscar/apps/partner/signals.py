@@ -0,0 +1,3 @@
+import django.dispatch
+
+stockrecords_allocated = django.dispatch.Signal()
@@ -1,7 +1,9 @@
 from collections import namedtuple
 from decimal import Decimal as D
 
-from oscar.core.loading import get_class
+from django.db.models import prefetch_related_objects
+
+from oscar.core.loading import get_class, get_model
 
 Unavailable = get_class('partner.availability', 'Unavailable')
 Available = get_class('partner.availability', 'Available')
@@ -90,6 +92,23 @@ class Base(object):
             "information."
         )
 
+    def fetch_for_products(self, products):
+        """
+        Given an iterable of products, return a dictionary mapping each
+        product's primary key to its ``PurchaseInfo`` instance.
+
+        This is used by the browse views to determine prices and availability
+        for a whole page of products in one pass. Parent products are handled
+        by ``fetch_for_parent``, all other products by ``fetch_for_product``.
+        """
+        purchase_info = {}
+        for product in products:
+            if product.is_parent:
+                purchase_info[product.pk] = self.fetch_for_parent(product)
+            else:
+                purchase_info[product.pk] = self.fetch_for_product(product)
+        return purchase_info
+
     def fetch_for_line(self, line, stockrecord=None):
         """
         Given a basket line instance, fetch a ``PurchaseInfo`` instance.
@@ -137,6 +156,41 @@ class Structured(Base):
                 product, children_stock),
             stockrecord=None)
 
+    def fetch_for_products(self, products):
+        products = list(products)
+        self.prefetch_for_products(products)
+        return super().fetch_for_products(products)
+
+    def prefetch_for_products(self, products):
+        """
+        Load the data needed to select stockrecords for the passed products
+        with a fixed number of queries, rather than a few per product.
+
+        The public children of parent products are fetched in a single query
+        and cached on their parent, and the stockrecords of all products that
+        don't have them prefetched already are loaded in another one.
+        """
+        Product = get_model('catalogue', 'Product')
+        parents = {product.pk: product for product in products if product.is_parent}
+        children = []
+        if parents:
+            for parent in parents.values():
+                parent._public_children = []
+            for child in Product.objects.public().filter(parent__in=parents.keys()):
+                parent = parents[child.parent_id]
+                child.parent = parent
+                parent._public_children.append(child)
+                children.append(child)
+
+        # Products coming from ProductQuerySet.base_queryset already have
+        # their stockrecords prefetched
+        to_prefetch = [
+            product for product in products + children
+            if not product.is_parent
+            and 'stockrecords' not in getattr(product, '_prefetched_objects_cache', {})]
+        if to_prefetch:
+            prefetch_related_objects(to_prefetch, 'stockrecords')
+
     def select_stockrecord(self, product):
         """
         Select the appropriate stockrecord
@@ -150,7 +204,11 @@ class Structured(Base):
         Select appropriate stock record for all children of a product
         """
         records = []
-        for child in product.children.public():
+        # Use the children cached by prefetch_for_products, if any
+        children = getattr(product, '_public_children', None)
+        if children is None:
+            children = product.children.public()
+        for child in children:
             # Use tuples of (child product, stockrecord)
             records.append((child, self.select_stockrecord(child)))
         return records
@@ -0,0 +1,33 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class AbstractProductIndexUpdate(models.Model):
+    """
+    A product whose search index document needs to be updated.
+
+    Entries are added when something that ends up in the index changes, like
+    the stock or the categories of a product, and are removed once the
+    ``oscar_update_search_index`` command has reindexed the product. There
+    can be several entries for the same product, which are handled at once.
+    """
+    # Without a database constraint, so that the entries of deleted products
+    # are kept, and they can be removed from the index as well. Only the id
+    # of the product is used.
+    product = models.ForeignKey(
+        'catalogue.Product',
+        on_delete=models.DO_NOTHING,
+        db_constraint=False,
+        related_name='+',
+        verbose_name=_("Product"))
+    date_created = models.DateTimeField(_("Date created"), auto_now_add=True)
+
+    class Meta:
+        abstract = True
+        app_label = 'search'
+        ordering = ['pk']
+        verbose_name = _("Product index update")
+        verbose_name_plural = _("Product index updates")
+
+    def __str__(self):
+        return _("Index update for product #%d") % self.product_id
@@ -1,3 +1,4 @@
+from django.core import checks
 from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
@@ -13,6 +14,11 @@ class SearchConfig(OscarConfig):
     namespace = 'search'
 
     def ready(self):
+        from . import receivers  # noqa
+        from .checks import check_index_command_order
+
+        checks.register(check_index_command_order)
+
         self.search_view = get_class('search.views', 'FacetedSearchView')
 
         self.search_form = get_class('search.forms', 'SearchForm')
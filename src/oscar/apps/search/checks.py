@@ -0,0 +1,21 @@
+from django.apps import apps
+from django.core import checks
+
+
+def check_index_command_order(app_configs, **kwargs):
+    """
+    Warn if Haystack is installed before Oscar. Django then runs Haystack's
+    ``update_index`` and ``clear_index`` commands instead of Oscar's, which
+    invalidate the cached facets of searches once the index has changed.
+    """
+    names = [app_config.name for app_config in apps.get_app_configs()]
+    if 'haystack' not in names or 'oscar' not in names:
+        return []
+    if names.index('haystack') > names.index('oscar'):
+        return []
+    return [checks.Warning(
+        "'haystack' is listed before 'oscar.config.Shop' in INSTALLED_APPS.",
+        hint="The update_index, clear_index and rebuild_index management commands then don't invalidate "
+             "the cached facets of searches. List 'oscar.config.Shop' before 'haystack'.",
+        id='oscar.search.W001',
+    )]
@@ -1,7 +1,12 @@
+import hashlib
+
 from django.conf import settings
+from django.core.cache import cache
 from haystack.query import SearchQuerySet
 from purl import URL
 
+from oscar.core.cache import VersionedCache
+
 
 def base_sqs():
     """
@@ -17,6 +22,47 @@ def base_sqs():
     return sqs
 
 
+class FacetCountCache(VersionedCache):
+    """
+    Cache of facet counts, keyed by the parameters of the search.
+
+    All entries are tagged with a global version, which is replaced whenever
+    products, or anything else that is counted, change (see
+    ``oscar.apps.search.receivers``). Entries with an outdated version are
+    ignored.
+    """
+    version_cache_key = 'oscar_facet_counts_version'
+    cache_key_template = 'oscar_facet_counts_%s'
+    timeout = 24 * 60 * 60
+
+    def get_cache_key(self, params):
+        key = '%s:%r' % (self.get_version(), params)
+        return self.cache_key_template % hashlib.md5(key.encode('utf8')).hexdigest()
+
+    def get(self, params):
+        """
+        Return the cached facet counts for the passed search parameters, or
+        ``None`` if they aren't cached
+        """
+        return cache.get(self.get_cache_key(params))
+
+    def set(self, params, facet_counts):
+        cache.set(self.get_cache_key(params), facet_counts, self.timeout)
+
+
+class SearchIndexFacetCache(FacetCountCache):
+    """
+    Cache of the facet counts and facet data of searches run on the search
+    index.
+
+    Entries are tagged with the version of the index, which is replaced
+    whenever the index is updated (see ``ProductIndex`` and
+    ``ProductIndexUpdater``).
+    """
+    version_cache_key = 'oscar_search_index_version'
+    cache_key_template = 'oscar_search_facets_%s'
+
+
 class FacetMunger(object):
 
     def __init__(self, path, selected_multi_facets, facet_counts):
@@ -0,0 +1,82 @@
+from django.conf import settings
+from haystack import connections
+from haystack.constants import DEFAULT_ALIAS
+
+from oscar.core.loading import get_class, get_model
+
+Product = get_model('catalogue', 'Product')
+ProductIndexUpdate = get_model('search', 'ProductIndexUpdate')
+SearchIndexFacetCache = get_class('search.facets', 'SearchIndexFacetCache')
+
+
+def queue_product_index_updates(product_ids):
+    """
+    Queue the passed products to be updated in the search index, if
+    ``OSCAR_QUEUE_SEARCH_INDEX_UPDATES`` is enabled.
+    """
+    if not settings.OSCAR_QUEUE_SEARCH_INDEX_UPDATES:
+        return
+    ProductIndexUpdate.objects.bulk_create(
+        [ProductIndexUpdate(product_id=pk) for pk in set(product_ids) if pk is not None],
+        batch_size=1000)
+
+
+class ProductIndexUpdater(object):
+    """
+    Updates the search index documents of the queued products.
+
+    The queue is processed in batches of ``batch_size`` entries. Entries for
+    the same product are coalesced, child products are reindexed through
+    their parent, and products that are no longer indexed (e.g. because they
+    were deleted or aren't public anymore) are removed from the index.
+    """
+    batch_size = 500
+
+    def __init__(self, using=DEFAULT_ALIAS, batch_size=None):
+        self.backend = connections[using].get_backend()
+        self.index = connections[using].get_unified_index().get_index(Product)
+        self.using = using
+        if batch_size:
+            self.batch_size = batch_size
+
+    def update(self):
+        """
+        Process the queue until it's empty, and return the number of products
+        that were updated
+        """
+        num_products = 0
+        while True:
+            num_updated = self.update_batch()
+            if num_updated is None:
+                return num_products
+            num_products += num_updated
+
+    def update_batch(self):
+        """
+        Update the products of the oldest queued entries, and return their
+        number, or ``None`` if the queue is empty
+        """
+        entries = list(ProductIndexUpdate.objects.order_by('pk').values_list(
+            'pk', 'product_id')[:self.batch_size])
+        if not entries:
+            return None
+        product_ids = {product_id for pk, product_id in entries}
+        self.update_products(product_ids)
+
+        # Entries queued while the batch was processed are kept, as they may
+        # have been added after the products were read
+        ProductIndexUpdate.objects.filter(
+            pk__lte=entries[-1][0], product_id__in=product_ids).delete()
+        return len(product_ids)
+
+    def update_products(self, product_ids):
+        children = dict(Product.objects.filter(
+            pk__in=product_ids, parent__isnull=False).values_list('pk', 'parent_id'))
+        product_ids = set(product_ids) - set(children) | set(children.values())
+
+        products = list(self.index.index_queryset(using=self.using).filter(pk__in=product_ids))
+        if products:
+            self.backend.update(self.index, products)
+        for pk in product_ids - {product.pk for product in products}:
+            self.backend.remove('%s.%s' % (Product._meta.label_lower, pk))
+        SearchIndexFacetCache.invalidate()
@@ -0,0 +1,30 @@
+# Generated by Django 3.2.25 on 2026-10-17 09:40
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+        ('catalogue', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProductIndexUpdate',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('date_created', models.DateTimeField(auto_now_add=True, verbose_name='Date created')),
+                ('product', models.ForeignKey(db_constraint=False, on_delete=django.db.models.deletion.DO_NOTHING, related_name='+', to='catalogue.product', verbose_name='Product')),
+            ],
+            options={
+                'verbose_name': 'Product index update',
+                'verbose_name_plural': 'Product index updates',
+                'ordering': ['pk'],
+                'abstract': False,
+            },
+        ),
+    ]
@@ -0,0 +1,11 @@
+from oscar.apps.search.abstract_models import AbstractProductIndexUpdate
+from oscar.core.loading import is_model_registered
+
+__all__ = []
+
+
+if not is_model_registered('search', 'ProductIndexUpdate'):
+    class ProductIndexUpdate(AbstractProductIndexUpdate):
+        pass
+
+    __all__.append('ProductIndexUpdate')
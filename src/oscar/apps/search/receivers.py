@@ -0,0 +1,142 @@
+from django.db.models.signals import (
+    m2m_changed, post_delete, post_save, pre_delete, pre_save)
+
+from oscar.apps.catalogue.signals import category_moved
+from oscar.apps.partner.signals import stockrecords_allocated
+from oscar.core.loading import get_class, get_model, is_model_registered
+
+Product = get_model('catalogue', 'Product')
+ProductAttributeValue = get_model('catalogue', 'ProductAttributeValue')
+ProductClass = get_model('catalogue', 'ProductClass')
+Category = get_model('catalogue', 'Category')
+ProductCategory = get_model('catalogue', 'ProductCategory')
+ProductReview = get_model('reviews', 'ProductReview')
+StockRecord = get_model('partner', 'StockRecord')
+FacetCountCache = get_class('search.facets', 'FacetCountCache')
+
+
+def queue_product(sender, instance, **kwargs):
+    """
+    Queue the product itself, or the product of a stockrecord, product
+    category or review, to be updated in the search index. Child products
+    are queued along with their parent, as a deleted child can't be mapped
+    to its parent anymore once it's been deleted.
+    """
+    if kwargs.get('raw', False):
+        return
+    if isinstance(instance, Product):
+        queue_product_index_updates([instance.pk, instance.parent_id])
+    else:
+        queue_product_index_updates([instance.product_id])
+
+
+def queue_category_products(sender, instance, **kwargs):
+    """
+    Queue the products of a category and its descendants, whose full
+    category names are indexed
+    """
+    if kwargs.get('raw', False):
+        return
+    categories = instance.get_descendants_and_self()
+    queue_product_index_updates(
+        ProductCategory.objects.filter(category__in=categories).values_list('product_id', flat=True))
+
+
+def queue_changed_product_categories(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Queue the products whose categories were changed through the
+    ``Product.categories`` relation
+    """
+    if action not in ('post_add', 'post_remove', 'pre_clear'):
+        return
+    if not reverse:
+        queue_product_index_updates([instance.pk])
+    elif pk_set is not None:
+        queue_product_index_updates(pk_set)
+    else:
+        # The category is cleared, which only sends the signal before the
+        # products are removed
+        queue_product_index_updates(instance.product_set.values_list('pk', flat=True))
+
+
+def queue_allocated_products(sender, stockrecord_ids, **kwargs):
+    """
+    Queue the products of stockrecords whose stock was allocated in bulk
+    """
+    queue_product_index_updates(
+        StockRecord.objects.filter(pk__in=stockrecord_ids).values_list('product_id', flat=True))
+
+
+# Forked search apps that were created before the queue was added might not
+# have the ProductIndexUpdate model, in which case nothing is queued
+if is_model_registered('search', 'ProductIndexUpdate'):
+    queue_product_index_updates = get_class('search.indexing', 'queue_product_index_updates')
+
+    for sender in [Product, ProductCategory, ProductReview, StockRecord]:
+        post_save.connect(queue_product, sender=sender)
+    # Products are queued before they're deleted, along with their parent
+    pre_delete.connect(queue_product, sender=Product)
+    for sender in [ProductCategory, ProductReview, StockRecord]:
+        post_delete.connect(queue_product, sender=sender)
+
+    post_save.connect(queue_category_products, sender=Category)
+    category_moved.connect(queue_category_products, sender=Category)
+
+    m2m_changed.connect(queue_changed_product_categories, sender=Product.categories.through)
+
+    stockrecords_allocated.connect(queue_allocated_products, sender=StockRecord)
+
+
+# The fields of products and stockrecords that the facet counts depend on,
+# as they are searched, filtered or counted by the database search handler.
+# Other changes, like stock allocations, leave the cached counts alone.
+COUNTED_FIELDS = {
+    Product: ['structure', 'parent_id', 'is_public', 'product_class_id', 'rating',
+              'title', 'upc', 'description'],
+    StockRecord: ['product_id', 'price'],
+}
+
+
+def store_counted_fields_changed(sender, instance, **kwargs):
+    """
+    Check whether any of the counted fields of a product or stockrecord are
+    about to change, by comparing them with the saved values
+    """
+    fields = COUNTED_FIELDS[sender]
+    update_fields = kwargs.get('update_fields')
+    if update_fields is not None:
+        fields = [field for field in fields
+                  if field in update_fields or sender._meta.get_field(field).name in update_fields]
+    if not fields:
+        instance._counted_fields_changed = False
+    elif kwargs.get('raw', False) or instance.pk is None:
+        instance._counted_fields_changed = True
+    else:
+        saved = sender.objects.filter(pk=instance.pk).values(*fields).first()
+        instance._counted_fields_changed = saved is None or any(
+            sender._meta.get_field(field).get_prep_value(saved[field])
+            != sender._meta.get_field(field).get_prep_value(getattr(instance, field))
+            for field in fields)
+
+
+def invalidate_facet_counts(sender, **kwargs):
+    """
+    Mark the cached facet counts as stale when anything that is counted has
+    changed
+    """
+    instance = kwargs.get('instance')
+    if not instance.__dict__.pop('_counted_fields_changed', True):
+        return
+    if kwargs.get('action', 'post_').startswith('post_'):
+        FacetCountCache.invalidate()
+
+
+for sender in COUNTED_FIELDS:
+    pre_save.connect(store_counted_fields_changed, sender=sender)
+
+for sender in [Product, ProductAttributeValue, ProductClass, ProductCategory, Category, StockRecord]:
+    post_save.connect(invalidate_facet_counts, sender=sender)
+    post_delete.connect(invalidate_facet_counts, sender=sender)
+
+m2m_changed.connect(invalidate_facet_counts, sender=Product.categories.through)
+category_moved.connect(invalidate_facet_counts, sender=Category)
@@ -1,3 +1,5 @@
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
 from django.core.paginator import InvalidPage, Paginator
 from haystack import connections
 
@@ -6,6 +8,7 @@ from oscar.core.loading import get_class
 from . import facets
 
 FacetMunger = get_class('search.facets', 'FacetMunger')
+SearchIndexFacetCache = get_class('search.facets', 'SearchIndexFacetCache')
 
 
 class SearchResultsPaginationMixin:
@@ -63,10 +66,18 @@ class SearchHandler(SearchResultsPaginationMixin):
 
         You need to catch an InvalidPage exception which gets thrown when an
         invalid page number is supplied.
+
+    Caching:
+
+        The facet counts and facet data are cached with
+        ``facet_cache_class``, keyed by the search query, the selected facets
+        and the version of the search index. When the facet counts are cached,
+        the search is run without facets.
     """
 
     form_class = None
     model_whitelist = None
+    facet_cache_class = SearchIndexFacetCache
 
     def __init__(self, request_data, full_path):
         self.full_path = full_path
@@ -77,6 +88,10 @@ class SearchHandler(SearchResultsPaginationMixin):
         self.search_form = self.get_search_form(
             request_data, search_queryset)
         self.results = self.get_search_results(self.search_form)
+        self.facet_cache = self.facet_cache_class()
+        self.facet_counts = self.facet_cache.get(self.get_facet_cache_params())
+        if self.facet_counts is not None:
+            self.results = self.remove_facets(self.results)
         # If below raises an UnicodeDecodeError, you're running pysolr < 3.2
         # with Solr 4.
         self.paginator, self.page = self.paginate_queryset(self.results, self.paginate_by)[0:2]
@@ -112,6 +127,39 @@ class SearchHandler(SearchResultsPaginationMixin):
             sqs = sqs.models(*self.model_whitelist)
         return sqs
 
+    def remove_facets(self, search_queryset):
+        """
+        Return a clone of the search queryset that doesn't compute facets
+        """
+        clone = search_queryset._clone()
+        clone.query.facets = {}
+        clone.query.date_facets = {}
+        clone.query.query_facets = []
+        return clone
+
+    def get_facet_cache_params(self):
+        """
+        Return the parameters that determine the facet counts: the normalised
+        query, the narrowing queries of the selected facets and categories, and
+        the searched models
+        """
+        query = self.results.query
+        return (
+            ' '.join(query.build_query().split()),
+            sorted(query.narrow_queries),
+            sorted(model._meta.label_lower for model in query.models))
+
+    def get_normalised_path(self):
+        """
+        Return the full path without the page number and with sorted query
+        parameters, as the facet data doesn't depend on either
+        """
+        url = urlsplit(self.full_path)
+        params = sorted(
+            (key, value) for key, value in parse_qsl(url.query, keep_blank_values=True)
+            if key != self.page_kwarg)
+        return '%s?%s' % (url.path, urlencode(params))
+
     # Accessing the search results and meta data
 
     def bulk_fetch_results(self, paginated_results):
@@ -165,11 +213,32 @@ class SearchHandler(SearchResultsPaginationMixin):
             self._objects = self.bulk_fetch_results(paginated_results)
         return self._objects
 
+    def get_facet_counts(self):
+        if self.facet_counts is None:
+            self.facet_counts = self.results.facet_counts()
+            # Don't cache the empty facet counts returned when the search
+            # backend isn't available
+            if self.facet_counts:
+                self.facet_cache.set(self.get_facet_cache_params(), self.facet_counts)
+        return self.facet_counts
+
     def get_facet_munger(self):
         return FacetMunger(
             self.full_path,
             self.search_form.selected_multi_facets,
-            self.results.facet_counts())
+            self.get_facet_counts())
+
+    def get_facet_data(self):
+        """
+        Return the facet data of the FacetMunger, which is cached per path
+        """
+        params = ('facet_data', self.get_facet_cache_params(), self.get_normalised_path())
+        facet_data = self.facet_cache.get(params)
+        if facet_data is None:
+            facet_data = self.get_facet_munger().facet_data()
+            if facet_data:
+                self.facet_cache.set(params, facet_data)
+        return facet_data
 
     def get_search_context_data(self, context_object_name=None):
         """
@@ -192,8 +261,7 @@ class SearchHandler(SearchResultsPaginationMixin):
         # Note that the FacetMunger accesses object_list (unpaginated results),
         # whereas we use the paginated search results to populate the context
         # with products
-        munger = self.get_facet_munger()
-        facet_data = munger.facet_data()
+        facet_data = self.get_facet_data()
         has_facets = any([data['results'] for data in facet_data.values()])
 
         context = {
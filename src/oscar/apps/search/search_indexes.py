@@ -1,9 +1,11 @@
+from django.db.models import Prefetch
 from haystack import indexes
 
 from oscar.core.loading import get_class, get_model
 
 # Load default strategy (without a user/request)
 is_solr_supported = get_class('search.features', 'is_solr_supported')
+SearchIndexFacetCache = get_class('search.facets', 'SearchIndexFacetCache')
 Selector = get_class('partner.strategy', 'Selector')
 
 
@@ -36,8 +38,18 @@ class ProductIndex(indexes.SearchIndex, indexes.Indexable):
         return get_model('catalogue', 'Product')
 
     def index_queryset(self, using=None):
-        # Only index browsable products (not each individual child product)
-        return self.get_model().objects.browsable().order_by('-date_updated')
+        # Only index browsable products (not each individual child product).
+        # Haystack indexes the queryset in batches, and the related objects
+        # needed to prepare the products are prefetched for each batch, so
+        # that preparing a product doesn't need any further queries.
+        Product = self.get_model()
+        Category = get_model('catalogue', 'Category')
+        return Product.objects.browsable().select_related('product_class').prefetch_related(
+            Prefetch('categories', queryset=Category.objects.annotate_paths()),
+            Prefetch('children', queryset=Product.objects.public().prefetch_related('stockrecords'),
+                     to_attr='_public_children'),
+            'stockrecords',
+        ).order_by('-date_updated')
 
     def read_queryset(self, using=None):
         return self.get_model().objects.browsable().base_queryset()
@@ -63,30 +75,51 @@ class ProductIndex(indexes.SearchIndex, indexes.Indexable):
             self._strategy = Selector().strategy()
         return self._strategy
 
-    def prepare_price(self, obj):
+    def fetch_purchase_info(self, obj):
+        """
+        Return the purchase info of the product, or ``None`` if it doesn't
+        have any stockrecords.
+
+        The result is kept on the product, so that it's only fetched once for
+        both the price and the stock level.
+        """
+        try:
+            return obj._index_purchase_info
+        except AttributeError:
+            pass
+
         strategy = self.get_strategy()
         result = None
         if obj.is_parent:
             result = strategy.fetch_for_parent(obj)
-        elif obj.has_stockrecords:
+        # Use the prefetched stockrecords rather than has_stockrecords
+        elif obj.stockrecords.all():
             result = strategy.fetch_for_product(obj)
+        obj._index_purchase_info = result
+        return result
 
+    def prepare_price(self, obj):
+        result = self.fetch_purchase_info(obj)
         if result:
             if result.price.is_tax_known:
                 return result.price.incl_tax
             return result.price.excl_tax
 
     def prepare_num_in_stock(self, obj):
-        strategy = self.get_strategy()
         if obj.is_parent:
             # Don't return a stock level for parent products
             return None
-        elif obj.has_stockrecords:
-            result = strategy.fetch_for_product(obj)
+        result = self.fetch_purchase_info(obj)
+        if result:
             return result.stockrecord.net_stock_level
 
     def prepare(self, obj):
-        prepared_data = super().prepare(obj)
+        try:
+            prepared_data = super().prepare(obj)
+        finally:
+            # Don't keep the purchase info around on products that are
+            # updated in the index again later on
+            obj.__dict__.pop('_index_purchase_info', None)
 
         # We use Haystack's dynamic fields to ensure that the title field used
         # for sorting is of type "string'.
@@ -98,6 +131,26 @@ class ProductIndex(indexes.SearchIndex, indexes.Indexable):
 
         return prepared_data
 
+    # The cached facets of searches are invalidated whenever the index is
+    # updated through the index. Haystack's management commands write to the
+    # backend directly, and are wrapped by Oscar's commands of the same name.
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        SearchIndexFacetCache.invalidate()
+
+    def update_object(self, *args, **kwargs):
+        super().update_object(*args, **kwargs)
+        SearchIndexFacetCache.invalidate()
+
+    def remove_object(self, *args, **kwargs):
+        super().remove_object(*args, **kwargs)
+        SearchIndexFacetCache.invalidate()
+
+    def clear(self, *args, **kwargs):
+        super().clear(*args, **kwargs)
+        SearchIndexFacetCache.invalidate()
+
     def get_updated_field(self):
         """
         Used to specify the field used to determine if an object has been
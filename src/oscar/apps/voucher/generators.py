@@ -0,0 +1,128 @@
+import logging
+
+from django.db import transaction
+
+from oscar.apps.voucher.utils import get_unused_codes
+from oscar.core.loading import get_model
+
+Voucher = get_model('voucher', 'Voucher')
+
+logger = logging.getLogger('oscar.voucher')
+
+
+class VoucherSetGenerator(object):
+    """
+    Creates and updates the vouchers of a voucher set in batches.
+
+    For each batch of ``batch_size`` vouchers, the codes are generated with
+    one query to avoid collisions (see
+    :py:func:`~oscar.apps.voucher.utils.get_unused_codes`), and the vouchers
+    and their offers are inserted with ``bulk_create``. Each batch is written
+    in its own transaction, unless the generator is run inside one. Progress
+    is logged after each batch, and passed to the optional ``progress``
+    callable as the number of vouchers done and the total.
+
+    ``usage`` and ``offers`` default to those of the first voucher already in
+    the set.
+
+    As ``save()`` isn't called, no signals are sent for the vouchers.
+    """
+
+    #: The number of vouchers written per batch
+    batch_size = 1000
+
+    def __init__(self, voucher_set, usage=None, offers=None, batch_size=None, progress=None):
+        self.voucher_set = voucher_set
+        first_voucher = voucher_set.vouchers.order_by('date_created', 'pk').first()
+        if usage is None:
+            usage = first_voucher.usage if first_voucher else Voucher.MULTI_USE
+        if offers is None:
+            offers = first_voucher.offers.all() if first_voucher else []
+        self.usage = usage
+        self.offers = list(offers)
+        if batch_size is not None:
+            self.batch_size = batch_size
+        self.progress = progress
+
+    def run(self, update=False):
+        """
+        Create the vouchers missing from the set, and update the existing ones
+        first if ``update`` is true
+        """
+        if update:
+            self.update_vouchers()
+        self.create_vouchers()
+
+    def get_name(self, index):
+        return "%s - %d" % (self.voucher_set.name, index + 1)
+
+    def report_progress(self, done, total):
+        logger.info("Generated %d of %d vouchers for voucher set '%s'",
+                    done, total, self.voucher_set)
+        if self.progress is not None:
+            self.progress(done, total)
+
+    def create_vouchers(self):
+        """
+        Create vouchers until the set has ``count`` vouchers
+        """
+        voucher_set = self.voucher_set
+        start = voucher_set.vouchers.count()
+        total = voucher_set.count
+        for batch_start in range(start, total, self.batch_size):
+            batch_end = min(batch_start + self.batch_size, total)
+            with transaction.atomic():
+                self.create_batch(batch_start, batch_end)
+            self.report_progress(batch_end, total)
+        voucher_set.update_count()
+
+    def create_batch(self, start, end):
+        voucher_set = self.voucher_set
+        codes = sorted(get_unused_codes(end - start, length=voucher_set.code_length))
+        Voucher.objects.bulk_create([
+            Voucher(name=self.get_name(index),
+                    code=code,
+                    voucher_set=voucher_set,
+                    usage=self.usage,
+                    start_datetime=voucher_set.start_datetime,
+                    end_datetime=voucher_set.end_datetime)
+            for index, code in zip(range(start, end), codes)])
+        # Not all databases return the ids of created objects
+        voucher_ids = Voucher.objects.filter(code__in=codes).order_by().values_list('id', flat=True)
+        self.add_offers(voucher_ids)
+
+    def add_offers(self, voucher_ids):
+        Through = Voucher.offers.through
+        Through.objects.bulk_create([
+            Through(voucher_id=voucher_id, conditionaloffer_id=offer.pk)
+            for voucher_id in voucher_ids
+            for offer in self.offers
+        ], batch_size=self.batch_size, ignore_conflicts=True)
+
+    def update_vouchers(self):
+        """
+        Update the names, usage, validity and offers of the vouchers in the
+        set to match the set
+        """
+        voucher_set = self.voucher_set
+        vouchers = voucher_set.vouchers.all()
+        vouchers.update(usage=self.usage,
+                        start_datetime=voucher_set.start_datetime,
+                        end_datetime=voucher_set.end_datetime)
+
+        # Only the names that changed are written
+        renamed = []
+        for index, voucher in enumerate(
+                vouchers.order_by('date_created', 'pk').only('id', 'name').iterator()):
+            name = self.get_name(index)
+            if voucher.name != name:
+                voucher.name = name
+                renamed.append(voucher)
+        Voucher.objects.bulk_update(renamed, ['name'], batch_size=self.batch_size)
+
+        Through = Voucher.offers.through
+        Through.objects.filter(voucher__voucher_set=voucher_set).exclude(
+            conditionaloffer__in=self.offers).delete()
+        voucher_ids = list(vouchers.order_by('pk').values_list('id', flat=True))
+        for start in range(0, len(voucher_ids), self.batch_size):
+            self.add_offers(voucher_ids[start:start + self.batch_size])
@@ -33,3 +33,32 @@ def get_unused_code(length=12, group_length=4, separator='-'):
                              separator=separator)
         if not Voucher.objects.filter(code=code).exists():
             return code
+
+
+def get_unused_codes(count, length=12, group_length=4, separator='-'):
+    """Generate a number of distinct codes that aren't used by any voucher.
+
+    Unlike calling :py:func:`get_unused_code` repeatedly, the database is
+    checked with one query for all candidate codes, and again only for the
+    replacements of the codes that were already taken.
+
+    :param int count: the number of codes to generate
+    :param int length: the number of characters in each code
+    :param int group_length: length of character groups separated by separator kwarg ('-' by default)
+    :param str separator: separator string for voucher codes
+    :return: voucher codes
+    :rtype: set
+
+    """
+    Voucher = get_model('voucher', 'Voucher')
+    codes = set()
+    while len(codes) < count:
+        candidates = set()
+        while len(candidates) < count - len(codes):
+            candidates.add(generate_code(length, group_length=group_length,
+                                         separator=separator))
+        candidates -= codes
+        candidates.difference_update(
+            Voucher.objects.filter(code__in=candidates).order_by().values_list('code', flat=True))
+        codes |= candidates
+    return codes
@@ -2,7 +2,6 @@ from django.urls import path
 from django.utils.translation import gettext_lazy as _
 
 from oscar.core.application import OscarConfig
-from oscar.core.loading import get_class
 
 
 class WishlistsConfig(OscarConfig):
@@ -13,7 +12,7 @@ class WishlistsConfig(OscarConfig):
     namespace = 'wishlists'
 
     def ready(self):
-        self.wishlist_view = get_class('wishlists.views', 'WishListView')
+        self.wishlist_view = self.get_view_class('wishlists.views', 'WishListView')
 
     def get_urls(self):
         urls = [
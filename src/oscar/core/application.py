@@ -1,8 +1,66 @@
 from django.apps import AppConfig
+from django.conf import settings
 from django.core.exceptions import ImproperlyConfigured
 from django.urls import URLPattern, reverse_lazy
 
-from oscar.core.loading import feature_hidden
+from oscar.core.loading import feature_hidden, get_class
+
+
+class LazyView(object):
+    """
+    Stands in for a view class until one of its views is dispatched.
+
+    ``as_view()`` returns a view function that imports the view class with
+    ``get_class`` when it's first called, so view modules (and the forms and
+    tables they use) aren't imported when URLs are built.
+    """
+
+    def __init__(self, module_label, classname):
+        self.module_label = module_label
+        self.classname = classname
+        self._view_class = None
+
+    def __repr__(self):
+        return '<LazyView: %s.%s>' % (self.module_label, self.classname)
+
+    @property
+    def view_class(self):
+        if self._view_class is None:
+            self._view_class = get_class(self.module_label, self.classname)
+        return self._view_class
+
+    def as_view(self, **initkwargs):
+        return LazyViewFunction(self, initkwargs)
+
+
+class LazyViewFunction(object):
+    """
+    The view function of a :py:class:`LazyView`
+    """
+
+    def __init__(self, lazy_view, initkwargs):
+        self.lazy_view = lazy_view
+        self.initkwargs = initkwargs
+        self._view = None
+        # Set the attributes read by the URL resolver and functools.wraps(),
+        # so that they don't trigger the import.
+        self.__module__ = __name__
+        self.__name__ = self.__qualname__ = lazy_view.classname
+        self.__annotations__ = {}
+
+    def get_view(self):
+        if self._view is None:
+            self._view = self.lazy_view.view_class.as_view(**self.initkwargs)
+        return self._view
+
+    def __call__(self, request, *args, **kwargs):
+        return self.get_view()(request, *args, **kwargs)
+
+    def __getattr__(self, name):
+        # Other attributes, like ``csrf_exempt``, are read from the actual view
+        if name.startswith('__'):
+            raise AttributeError(name)
+        return getattr(self.get_view(), name)
 
 
 class OscarConfigMixin(object):
@@ -63,6 +121,18 @@ class OscarConfigMixin(object):
         """
         return []
 
+    def get_view_class(self, module_label, classname):
+        """
+        Return the view class with the given name.
+
+        If ``OSCAR_LAZY_VIEWS`` is set, a :py:class:`LazyView` is returned
+        instead, which only imports the view class when its view is first
+        dispatched.
+        """
+        if settings.OSCAR_LAZY_VIEWS:
+            return LazyView(module_label, classname)
+        return get_class(module_label, classname)
+
     def post_process_urls(self, urlpatterns):
         """
         Customise URL patterns.
@@ -0,0 +1,38 @@
+from uuid import uuid4
+
+from django.core.cache import cache
+
+
+class VersionedCache(object):
+    """
+    Base class for caches whose entries are all tagged with a version.
+
+    Replacing the version, which is stored under ``version_cache_key``, marks
+    all existing entries as stale at once, without having to know their keys.
+    Subclasses compare the version of an entry with the current version when
+    they read it, and ignore and rebuild entries with an outdated version.
+    """
+    version_cache_key = None
+
+    @staticmethod
+    def new_version():
+        return uuid4().hex
+
+    @classmethod
+    def invalidate(cls):
+        """
+        Mark all existing entries as stale
+        """
+        cache.set(cls.version_cache_key, cls.new_version(), None)
+
+    @classmethod
+    def get_version(cls):
+        """
+        Return the current version, or ``None`` if the cache doesn't persist
+        values (e.g. when using the dummy cache backend).
+        """
+        version = cache.get(cls.version_cache_key)
+        if version is None:
+            cls.invalidate()
+            version = cache.get(cls.version_cache_key)
+        return version
@@ -0,0 +1,53 @@
+import io
+
+from django.db.models import QuerySet
+from django.http import StreamingHttpResponse
+
+from oscar.core.compat import UnicodeCSVWriter
+
+#: The number of rows fetched from the database at a time when streaming
+#: querysets
+CHUNK_SIZE = 2000
+
+#: The size in characters of the pieces of CSV data sent to the client
+BUFFER_SIZE = 64 * 1024
+
+
+def iterate_in_chunks(objects, chunk_size=CHUNK_SIZE):
+    """
+    Iterate over a queryset without caching its results, fetching
+    ``chunk_size`` rows at a time (using a server-side cursor where the
+    database supports it). Other iterables are returned unchanged.
+    """
+    if isinstance(objects, QuerySet):
+        return objects.iterator(chunk_size=chunk_size)
+    return objects
+
+
+def generate_csv(rows, **kwargs):
+    """
+    Write rows as CSV to an in-memory buffer, and yield its contents whenever
+    it holds ``BUFFER_SIZE`` characters, so that memory use doesn't depend on
+    the number of rows. Keyword arguments are passed to
+    :py:class:`~oscar.core.compat.UnicodeCSVWriter`.
+    """
+    buffer = io.StringIO()
+    writer = UnicodeCSVWriter(open_file=buffer, **kwargs)
+    for row in rows:
+        writer.writerow(row)
+        if buffer.tell() >= BUFFER_SIZE:
+            yield buffer.getvalue()
+            buffer.seek(0)
+            buffer.truncate()
+    yield buffer.getvalue()
+
+
+class StreamingCSVResponse(StreamingHttpResponse):
+    """
+    A response that streams the given rows to the client as a CSV file
+    attachment, while they are generated.
+    """
+
+    def __init__(self, rows, filename, **kwargs):
+        super().__init__(generate_csv(rows, **kwargs), content_type='text/csv')
+        self['Content-Disposition'] = 'attachment; filename="%s"' % filename
@@ -8,6 +8,8 @@ from django.apps import apps
 from django.apps.config import MODELS_MODULE_NAME
 from django.conf import settings
 from django.core.exceptions import AppRegistryNotReady
+from django.dispatch import receiver
+from django.test.signals import setting_changed
 from django.utils.module_loading import import_string
 
 from oscar.core.exceptions import (
@@ -19,6 +21,14 @@ from oscar.utils.deprecation import RemovedInOscar32Warning
 # for the moved items during loading.
 MOVED_MODELS = {}
 
+# Classes resolved by the default class loader, keyed by the module prefix,
+# the module label and the class name. The matching app only depends on
+# INSTALLED_APPS, and the table is cleared whenever that changes.
+_class_table = {}
+
+# Names of local modules which were found not to exist
+_missing_modules = set()
+
 
 def get_class(module_label, classname, module_prefix='oscar.apps'):
     """
@@ -100,15 +110,23 @@ def default_class_loader(module_label, classnames, module_prefix):
         raise ValueError(
             "Importing from top-level modules is not supported")
 
-    # import from Oscar package (should succeed in most cases)
-    # e.g. 'oscar.apps.dashboard.catalogue.forms'
-    oscar_module_label = "%s.%s" % (module_prefix, module_label)
-    oscar_module = _import_module(oscar_module_label, classnames)
+    # Classes that have been resolved before are returned from the table
+    keys = [(module_prefix, module_label, classname) for classname in classnames]
+    try:
+        return [_class_table[key] for key in keys]
+    except KeyError:
+        pass
 
     # returns e.g. 'oscar.apps.dashboard.catalogue',
     # 'yourproject.apps.dashboard.catalogue' or 'dashboard.catalogue',
     # depending on what is set in INSTALLED_APPS
     app_name = _find_registered_app_name(module_label)
+
+    # import from Oscar package (should succeed in most cases)
+    # e.g. 'oscar.apps.dashboard.catalogue.forms'
+    oscar_module_label = "%s.%s" % (module_prefix, module_label)
+    oscar_module = _import_module(oscar_module_label, classnames)
+
     if app_name.startswith('%s.' % module_prefix):
         # The entry is obviously an Oscar one, we don't import again
         local_module = None
@@ -128,7 +146,42 @@ def default_class_loader(module_label, classnames, module_prefix):
         )
 
     # return imported classes, giving preference to ones from the local package
-    return _pluck_classes([local_module, oscar_module], classnames)
+    modules = [local_module, oscar_module]
+    klasses = _pluck_classes(modules, classnames)
+
+    # Modules that are still being imported (due to circular imports) might
+    # not define all of their classes yet, so the result isn't final.
+    if not any(_is_initializing(module) for module in modules):
+        _class_table.update(zip(keys, klasses))
+    return klasses
+
+
+def get_class_table():
+    """
+    Return a copy of the classes resolved by the default class loader, as a
+    dict mapping ``(module_prefix, module_label, classname)`` tuples to
+    classes.
+    """
+    return dict(_class_table)
+
+
+def clear_class_table():
+    """
+    Forget all resolved classes and missing modules
+    """
+    _class_table.clear()
+    _missing_modules.clear()
+
+
+@receiver(setting_changed)
+def _clear_class_table_on_setting_change(setting, **kwargs):
+    if setting in ('INSTALLED_APPS', 'OSCAR_DYNAMIC_CLASS_LOADER'):
+        clear_class_table()
+
+
+def _is_initializing(module):
+    spec = getattr(module, '__spec__', None)
+    return getattr(spec, '_initializing', False)
 
 
 def _import_module(module_label, classnames):
@@ -136,6 +189,8 @@ def _import_module(module_label, classnames):
     Imports the module with the given name.
     Returns None if the module doesn't exist, but propagates any import errors.
     """
+    if module_label in _missing_modules:
+        return None
     try:
         return __import__(module_label, fromlist=classnames)
     except ImportError:
@@ -155,6 +210,7 @@ def _import_module(module_label, classnames):
         frames = traceback.extract_tb(exc_traceback)
         if len(frames) > 1:
             raise
+        _missing_modules.add(module_label)
 
 
 def _pluck_classes(modules, classnames):
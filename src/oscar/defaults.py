@@ -7,12 +7,21 @@ OSCAR_HOMEPAGE = reverse_lazy('catalogue:index')
 
 # Dynamic class loading
 OSCAR_DYNAMIC_CLASS_LOADER = 'oscar.core.loading.default_class_loader'
+# Import view classes when their views are first dispatched, rather than when
+# the apps are loaded
+OSCAR_LAZY_VIEWS = False
 
 # Basket settings
 OSCAR_BASKET_COOKIE_LIFETIME = 7 * 24 * 60 * 60
 OSCAR_BASKET_COOKIE_OPEN = 'oscar_open_basket'
 OSCAR_BASKET_COOKIE_SECURE = False
 OSCAR_MAX_BASKET_QUANTITY_THRESHOLD = 10000
+# The number of seconds the result of applying offers to a basket is cached.
+# Set to 0 to apply offers on every request.
+OSCAR_BASKET_OFFERS_CACHE_TIMEOUT = 60 * 60
+# The number of seconds the line count and totals of a basket are cached for
+# the header. Set to 0 to always load the full basket.
+OSCAR_BASKET_SUMMARY_CACHE_TIMEOUT = 5 * 60
 
 # Recently-viewed products
 OSCAR_RECENTLY_VIEWED_COOKIE_LIFETIME = 7 * 24 * 60 * 60
@@ -65,6 +74,11 @@ OSCAR_ACCOUNTS_REDIRECT_URL = 'customer:profile-view'
 # disabled.
 OSCAR_EAGER_ALERTS = True
 
+# Whether files of range products uploaded in the dashboard are processed
+# within the request. Large files can instead be stored and processed by
+# running the management command ``oscar_process_range_uploads`` periodically.
+OSCAR_EAGER_RANGE_PRODUCT_UPLOADS = True
+
 # Registration
 OSCAR_SEND_REGISTRATION_EMAIL = True
 OSCAR_FROM_EMAIL = 'oscar@example.com'
@@ -87,6 +101,17 @@ OSCAR_OFFERS_IMPLEMENTED_TYPES = [
     'VOUCHER',
 ]
 
+# Analytics
+# The number of seconds analytics counters are buffered in memory before they
+# are written to the database. Set to 0 to write them straight away.
+OSCAR_ANALYTICS_FLUSH_INTERVAL = 10
+# The number of days after which views, basket additions and purchases count
+# half as much towards product scores. None disables time decay.
+OSCAR_PRODUCT_SCORE_HALF_LIFE = None
+# Whether the dashboard statistics are read from hourly and daily rollups,
+# which are updated when orders are placed and baskets change
+OSCAR_MATERIALISE_DASHBOARD_STATISTICS = False
+
 # Hidden Oscar features, e.g. wishlists or reviews
 OSCAR_HIDDEN_FEATURES = []
 
@@ -247,6 +272,11 @@ OSCAR_SEARCH_FACETS = {
 
 OSCAR_PRODUCT_SEARCH_HANDLER = None
 
+# Whether changes to products, their stock, categories and reviews are queued
+# to be updated in the search index by the management command
+# ``oscar_update_search_index``.
+OSCAR_QUEUE_SEARCH_INDEX_UPDATES = False
+
 OSCAR_THUMBNAILER = 'oscar.core.thumbnails.SorlThumbnail'
 
 OSCAR_URL_SCHEMA = 'http'
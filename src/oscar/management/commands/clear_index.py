@@ -0,0 +1,18 @@
+from haystack.management.commands import clear_index
+
+from oscar.core.loading import get_class
+
+SearchIndexFacetCache = get_class('search.facets', 'SearchIndexFacetCache')
+
+
+class Command(clear_index.Command):
+    """
+    Haystack's clear_index command, which also invalidates the cached facets
+    of searches once the index has been cleared.
+    """
+
+    def handle(self, **options):
+        try:
+            super().handle(**options)
+        finally:
+            SearchIndexFacetCache.invalidate()
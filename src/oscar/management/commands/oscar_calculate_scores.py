@@ -12,5 +12,12 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand):
     help = 'Calculate product scores based on analytics data'
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--incremental',
+            action='store_true',
+            help='Only calculate the scores of products whose analytics data '
+                 'changed since the last run.')
+
     def handle(self, *args, **options):
-        Calculator(logger).run()
+        Calculator(logger).run(incremental=options['incremental'])
@@ -0,0 +1,57 @@
+import inspect
+
+from django.core.management.base import BaseCommand, CommandError
+
+from oscar.core import loading
+
+
+class Command(BaseCommand):
+    """
+    Command to inspect the classes resolved by the dynamic class loader
+    """
+    help = ("Lists the classes that get_class() and get_classes() have "
+            "resolved, and optionally verifies them")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--verify',
+            action='store_true',
+            help='Resolve every class again, bypassing the table, and report '
+                 'the entries that differ.')
+
+    def handle(self, *args, **options):
+        table = loading.get_class_table()
+        if options['verify']:
+            self.verify(table)
+        else:
+            self.dump(table)
+
+    def get_label(self, key):
+        module_prefix, module_label, classname = key
+        return '%s.%s (%s)' % (module_label, classname, module_prefix)
+
+    def get_path(self, klass):
+        if not (inspect.isclass(klass) or inspect.isroutine(klass)):
+            # get_class can also load other objects, e.g. SHIPPING_DISCOUNT
+            return '%s instance' % self.get_path(type(klass))
+        return '%s.%s' % (klass.__module__, klass.__qualname__)
+
+    def dump(self, table):
+        for key in sorted(table):
+            self.stdout.write('%s -> %s' % (self.get_label(key), self.get_path(table[key])))
+
+    def verify(self, table):
+        loading.clear_class_table()
+        mismatches = []
+        for key, klass in sorted(table.items()):
+            module_prefix, module_label, classname = key
+            resolved = loading.get_class(module_label, classname, module_prefix)
+            if resolved is not klass:
+                mismatches.append('%s: recorded %s, resolves to %s' % (
+                    self.get_label(key), self.get_path(klass), self.get_path(resolved)))
+        for mismatch in mismatches:
+            self.stderr.write(mismatch)
+        if mismatches:
+            raise CommandError('%d of %d classes resolve differently' % (
+                len(mismatches), len(table)))
+        self.stdout.write('All %d classes resolve as recorded' % len(table))
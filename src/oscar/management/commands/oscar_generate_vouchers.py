@@ -0,0 +1,77 @@
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from oscar.core.loading import get_class, get_model
+
+VoucherSetGenerator = get_class('voucher.generators', 'VoucherSetGenerator')
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Voucher = get_model('voucher', 'Voucher')
+VoucherSet = get_model('voucher', 'VoucherSet')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Generate the vouchers of a voucher set in batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            'voucher_set',
+            help='The name or id of the voucher set')
+        parser.add_argument(
+            '--count',
+            type=int,
+            help='The number of vouchers the set should have. Defaults to '
+                 'the current count of the set.')
+        parser.add_argument(
+            '--usage',
+            choices=[usage for usage, __ in Voucher.USAGE_CHOICES],
+            help='The usage of new vouchers. Defaults to the usage of the '
+                 'existing vouchers in the set.')
+        parser.add_argument(
+            '--offer',
+            type=int,
+            action='append',
+            dest='offers',
+            help='The id of an offer that applies to new vouchers. Can be '
+                 'repeated. Defaults to the offers of the existing vouchers '
+                 'in the set.')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=VoucherSetGenerator.batch_size,
+            help='The number of vouchers created per batch')
+
+    def handle(self, *args, **options):
+        voucher_set = self.get_voucher_set(options['voucher_set'])
+        count = options['count']
+        if count is not None:
+            if count < voucher_set.vouchers.count():
+                raise CommandError("The voucher set already has more than %d vouchers" % count)
+            voucher_set.count = count
+            voucher_set.save()
+
+        offers = None
+        if options['offers']:
+            offers = ConditionalOffer.objects.filter(
+                offer_type=ConditionalOffer.VOUCHER, pk__in=options['offers'])
+            if len(offers) != len(set(options['offers'])):
+                raise CommandError("Only voucher offers can be added to vouchers")
+
+        generator = VoucherSetGenerator(
+            voucher_set, usage=options['usage'], offers=offers,
+            batch_size=options['batch_size'], progress=self.report_progress)
+        generator.run()
+
+    def get_voucher_set(self, name_or_id):
+        voucher_sets = VoucherSet.objects.all()
+        try:
+            if name_or_id.isdigit():
+                return voucher_sets.get(pk=name_or_id)
+            return voucher_sets.get(name=name_or_id)
+        except VoucherSet.DoesNotExist:
+            raise CommandError("Voucher set '%s' does not exist" % name_or_id)
+
+    def report_progress(self, done, total):
+        self.stdout.write("%d/%d vouchers" % (done, total))
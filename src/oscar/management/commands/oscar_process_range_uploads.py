@@ -0,0 +1,52 @@
+import logging
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+from django.db.models import Q
+from django.utils.timezone import now
+
+from oscar.core.loading import get_model
+
+RangeProductFileUpload = get_model('offer', 'RangeProductFileUpload')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Process pending range product file uploads'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=RangeProductFileUpload.chunk_size,
+            help='The number of SKUs and UPCs processed per chunk')
+        parser.add_argument(
+            '--stale-after',
+            type=int,
+            default=60,
+            help='The number of minutes after which uploads that are still being processed, but '
+                 'haven\'t processed another chunk, are processed again')
+
+    def handle(self, *args, **options):
+        # Uploads are left processing if the process processing them was
+        # killed, so they're picked up again once they haven't been updated
+        # for a while
+        stale = Q(status=RangeProductFileUpload.PROCESSING,
+                  date_updated__lt=now() - timedelta(minutes=options['stale_after']))
+        uploads = RangeProductFileUpload.objects.filter(
+            Q(status=RangeProductFileUpload.PENDING) | stale,
+        ).exclude(file='').select_related('range').order_by('date_uploaded')
+        for upload in uploads:
+            logger.info("Processing '%s' for range '%s'", upload.filepath, upload.range)
+            upload.chunk_size = options['chunk_size']
+            try:
+                upload.process_file()
+            except Exception as e:
+                logger.exception("Processing '%s' failed", upload.filepath)
+                if upload.status != upload.FAILED:
+                    upload.mark_as_failed(str(e)[:255])
+            else:
+                logger.info(
+                    "Added %d products, %d duplicate and %d unknown SKUs",
+                    upload.num_new_skus, upload.num_duplicate_skus, upload.num_unknown_skus)
@@ -0,0 +1,28 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from oscar.core.loading import get_class
+
+StatisticsBuilder = get_class('analytics.statistics', 'StatisticsBuilder')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Rebuild the hourly and daily dashboard statistics from the existing orders, customers and baskets'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=1000,
+            help='The number of statistics rows inserted per query')
+
+    def handle(self, *args, **options):
+        builder = StatisticsBuilder()
+        with transaction.atomic():
+            hours = builder.build()
+            builder.save(batch_size=options['batch_size'])
+        logger.info("Rebuilt the statistics of %d hours", len(hours))
@@ -18,10 +18,29 @@ class Command(BaseCommand):
     help = _("Check for products that are back in "
              "stock and send out alerts")
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=1,
+            help='The number of threads that send emails in parallel')
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=AlertsDispatcher.batch_size,
+            help='The number of products, and of alerts per product, '
+                 'processed per batch')
+        parser.add_argument(
+            '--start-after',
+            type=int,
+            help='Resume an interrupted run after the product with this id')
+
     def handle(self, **options):
         """
         Check all products with active product alerts for
         availability and send out email alerts when a product is
         available to buy.
         """
-        AlertsDispatcher().send_alerts()
+        dispatcher = AlertsDispatcher(workers=options['workers'])
+        dispatcher.batch_size = options['batch_size']
+        dispatcher.send_alerts(start_after=options['start_after'])
@@ -0,0 +1,113 @@
+import os
+import subprocess
+import sys
+from collections import defaultdict
+
+from django.apps import apps
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from oscar.core.application import OscarConfig
+
+SETUP_SCRIPT = 'import django; django.setup()'
+URLS_SCRIPT = '; from django.urls import get_resolver; get_resolver().url_patterns'
+
+
+class Command(BaseCommand):
+    """
+    Command to measure how long the Oscar apps take to import when a new
+    process starts
+    """
+    help = ("Starts Django in a new process and reports the time spent "
+            "importing the modules of each Oscar app")
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--runs',
+            type=int,
+            default=3,
+            help='Number of processes to start; the fastest time of each app is reported.')
+        parser.add_argument(
+            '--urls',
+            action='store_true',
+            help='Also build the URL configuration, as the first request does.')
+
+    def handle(self, *args, **options):
+        script = SETUP_SCRIPT
+        if options['urls']:
+            script += URLS_SCRIPT
+
+        app_names = self.get_app_names()
+        timings = defaultdict(list)
+        for __ in range(max(options['runs'], 1)):
+            import_times = self.parse_import_times(self.run(script))
+            app_times = self.group_by_app(import_times, app_names)
+            for label in app_names.values():
+                timings[label].append(app_times.get(label, 0))
+            timings[None].append(sum(import_times.values()))
+
+        total = min(timings.pop(None))
+        rows = sorted(((label, min(values)) for label, values in timings.items()),
+                      key=lambda row: row[1], reverse=True)
+
+        self.stdout.write('%-32s %12s' % ('App', 'Import (ms)'))
+        for label, microseconds in rows:
+            self.stdout.write('%-32s %12.1f' % (label, microseconds / 1000))
+        self.stdout.write('%-32s %12.1f' % (
+            'All Oscar apps', sum(microseconds for __, microseconds in rows) / 1000))
+        self.stdout.write('%-32s %12.1f' % ('Total', total / 1000))
+
+    def get_app_names(self):
+        """
+        Return a dict mapping the module names of the Oscar apps to their
+        labels
+        """
+        return {
+            app_config.name: app_config.label
+            for app_config in apps.get_app_configs()
+            if isinstance(app_config, OscarConfig)}
+
+    def run(self, script):
+        env = dict(os.environ)
+        env['DJANGO_SETTINGS_MODULE'] = settings.SETTINGS_MODULE
+        env['PYTHONPATH'] = os.pathsep.join(path for path in sys.path if path)
+        process = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', script],
+            env=env, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+            universal_newlines=True)
+        if process.returncode != 0:
+            raise CommandError(
+                'Django could not be started:\n%s' % process.stderr[-2000:])
+        return process.stderr
+
+    def parse_import_times(self, output):
+        """
+        Return a dict mapping module names to the time in microseconds spent
+        importing them, excluding their own imports, from the output of
+        ``python -X importtime``
+        """
+        import_times = {}
+        for line in output.splitlines():
+            if not line.startswith('import time:'):
+                continue
+            try:
+                own, __, module = line[len('import time:'):].split('|')
+                import_times[module.strip()] = int(own)
+            except ValueError:
+                # The header line
+                continue
+        return import_times
+
+    def group_by_app(self, import_times, app_names):
+        """
+        Add up the import times of the modules of each app. Modules of nested
+        apps (e.g. the dashboard apps) count towards the innermost app.
+        """
+        names = sorted(app_names, key=len, reverse=True)
+        app_times = defaultdict(int)
+        for module, microseconds in import_times.items():
+            for name in names:
+                if module == name or module.startswith(name + '.'):
+                    app_times[app_names[name]] += microseconds
+                    break
+        return app_times
@@ -0,0 +1,30 @@
+import logging
+
+from django.core.management.base import BaseCommand
+from haystack.constants import DEFAULT_ALIAS
+
+from oscar.core.loading import get_class
+
+ProductIndexUpdater = get_class('search.indexing', 'ProductIndexUpdater')
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = 'Update the search index documents of the queued products'
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=ProductIndexUpdater.batch_size,
+            help='The number of queued entries processed per batch')
+        parser.add_argument(
+            '--using',
+            default=DEFAULT_ALIAS,
+            help='The Haystack connection to update')
+
+    def handle(self, *args, **options):
+        updater = ProductIndexUpdater(using=options['using'], batch_size=options['batch_size'])
+        num_products = updater.update()
+        logger.info("Updated %d products in the search index", num_products)
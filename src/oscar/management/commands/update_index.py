@@ -0,0 +1,22 @@
+from haystack.management.commands import update_index
+
+from oscar.core.loading import get_class
+
+SearchIndexFacetCache = get_class('search.facets', 'SearchIndexFacetCache')
+
+
+class Command(update_index.Command):
+    """
+    Haystack's update_index command, which also invalidates the cached facets
+    of searches once the index has been written to.
+
+    Haystack writes the documents straight to the search backend rather than
+    through ``ProductIndex``, so the cache is invalidated after the run. This
+    also applies to ``rebuild_index``, which calls this command.
+    """
+
+    def handle(self, **options):
+        try:
+            super().handle(**options)
+        finally:
+            SearchIndexFacetCache.invalidate()
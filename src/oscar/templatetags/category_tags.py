@@ -1,9 +1,10 @@
 from django import template
 
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 
 register = template.Library()
 Category = get_model("catalogue", "category")
+CategoryTreeSnapshot = get_class('catalogue.snapshot', 'CategoryTreeSnapshot')
 
 
 class PassThrough(object):
@@ -68,10 +69,21 @@ class CheapCategoryInfo(dict, metaclass=CategoryFieldPassThroughMetaClass):
 
 
 @register.simple_tag(name="category_tree")
-def get_annotated_list(depth=None, parent=None):    # noqa: C901 too complex
+def get_annotated_list(depth=None, parent=None):
     """
     Gets an annotated list from a tree branch.
 
+    The list is cached until a category is changed, see
+    :py:class:`~oscar.apps.catalogue.snapshot.CategoryTreeSnapshot`.
+    """
+    return CategoryTreeSnapshot().get_annotated_list(
+        build_annotated_list, depth=depth, parent=parent)
+
+
+def build_annotated_list(depth=None, parent=None):    # noqa: C901 too complex
+    """
+    Builds an annotated list from a tree branch.
+
     Borrows heavily from treebeard's get_annotated_list
     """
     # 'depth' is the backwards-compatible name for the template tag,
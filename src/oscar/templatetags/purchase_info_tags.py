@@ -5,6 +5,12 @@ register = template.Library()
 
 @register.simple_tag
 def purchase_info_for_product(request, product):
+    # Browse views determine the purchase info of a whole page of products
+    # up front, see Strategy.fetch_for_products
+    purchase_info_map = getattr(request, 'purchase_info_map', None)
+    if purchase_info_map and product.pk in purchase_info_map:
+        return purchase_info_map[product.pk]
+
     if product.is_parent:
         return request.strategy.fetch_for_parent(product)
 
@@ -3,12 +3,12 @@ import datetime
 import factory
 from django.utils.timezone import now
 
-from oscar.apps.voucher.utils import get_unused_code
-from oscar.core.loading import get_model
+from oscar.core.loading import get_class, get_model
 from oscar.test.factories import ConditionalOfferFactory
 
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Voucher = get_model('voucher', 'Voucher')
+VoucherSetGenerator = get_class('voucher.generators', 'VoucherSetGenerator')
 
 __all__ = ['VoucherFactory', 'VoucherSetFactory']
 
@@ -41,11 +41,4 @@ class VoucherSetFactory(factory.django.DjangoModelFactory):
         if not create:
             return
         offer = ConditionalOfferFactory(offer_type=ConditionalOffer.VOUCHER)
-        for i in range(0, obj.count):
-            voucher = Voucher.objects.create(name="%s - %d" % (obj.name, i + 1),
-                                             code=get_unused_code(length=obj.code_length),
-                                             voucher_set=obj,
-                                             usage=Voucher.MULTI_USE,
-                                             start_datetime=obj.start_datetime,
-                                             end_datetime=obj.end_datetime)
-            voucher.offers.add(offer)
+        VoucherSetGenerator(obj, usage=Voucher.MULTI_USE, offers=[offer]).run()
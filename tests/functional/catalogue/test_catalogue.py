@@ -103,6 +103,15 @@ class TestProductListView(WebTestCase):
         products_on_page = list(page.context['products'].all())
         self.assertEqual(products_on_page, [])
 
+    def test_determines_purchase_info_for_page_of_products_up_front(self):
+        product = create_product(num_in_stock=1)
+        parent = create_product(structure='parent')
+        create_product(parent=parent, num_in_stock=1)
+        page = self.app.get(reverse('catalogue:index'))
+        purchase_info_map = page.context['request'].purchase_info_map
+        self.assertEqual(set(purchase_info_map), {product.pk, parent.pk})
+        self.assertTrue(purchase_info_map[parent.pk].availability.is_available_to_buy)
+
     def test_invalid_page_redirects_to_index(self):
         create_product()
         products_list_url = reverse('catalogue:index')
@@ -11,10 +11,12 @@ from oscar.test import factories
 Basket = get_model('basket', 'Basket')
 ConditionalOffer = get_model('offer', 'ConditionalOffer')
 Order = get_model('order', 'Order')
+StockRecord = get_model('partner', 'StockRecord')
 
 FailedPreCondition = get_class('checkout.exceptions', 'FailedPreCondition')
 GatewayForm = get_class('checkout.forms', 'GatewayForm')
 UnableToPlaceOrder = get_class('order.exceptions', 'UnableToPlaceOrder')
+InsufficientStock = get_class('partner.exceptions', 'InsufficientStock')
 RedirectRequired, UnableToTakePayment, PaymentError = get_classes(
     'payment.exceptions', ['RedirectRequired', 'UnableToTakePayment', 'PaymentError'])
 NoShippingRequired = get_class('shipping.methods', 'NoShippingRequired')
@@ -467,6 +469,19 @@ class PaymentDetailsViewMixin(PaymentDetailsViewSkipConditionsMixin, PaymentDeta
         basket = Basket.objects.get()
         self.assertEqual(basket.status, Basket.OPEN)
 
+    @mock.patch('oscar.apps.checkout.views.logger')
+    @mock.patch.object(StockRecord, 'allocate_many')
+    def test_shows_stock_errors_during_order_placement(self, mock_method, mock_logger):
+        mock_method.side_effect = InsufficientStock()
+        preview = self.ready_to_place_an_order()
+        response = preview.forms['place_order_form'].submit()
+        self.assertIsOk(response)
+        self.assertContains(response, "couldn&#x27;t be reserved")
+        self.assertTrue(mock_logger.error.called)
+        self.assertFalse(Order.objects.exists())
+        basket = Basket.objects.get()
+        self.assertEqual(basket.status, Basket.OPEN)
+
     @mock.patch('oscar.apps.checkout.views.logger')
     @mock.patch('oscar.apps.checkout.views.PaymentDetailsView.handle_order_placement')
     def test_handles_all_other_exceptions_gracefully(self, mock_method, mock_logger):
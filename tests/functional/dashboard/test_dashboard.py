@@ -1,5 +1,6 @@
 from decimal import Decimal as D
 
+from django.test import override_settings
 from django.urls import reverse
 
 from oscar.apps.dashboard.views import IndexView
@@ -185,3 +186,40 @@ class TestDashboardIndexStatsForNonStaffUser(WebTestCase):
         self.assertEqual(context['total_orders'], 9)
         self.assertEqual(context['total_lines'], 9)
         self.assertEqual(context['total_revenue'], D(288))
+
+
+@override_settings(OSCAR_MATERIALISE_DASHBOARD_STATISTICS=True)
+class TestDashboardIndexMaterialisedStatsForNonStaffUser(TestDashboardIndexStatsForNonStaffUser):
+    pass
+
+
+class TestDashboardIndexMaterialisedStatsForStaffUser(WebTestCase):
+    is_staff = True
+
+    def setUp(self):
+        super().setUp()
+        with override_settings(OSCAR_MATERIALISE_DASHBOARD_STATISTICS=True):
+            customer = UserFactory()
+            create_order(user=customer)
+            create_order(user=customer)
+            create_order()
+            create_basket()
+            create_basket(empty=True).set_as_submitted()
+
+    def get_stats(self):
+        keys = set(GENERIC_STATS_KEYS) - {'hourly_report_dict', 'order_status_breakdown'}
+        context = self.get(reverse('dashboard:index')).context
+        return {key: context[key] for key in keys}, context['hourly_report_dict']
+
+    def test_matches_live_stats(self):
+        live_stats, live_report = self.get_stats()
+        with override_settings(OSCAR_MATERIALISE_DASHBOARD_STATISTICS=True):
+            stats, report = self.get_stats()
+        self.assertEqual(live_stats, stats)
+        self.assertEqual(stats['total_orders'], 3)
+        self.assertEqual(stats['total_customers'], 1)
+        self.assertEqual(stats['total_open_baskets'], 1)
+        self.assertEqual(live_report['max_revenue'], report['max_revenue'])
+        self.assertEqual(
+            sum(item['total_incl_tax'] for item in live_report['order_total_hourly']),
+            sum(item['total_incl_tax'] for item in report['order_total_hourly']))
@@ -35,6 +35,16 @@ class TestOrderListDashboard(WebTestCase):
         form['selected_order'].checked = True
         form.submit('download_selected')
 
+    def test_streams_all_orders_as_csv(self):
+        address = ShippingAddressFactory(first_name='Barry', last_name='Barrington')
+        order = create_order(shipping_address=address)
+        response = self.get(reverse('dashboard:order-list'), params={'response_format': 'csv'})
+        lines = b''.join(response.app_iter).decode('utf-8').lstrip('\ufeff').splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[0].startswith('Order number,Order value'))
+        self.assertTrue(lines[1].startswith('%s,' % order.number))
+        self.assertIn('Barry Barrington', lines[1])
+
     def test_allows_order_number_search(self):
         page = self.get(reverse('dashboard:order-list'))
         form = page.forms['search_form']
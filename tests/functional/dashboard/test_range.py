@@ -1,5 +1,7 @@
-from django.contrib.messages.constants import SUCCESS, WARNING
+from django.contrib.messages.constants import INFO, SUCCESS, WARNING
+from django.core.management import call_command
 from django.test import TestCase
+from django.test.utils import override_settings
 from django.urls import reverse
 from webtest.forms import Upload
 
@@ -95,6 +97,27 @@ class RangeProductViewTest(WebTestCase):
         self.assertEqual(range_product_file_upload.status, RangeProductFileUpload.PROCESSED)
         self.assertEqual(range_product_file_upload.size, 3)
 
+    @override_settings(OSCAR_EAGER_RANGE_PRODUCT_UPLOADS=False)
+    def test_upload_file_processed_outside_of_request(self):
+        range_products_page = self.get(self.url)
+        form = range_products_page.form
+        form['file_upload'] = Upload('new_skus.txt', b'456\n789\n321')
+        response = form.submit().follow()
+        messages = list(response.context['messages'])
+        self.assertEqual(messages[0].level, INFO)
+        self.assertEqual(len(self.range.all_products()), 0)
+        upload = RangeProductFileUpload.objects.get()
+        self.assertEqual(upload.status, RangeProductFileUpload.PENDING)
+
+        call_command('oscar_process_range_uploads')
+
+        upload.refresh_from_db()
+        self.assertEqual(upload.status, RangeProductFileUpload.PROCESSED)
+        self.assertEqual(upload.num_new_skus, 2)
+        self.assertEqual(upload.num_unknown_skus, 1)
+        self.range.invalidate_cached_queryset()
+        self.assertEqual(set(self.range.all_products()), {self.product3, self.product4})
+
     def test_dupe_skus_warning(self):
         self.range.add_product(self.product3)
         range_products_page = self.get(self.url)
@@ -1,5 +1,6 @@
 from django.urls import reverse
 
+from oscar.test.factories import create_order
 from oscar.test.testcases import WebTestCase
 
 
@@ -39,3 +40,17 @@ class ReportsDashboardTests(WebTestCase):
         response.form['download'] = 'true'
         response.form.submit()
         self.assertIsOk(response)
+
+    def test_order_report_download(self):
+        order = create_order(user=self.user)
+        url = reverse('dashboard:reports-index')
+        response = self.get(url)
+
+        response.form['report_type'] = 'order_report'
+        response.form['download'] = 'true'
+        response = response.form.submit()
+        self.assertIsOk(response)
+        self.assertEqual('text/csv', response['Content-Type'])
+        lines = response.text.lstrip('\ufeff').splitlines()
+        self.assertEqual(2, len(lines))
+        self.assertTrue(lines[1].startswith(str(order.number)))
@@ -0,0 +1,87 @@
+from decimal import Decimal as D
+
+from django.test import TestCase, override_settings
+
+from oscar.apps.analytics.counters import CounterBuffer, upsert_counters
+from oscar.apps.analytics.receivers import counters, receive_product_view
+from oscar.core.loading import get_model
+from oscar.test.factories import ProductFactory, UserFactory
+
+ProductRecord = get_model('analytics', 'ProductRecord')
+UserProductView = get_model('analytics', 'UserProductView')
+UserRecord = get_model('analytics', 'UserRecord')
+
+
+class TestUpsertCounters(TestCase):
+
+    def test_creates_missing_records(self):
+        product = ProductFactory()
+        upsert_counters(ProductRecord, 'product', {product.pk: {'num_views': 3}})
+        record = ProductRecord.objects.get(product=product)
+        self.assertEqual(record.num_views, 3)
+        self.assertEqual(record.num_purchases, 0)
+
+    def test_increments_existing_records(self):
+        products = [ProductFactory(), ProductFactory()]
+        ProductRecord.objects.create(product=products[0], num_views=2, num_purchases=1)
+        with self.assertNumQueries(1):
+            upsert_counters(ProductRecord, 'product', {
+                products[0].pk: {'num_views': 3},
+                products[1].pk: {'num_views': 1},
+            })
+        record = ProductRecord.objects.get(product=products[0])
+        self.assertEqual(record.num_views, 5)
+        self.assertEqual(record.num_purchases, 1)
+        self.assertEqual(ProductRecord.objects.get(product=products[1]).num_views, 1)
+
+    def test_handles_decimal_counters(self):
+        user = UserFactory()
+        upsert_counters(UserRecord, 'user', {user.pk: {'total_spent': D('9.99')}})
+        upsert_counters(UserRecord, 'user', {user.pk: {'total_spent': D('0.01')}})
+        self.assertEqual(UserRecord.objects.get(user=user).total_spent, D('10.00'))
+
+
+@override_settings(OSCAR_ANALYTICS_FLUSH_INTERVAL=60)
+class TestCounterBuffer(TestCase):
+
+    def setUp(self):
+        self.buffer = CounterBuffer()
+        self.product = ProductFactory()
+
+    def test_buffers_increments(self):
+        with self.assertNumQueries(0):
+            self.buffer.increment(ProductRecord, 'product', self.product.pk, 'num_views')
+            self.buffer.increment(ProductRecord, 'product', self.product.pk, 'num_views')
+            self.buffer.flush_if_due()
+        self.assertEqual(len(self.buffer), 2)
+
+        self.buffer.flush()
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(ProductRecord.objects.get(product=self.product).num_views, 2)
+
+    def test_flushes_when_full(self):
+        self.buffer.max_size = 2
+        self.buffer.increment(ProductRecord, 'product', self.product.pk, 'num_views')
+        self.buffer.add(UserProductView(product=self.product, user=UserFactory()))
+        self.assertEqual(len(self.buffer), 0)
+        self.assertEqual(ProductRecord.objects.get(product=self.product).num_views, 1)
+        self.assertEqual(UserProductView.objects.count(), 1)
+
+    def test_flushes_when_due(self):
+        self.buffer.increment(ProductRecord, 'product', self.product.pk, 'num_views')
+        self.buffer._last_flush -= 60
+        self.buffer.flush_if_due()
+        self.assertEqual(ProductRecord.objects.get(product=self.product).num_views, 1)
+
+
+class TestProductViewReceiver(TestCase):
+
+    def test_records_views(self):
+        product, user = ProductFactory(), UserFactory()
+        with override_settings(OSCAR_ANALYTICS_FLUSH_INTERVAL=60):
+            receive_product_view(sender=self, product=product, user=user)
+            self.assertFalse(ProductRecord.objects.exists())
+        counters.flush()
+        self.assertEqual(ProductRecord.objects.get(product=product).num_views, 1)
+        self.assertEqual(UserRecord.objects.get(user=user).num_product_views, 1)
+        self.assertTrue(UserProductView.objects.filter(product=product, user=user).exists())
@@ -0,0 +1,79 @@
+import logging
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils.timezone import now
+
+from oscar.apps.analytics.counters import upsert_counters
+from oscar.apps.analytics.scores import Calculator
+from oscar.core.loading import get_model
+from oscar.test.factories import ProductFactory
+
+ProductRecord = get_model('analytics', 'ProductRecord')
+
+logger = logging.getLogger(__name__)
+
+
+class TestCalculator(TestCase):
+
+    def setUp(self):
+        self.records = [
+            ProductRecord.objects.create(product=ProductFactory(), num_views=9, num_purchases=1),
+            ProductRecord.objects.create(product=ProductFactory(), num_views=1),
+        ]
+
+    def get_scores(self):
+        return [ProductRecord.objects.get(pk=record.pk).score for record in self.records]
+
+    def test_calculates_weighted_average(self):
+        Calculator(logger, half_life=0).run()
+        self.assertEqual(self.get_scores(), [14 / 9, 1 / 9])
+
+    def test_only_updates_changed_records_incrementally(self):
+        calculator = Calculator(logger, half_life=0)
+        calculator.run()
+        ProductRecord.objects.filter(pk=self.records[1].pk).update(num_views=90)
+        upsert_counters(ProductRecord, 'product', {self.records[0].product_id: {'num_views': 9}})
+
+        self.assertEqual(list(calculator.get_changed_records()), [self.records[0]])
+        calculator.run(incremental=True)
+        self.assertEqual(self.get_scores(), [23 / 9, 1 / 9])
+
+    def test_decays_scores(self):
+        calculator = Calculator(logger, half_life=7)
+        calculator.run()
+        first, second = self.get_scores()
+        self.assertGreater(first, second)
+
+        # The second product gets less activity, but it's more recent
+        record = ProductRecord.objects.get(pk=self.records[1].pk)
+        record.scored_total = 1
+        calculator.add_activity(record, 10, calculator.get_growth(now() + timedelta(days=28)))
+        self.assertGreater(record.score, first)
+
+    def test_incremental_decay_matches_full_calculation(self):
+        calculator = Calculator(logger, half_life=7)
+        calculator.run()
+        full_scores = self.get_scores()
+
+        ProductRecord.objects.update(score=0, scored_total=0, date_scored=None)
+        calculator.run(incremental=True)
+        for score, full_score in zip(self.get_scores(), full_scores):
+            self.assertAlmostEqual(score, full_score, places=3)
+
+    def test_calculates_all_scores_when_the_half_life_changes(self):
+        Calculator(logger, half_life=0).run()
+        # Only the first record changed, but the linear score of the second
+        # can't be combined with decayed scores
+        upsert_counters(ProductRecord, 'product', {self.records[0].product_id: {'num_views': 9}})
+        Calculator(logger, half_life=7).run(incremental=True)
+        decayed_scores = self.get_scores()
+
+        ProductRecord.objects.update(score=0, scored_total=0, date_scored=None)
+        Calculator(logger, half_life=7).run()
+        for score, full_score in zip(decayed_scores, self.get_scores()):
+            self.assertAlmostEqual(score, full_score, places=3)
+        self.assertEqual(set(ProductRecord.objects.values_list('scored_half_life', flat=True)), {7})
+
+        Calculator(logger, half_life=0).run(incremental=True)
+        self.assertEqual(self.get_scores(), [23 / 9, 1 / 9])
@@ -0,0 +1,81 @@
+from decimal import Decimal as D
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from oscar.apps.analytics.statistics import ShopStatistics, StatisticsBuilder
+from oscar.core.loading import get_model
+from oscar.test.factories import (
+    UserFactory, create_basket, create_order, create_product)
+
+Basket = get_model('basket', 'Basket')
+DailyStatistics = get_model('analytics', 'DailyStatistics')
+HourlyStatistics = get_model('analytics', 'HourlyStatistics')
+Order = get_model('order', 'Order')
+
+FIELDS = ['partner_id', 'period_start', 'num_orders', 'num_lines', 'total_incl_tax', 'num_customers',
+          'num_open_baskets']
+
+
+@override_settings(OSCAR_MATERIALISE_DASHBOARD_STATISTICS=True)
+class TestStatistics(TestCase):
+
+    def setUp(self):
+        self.customer = UserFactory()
+        product1 = create_product(partner_name='Partner 1', price=D(5))
+        product2 = create_product(partner_name='Partner 2', price=D(10))
+        self.partner1 = product1.stockrecords.get().partner
+        self.partner2 = product2.stockrecords.get().partner
+
+        basket = create_basket(empty=True)
+        basket.add_product(product1)
+        basket.add_product(product2)
+        create_order(basket=basket, user=self.customer)
+        basket = create_basket(empty=True)
+        basket.add_product(product2)
+        create_order(basket=basket, user=self.customer)
+        create_order()
+
+    def test_records_placed_orders(self):
+        totals = ShopStatistics().get_totals()
+        self.assertEqual(totals['num_orders'], 3)
+        self.assertEqual(totals['num_lines'], 4)
+        self.assertEqual(totals['num_customers'], 1)
+
+        partner_totals = ShopStatistics(self.partner2.pk).get_totals()
+        self.assertEqual(partner_totals['num_orders'], 2)
+        self.assertEqual(partner_totals['num_lines'], 2)
+        self.assertEqual(partner_totals['num_customers'], 1)
+        self.assertEqual(partner_totals['total_incl_tax'], sum(
+            Order.objects.filter(lines__partner=self.partner2).values_list('total_incl_tax', flat=True)))
+
+    def test_hourly_totals_match_daily_totals(self):
+        totals = ShopStatistics().get_totals()
+        first_hour = HourlyStatistics.objects.earliest('period_start').period_start
+        hourly_totals = ShopStatistics().get_totals(since=first_hour)
+        self.assertEqual(totals, hourly_totals)
+
+    def test_counts_open_baskets(self):
+        basket = create_basket(empty=True)
+        self.assertEqual(ShopStatistics().get_totals()['num_open_baskets'], 1)
+        basket.freeze()
+        self.assertEqual(ShopStatistics().get_totals()['num_open_baskets'], 0)
+        basket.thaw()
+        self.assertEqual(ShopStatistics().get_totals()['num_open_baskets'], 1)
+        basket.delete()
+        self.assertEqual(ShopStatistics().get_totals()['num_open_baskets'], 0)
+
+    def test_rebuilt_statistics_match_recorded_statistics(self):
+        create_basket(empty=True)
+        recorded = {model: self.get_totals(model) for model in (HourlyStatistics, DailyStatistics)}
+        call_command('oscar_rebuild_statistics')
+        for model, totals in recorded.items():
+            self.assertEqual(totals, self.get_totals(model))
+
+    def test_builder_ignores_closed_baskets(self):
+        hours = StatisticsBuilder().build()
+        self.assertFalse(any(statistics['num_open_baskets'] for statistics in hours.values()))
+        self.assertEqual(Basket.objects.filter(status=Basket.OPEN).count(), 0)
+
+    def get_totals(self, model):
+        return sorted(model.objects.order_by().values_list(*FIELDS), key=str)
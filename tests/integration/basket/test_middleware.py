@@ -1,9 +1,15 @@
+from decimal import Decimal as D
+
 from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
 from django.http import HttpResponse
 from django.test import TestCase
 from django.test.client import RequestFactory
 
 from oscar.apps.basket import middleware
+from oscar.test.basket import add_product
+from oscar.test.factories import (
+    BasketFactory, ConditionalOfferFactory, RangeFactory, UserFactory)
 
 
 class TestBasketMiddleware(TestCase):
@@ -37,3 +43,62 @@ class TestBasketMiddleware(TestCase):
 
         self.assertEqual(None, cookie_basket)
         self.assertIn("oscar_open_basket", request.cookies_to_delete)
+
+
+class TestBasketSummary(TestCase):
+
+    @staticmethod
+    def get_response_for_test(request):
+        return HttpResponse()
+
+    def setUp(self):
+        cache.clear()
+        self.middleware = middleware.BasketMiddleware(self.get_response_for_test)
+        self.user = UserFactory()
+        self.basket = BasketFactory(owner=self.user)
+        add_product(self.basket, D('10.00'), 2)
+
+    def get_request(self, user=None):
+        request = RequestFactory().get('/')
+        request.user = user or self.user
+        self.middleware(request)
+        return request
+
+    def test_is_empty_for_anonymous_users_without_basket(self):
+        request = self.get_request(AnonymousUser())
+        with self.assertNumQueries(0):
+            self.assertTrue(request.basket_summary.is_empty)
+
+    def test_is_cached_when_basket_is_loaded(self):
+        request = self.get_request()
+        self.assertEqual(request.basket.num_items, 2)
+
+        request = self.get_request()
+        with self.assertNumQueries(0):
+            summary = request.basket_summary
+            self.assertEqual(summary.num_lines, 1)
+            self.assertEqual(summary.num_items, 2)
+            self.assertEqual(summary.total_excl_tax, D('20.00'))
+
+    def test_loads_basket_when_not_cached(self):
+        summary = self.get_request().basket_summary
+        self.assertEqual(summary.num_items, 2)
+        self.assertEqual(summary.total_excl_tax, D('20.00'))
+
+    def test_is_dropped_when_lines_change(self):
+        self.get_request().basket_summary
+        add_product(self.basket, D('5.00'), 1)
+
+        summary = self.get_request().basket_summary
+        self.assertEqual(summary.num_lines, 2)
+        self.assertEqual(summary.total_excl_tax, D('25.00'))
+
+    def test_is_dropped_when_offers_change(self):
+        self.get_request().basket_summary
+        range = RangeFactory(includes_all_products=True)
+        ConditionalOfferFactory(
+            benefit__range=range, benefit__type='Absolute', benefit__value=D('5.00'),
+            condition__range=range, condition__type='Count', condition__value=1)
+
+        summary = self.get_request().basket_summary
+        self.assertEqual(summary.total_excl_tax, D('15.00'))
@@ -1,8 +1,14 @@
 
+from unittest import mock
+
 import pytest
+from django.contrib.auth.models import AnonymousUser
 
+from oscar.apps.basket.models import Basket
+from oscar.apps.basket.utils import OfferApplicationCache
 from oscar.apps.offer import models
 from oscar.apps.offer.applicator import Applicator
+from oscar.apps.partner.strategy import Selector
 from oscar.test.factories import (
     BasketFactory, ConditionalOfferFactory, ProductFactory)
 
@@ -278,3 +284,47 @@ class TestLineOfferConsumer:
         assert line1.quantity_without_offer_discount(offer2) == 0
         assert line1.quantity_without_offer_discount(offer3) == remaining1
         assert line1.quantity_without_offer_discount(offer4) == 0
+
+
+@pytest.mark.django_db
+class TestOfferApplicationCache:
+
+    @pytest.fixture
+    def request_with_basket(self, rf, filled_basket, single_offer):
+        request = rf.get('/')
+        request.user = AnonymousUser()
+        filled_basket.strategy = Selector().strategy(request=request)
+        return request
+
+    def test_restores_the_cached_result(self, request_with_basket, filled_basket):
+        OfferApplicationCache(request_with_basket).apply(filled_basket)
+        discount = filled_basket.total_discount
+
+        basket = Basket.objects.get(pk=filled_basket.pk)
+        basket.strategy = filled_basket.strategy
+        with mock.patch.object(Applicator, 'apply') as apply:
+            OfferApplicationCache(request_with_basket).apply(basket)
+        assert not apply.called
+        assert basket.total_discount == discount > 0
+        assert list(basket.offer_applications.offers) == list(filled_basket.offer_applications.offers)
+        line = basket.all_lines()[0]
+        assert line.consumer.consumed() == filled_basket.all_lines()[0].consumer.consumed()
+
+    def test_applies_offers_again_when_the_basket_changes(self, request_with_basket, filled_basket):
+        OfferApplicationCache(request_with_basket).apply(filled_basket)
+
+        basket = Basket.objects.get(pk=filled_basket.pk)
+        basket.strategy = filled_basket.strategy
+        basket.add_product(ProductFactory())
+        with mock.patch.object(Applicator, 'apply') as apply:
+            OfferApplicationCache(request_with_basket).apply(basket)
+        assert apply.called
+
+    def test_applies_offers_again_when_an_offer_changes(self, request_with_basket, filled_basket, single_offer):
+        OfferApplicationCache(request_with_basket).apply(filled_basket)
+        single_offer.suspend()
+
+        basket = Basket.objects.get(pk=filled_basket.pk)
+        basket.strategy = filled_basket.strategy
+        OfferApplicationCache(request_with_basket).apply(basket)
+        assert basket.total_discount == 0
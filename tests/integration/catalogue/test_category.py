@@ -252,3 +252,92 @@ class TestCategoryTemplateTags(TestCase):
         actual_categories = self.get_category_names(depth=1, parent=parent)
         expected_categories = {'Horror', 'Comedy'}
         self.assertEqual(expected_categories, actual_categories)
+
+
+class TestCategoryTreeCaching(TestCase):
+
+    def setUp(self):
+        for trail in ('Books > Fiction > Horror', 'Books > Non-fiction'):
+            create_from_breadcrumbs(trail)
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_urls(self, **kwargs):
+        return [category.get_absolute_url() for category, __ in get_annotated_list(**kwargs)]
+
+    def test_caches_annotated_list(self):
+        urls = self.get_urls()
+        with self.assertNumQueries(0):
+            self.assertEqual(urls, self.get_urls())
+
+    def test_caches_lists_per_depth_and_parent(self):
+        parent = Category.objects.get(name='Books')
+        self.assertEqual(4, len(get_annotated_list()))
+        self.assertEqual(1, len(get_annotated_list(depth=1)))
+        self.assertEqual(3, len(get_annotated_list(parent=parent)))
+
+    def test_list_is_rebuilt_when_a_category_is_saved(self):
+        self.get_urls()
+        horror = Category.objects.get(name='Horror')
+        horror.slug = 'scary'
+        horror.save()
+        self.assertIn('/books/fiction/scary_%d/' % horror.pk, self.get_urls()[2])
+
+    def test_list_is_rebuilt_when_a_category_is_deleted(self):
+        self.get_urls()
+        Category.objects.get(name='Non-fiction').delete()
+        self.assertEqual(3, len(get_annotated_list()))
+
+    def test_list_and_urls_are_rebuilt_when_a_category_is_moved(self):
+        self.get_urls()
+        horror = Category.objects.get(name='Horror')
+        self.assertEqual('books/fiction/horror', horror.full_slug)
+
+        Category.objects.get(name='Fiction').move(
+            Category.objects.get(name='Non-fiction'), pos='first-child')
+
+        horror = Category.objects.get(name='Horror')
+        self.assertEqual('books/non-fiction/fiction/horror', horror.full_slug)
+        self.assertIn('/books/non-fiction/fiction/horror_%d/' % horror.pk, self.get_urls()[-1])
+
+
+class TestCategoryAncestry(TestCase):
+
+    def setUp(self):
+        for trail in ('Books > Fiction > Horror > Teen', 'Books > Non-fiction', 'Music > Jazz'):
+            create_from_breadcrumbs(trail)
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_paths(self, categories):
+        return [(category.full_name, category.full_slug,
+                 [c.name for c in category.get_ancestors_and_self()])
+                for category in categories]
+
+    def test_annotate_paths_loads_ancestors_with_one_query(self):
+        expected = self.get_paths(Category.objects.all())
+        cache.clear()
+        with self.assertNumQueries(2):
+            self.assertEqual(expected, self.get_paths(Category.objects.annotate_paths()))
+        with self.assertNumQueries(2):
+            self.assertEqual(expected, self.get_paths(Category.objects.annotate_paths().iterator()))
+
+    def test_annotate_paths_reflects_moves_and_renames(self):
+        fiction = Category.objects.get(name='Fiction')
+        fiction.move(Category.objects.get(name='Music'), pos='last-child')
+        music = Category.objects.get(name='Music')
+        music.name = 'Audio'
+        music.slug = 'audio'
+        music.save()
+
+        teen = Category.objects.annotate_paths().get(name='Teen')
+        self.assertEqual('Audio > Fiction > Horror > Teen', teen.full_name)
+        self.assertEqual('audio/fiction/horror/teen', teen.full_slug)
+
+    def test_prefetch_ancestors_handles_the_same_category_more_than_once(self):
+        categories = list(Category.objects.filter(name='Teen')) * 2
+        Category.prefetch_ancestors(categories)
+        with self.assertNumQueries(0):
+            self.assertEqual(['Books > Fiction > Horror > Teen'] * 2, [c.full_name for c in categories])
@@ -0,0 +1,114 @@
+from django.core.cache import cache
+from django.http import QueryDict
+from django.test import TestCase
+
+from oscar.apps.catalogue.search_handlers import SimpleProductSearchHandler
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+Category = get_model('catalogue', 'Category')
+
+
+class TestSimpleProductSearchHandler(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.books = Category.add_root(name='Books')
+        book_class = factories.ProductClassFactory(name='Book')
+        dvd_class = factories.ProductClassFactory(name='DVD')
+        self.cheap_book = factories.create_product(title='Cheap book', product_class=book_class, price=10)
+        self.dear_book = factories.create_product(title='Dear book', product_class=book_class, price=50)
+        self.dvd = factories.create_product(title='Film', product_class=dvd_class, price=15)
+        for product in (self.cheap_book, self.dear_book):
+            product.categories.add(self.books)
+        # Products in several matching categories are only returned once
+        self.cheap_book.categories.add(self.books.add_child(name='Cheap'))
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_handler(self, query='', categories=None):
+        return SimpleProductSearchHandler(QueryDict(query), '/catalogue/?%s' % query, categories)
+
+    def get_products(self, handler):
+        return list(handler.get_search_context_data('products')['products'])
+
+    def test_browses_categories(self):
+        handler = self.get_handler(categories=self.books.get_descendants_and_self())
+        self.assertCountEqual([self.cheap_book, self.dear_book], self.get_products(handler))
+
+    def test_searches_keywords(self):
+        self.assertEqual([self.dvd], self.get_products(self.get_handler('q=film')))
+
+    def test_filters_by_selected_facets(self):
+        handler = self.get_handler('selected_facets=product_class_exact:Book&selected_facets=price_exact:[0 TO 20]')
+        self.assertEqual([self.cheap_book], self.get_products(handler))
+
+    def test_sorts_products(self):
+        handler = self.get_handler('sort_by=price-asc')
+        self.assertEqual([self.cheap_book, self.dvd, self.dear_book], self.get_products(handler))
+
+    def test_returns_facet_data_in_the_munger_format(self):
+        handler = self.get_handler('selected_facets=product_class_exact:Book')
+        context = handler.get_search_context_data('products')
+        self.assertTrue(context['has_facets'])
+
+        product_classes = {datum['name']: datum for datum in context['facet_data']['product_class']['results']}
+        self.assertTrue(product_classes['Book']['selected'])
+        self.assertEqual(2, product_classes['Book']['count'])
+        self.assertNotIn('DVD', product_classes)
+
+        prices = {datum['name']: datum['count'] for datum in context['facet_data']['price_range']['results']}
+        self.assertEqual(1, prices['0 to 20'])
+        self.assertEqual(1, prices['40 to 60'])
+        self.assertEqual(0, prices['60+'])
+
+    def test_caches_facet_counts_until_products_change(self):
+        self.get_handler().get_facet_counts()
+        with self.assertNumQueries(0):
+            facet_counts = self.get_handler().get_facet_counts()
+        self.assertEqual(3, sum(count for value, count in facet_counts['fields']['product_class']))
+
+        factories.create_product(product_class=self.dvd.product_class)
+        facet_counts = self.get_handler().get_facet_counts()
+        self.assertEqual(4, sum(count for value, count in facet_counts['fields']['product_class']))
+
+    def test_keeps_facet_counts_when_only_stock_changes(self):
+        self.get_handler().get_facet_counts()
+        stockrecord = self.dvd.stockrecords.get()
+        stockrecord.num_in_stock = 2
+        stockrecord.save()
+        stockrecord.allocate(1)
+        with self.assertNumQueries(0):
+            self.get_handler().get_facet_counts()
+
+        stockrecord.price = 55
+        stockrecord.save()
+        prices = {datum['name']: datum['count'] for datum in
+                  self.get_handler().get_search_context_data('products')['facet_data']['price_range']['results']}
+        self.assertEqual(2, prices['40 to 60'])
+
+    def test_keeps_facet_counts_when_uncounted_product_fields_change(self):
+        self.get_handler().get_facet_counts()
+        self.dvd.meta_title = 'Film on DVD'
+        self.dvd.save()
+        with self.assertNumQueries(0):
+            self.get_handler().get_facet_counts()
+
+        self.dvd.is_public = False
+        self.dvd.save()
+        facet_counts = self.get_handler().get_facet_counts()
+        self.assertEqual(2, sum(count for value, count in facet_counts['fields']['product_class']))
+
+    def test_facets_on_attributes(self):
+        attribute = factories.ProductAttributeFactory(
+            code='format', type='text', product_class=self.dvd.product_class)
+        attribute.save_value(self.dvd, 'Blu-ray')
+        facets = {
+            'fields': {'format': {'name': 'Format', 'field': 'format'}},
+            'queries': {},
+        }
+        with self.settings(OSCAR_SEARCH_FACETS=facets):
+            handler = self.get_handler('selected_facets=format_exact:Blu-ray')
+            self.assertEqual([self.dvd], self.get_products(handler))
+            self.assertEqual([('Blu-ray', 1)], handler.get_facet_counts()['fields']['format'])
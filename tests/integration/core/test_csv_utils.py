@@ -0,0 +1,45 @@
+from django.test import TestCase, override_settings
+
+from oscar.core import csv_utils
+from oscar.core.loading import get_model
+from oscar.test.factories import PartnerFactory
+
+Partner = get_model('partner', 'Partner')
+
+
+class TestGenerateCSV(TestCase):
+
+    def test_yields_csv_data_in_pieces(self):
+        rows = (['row %d' % i, i] for i in range(10000))
+        with self.settings(OSCAR_CSV_INCLUDE_BOM=False):
+            pieces = list(csv_utils.generate_csv(rows))
+        self.assertGreater(len(pieces), 1)
+        self.assertTrue(all(len(piece) <= csv_utils.BUFFER_SIZE + 100 for piece in pieces))
+        self.assertEqual(
+            ''.join('row %d,%d\r\n' % (i, i) for i in range(10000)), ''.join(pieces))
+
+    @override_settings(OSCAR_CSV_INCLUDE_BOM=True)
+    def test_starts_with_bom(self):
+        self.assertEqual('﻿a,b\r\n', ''.join(csv_utils.generate_csv([['a', 'b']])))
+
+
+class TestIterateInChunks(TestCase):
+
+    def test_doesnt_cache_queryset_results(self):
+        PartnerFactory.create_batch(3)
+        partners = Partner.objects.all()
+        self.assertEqual(3, len(list(csv_utils.iterate_in_chunks(partners, chunk_size=2))))
+        self.assertIsNone(partners._result_cache)
+
+    def test_returns_other_iterables_unchanged(self):
+        rows = [['a'], ['b']]
+        self.assertIs(rows, csv_utils.iterate_in_chunks(rows))
+
+
+class TestStreamingCSVResponse(TestCase):
+
+    def test_streams_rows_as_attachment(self):
+        response = csv_utils.StreamingCSVResponse(iter([['a', 'b'], ['c', 'd']]), 'test.csv')
+        self.assertEqual('text/csv', response['Content-Type'])
+        self.assertEqual('attachment; filename="test.csv"', response['Content-Disposition'])
+        self.assertTrue(b''.join(response.streaming_content).endswith(b'a,b\r\nc,d\r\n'))
@@ -1,13 +1,15 @@
 import sys
 from os.path import dirname
+from unittest import mock
 
 from django.apps import AppConfig, apps
 from django.conf import settings
 from django.test import TestCase, override_settings
 
+from oscar.core import loading
 from oscar.core.loading import (
     AppNotFoundError, ClassNotFoundError, get_class, get_class_loader,
-    get_classes, get_model)
+    get_class_table, get_classes, get_model)
 from tests import temporary_python_path
 from tests._site.loader import DummyClass
 
@@ -194,3 +196,36 @@ class OverriddenClassLoadingTestCase(TestCase):
 
         # Clear lru cache for the class loader again
         get_class_loader.cache_clear()
+
+
+class TestClassTable(TestCase):
+
+    def setUp(self):
+        self.installed_apps = list(settings.INSTALLED_APPS)
+        replaced_app_idx = self.installed_apps.index('oscar.apps.shipping.apps.ShippingConfig')
+        self.installed_apps[replaced_app_idx] = 'tests._site.apps.shipping.apps.ShippingConfig'
+
+    def test_records_resolved_classes(self):
+        Product = get_class('catalogue.models', 'Product')
+        key = ('oscar.apps', 'catalogue.models', 'Product')
+        self.assertIs(get_class_table()[key], Product)
+
+    def test_returns_recorded_classes_without_importing(self):
+        with override_settings(INSTALLED_APPS=self.installed_apps):
+            Free = get_class('shipping.methods', 'Free')
+            with mock.patch.object(loading, '_import_module') as mock_import, \
+                    mock.patch.object(loading, '_find_registered_app_name') as mock_find:
+                self.assertIs(get_class('shipping.methods', 'Free'), Free)
+            self.assertFalse(mock_import.called)
+            self.assertFalse(mock_find.called)
+
+    def test_remembers_missing_local_modules(self):
+        with override_settings(INSTALLED_APPS=self.installed_apps):
+            get_class('shipping.repository', 'Repository')
+            self.assertIn('tests._site.apps.shipping.repository', loading._missing_modules)
+
+    def test_is_cleared_when_installed_apps_change(self):
+        get_class('shipping.methods', 'Free')
+        with override_settings(INSTALLED_APPS=self.installed_apps):
+            (Free,) = get_classes('shipping.methods', ('Free',))
+            self.assertEqual('tests._site.apps.shipping.methods', Free.__module__)
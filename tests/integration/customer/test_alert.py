@@ -1,9 +1,17 @@
+from unittest import mock
+
+from django.core import mail
+from django.core.mail import get_connection
 from django.test import TestCase
 
 from oscar.apps.customer.models import ProductAlert
 from oscar.core.compat import get_user_model
+from oscar.core.loading import get_class, get_model
 from oscar.test.factories import UserFactory, create_product
 
+AlertsDispatcher = get_class('customer.alerts.utils', 'AlertsDispatcher')
+Selector = get_class('partner.strategy', 'Selector')
+Email = get_model('communication', 'Email')
 User = get_user_model()
 
 
@@ -16,3 +24,59 @@ class TestAnAlertForARegisteredUser(TestCase):
 
     def test_defaults_to_active(self):
         assert self.alert.is_active
+
+
+class TestSendingAlertsInBatches(TestCase):
+
+    def setUp(self):
+        self.product = create_product(num_in_stock=5)
+        self.user_alerts = [ProductAlert.objects.create(user=UserFactory(), product=self.product) for x in range(3)]
+        self.anonymous_alerts = [
+            ProductAlert.objects.create(email='user%d@example.com' % x, product=self.product) for x in range(3)]
+        for alert in self.anonymous_alerts:
+            alert.confirm()
+        self.unavailable_product = create_product(num_in_stock=0)
+        self.unavailable_alert = ProductAlert.objects.create(user=UserFactory(), product=self.unavailable_product)
+
+    def send_alerts(self, **kwargs):
+        dispatcher = AlertsDispatcher(workers=kwargs.pop('workers', 1))
+        dispatcher.batch_size = 2
+        dispatcher.send_alerts(**kwargs)
+
+    def assert_alerts_sent(self):
+        assert len(mail.outbox) == 6
+        assert {message.to[0] for message in mail.outbox} == {
+            alert.get_email_address() for alert in self.user_alerts + self.anonymous_alerts}
+        assert ProductAlert.objects.filter(status=ProductAlert.CLOSED).count() == 6
+        assert ProductAlert.objects.get(pk=self.unavailable_alert.pk).status == ProductAlert.ACTIVE
+        assert Email.objects.count() == 3
+
+    def test_sends_and_closes_alerts_of_available_products(self):
+        self.send_alerts()
+        self.assert_alerts_sent()
+
+    def test_sends_emails_with_worker_threads(self):
+        self.send_alerts(workers=3)
+        self.assert_alerts_sent()
+
+    def test_creates_one_strategy_per_user(self):
+        ProductAlert.objects.create(user=self.user_alerts[0].user, product=self.unavailable_product)
+        with mock.patch.object(Selector, 'strategy', autospec=True, side_effect=Selector.strategy) as mock_strategy:
+            self.send_alerts()
+        self.assert_alerts_sent()
+        # One for all anonymous alerts and one for each of the four users
+        assert mock_strategy.call_count == 5
+
+    def test_reuses_one_mail_connection(self):
+        with mock.patch('oscar.apps.customer.alerts.utils.get_connection', wraps=get_connection) as mock_connection:
+            self.send_alerts()
+        assert mock_connection.call_count == 1
+
+    def test_can_be_resumed_after_a_product(self):
+        self.send_alerts(start_after=self.product.pk)
+        assert len(mail.outbox) == 0
+
+    def test_does_not_send_alerts_twice(self):
+        self.send_alerts()
+        self.send_alerts()
+        assert len(mail.outbox) == 6
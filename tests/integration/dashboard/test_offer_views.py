@@ -59,6 +59,17 @@ class TestDashboardOffers:
         assert response.context_data['page_obj']
         assert response.status_code == 200
 
+    def test_range_list_view_loads_product_counts_for_the_page(self, rf, range_with_products,
+                                                               django_assert_num_queries):
+        request = rf.get('/')
+        view = range_views.RangeListView.as_view()
+        view(request)
+        # Once the membership index is built, the counts of the page are
+        # loaded without a query per range
+        with django_assert_num_queries(2):
+            response = view(request)
+            assert [r.num_products() for r in response.context_data['ranges']] == [30]
+
     def test_offer_list_view(self, rf, many_offers):
         request = rf.get('/')
         view = offer_views.OfferListView.as_view()
@@ -111,3 +111,12 @@ class TestDashboardVoucherSets:
         assert response.status_code == 302
         assert response.url == reverse('dashboard:voucher-set-list')
         assert [(m.level_tag, str(m.message)) for m in get_messages(request)][0] == ('warning', "Voucher set deleted")
+
+    def test_voucher_set_download_view(self, rf):
+        vs = voucher.VoucherSetFactory(name='Black Friday', count=5)
+        request = rf.get('/')
+        response = views.VoucherSetDownloadView.as_view()(request, pk=vs.pk)
+        assert response.streaming
+        assert response['Content-Disposition'] == 'attachment; filename="black-friday.csv"'
+        codes = b''.join(response.streaming_content).decode().split()
+        assert sorted(codes) == sorted(vs.vouchers.values_list('code', flat=True))
@@ -0,0 +1,51 @@
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from oscar.core import loading
+from oscar.core.loading import get_class
+
+
+class OscarClassTableTestCase(TestCase):
+
+    def test_lists_resolved_classes(self):
+        get_class('shipping.methods', 'Free')
+        out = io.StringIO()
+        call_command('oscar_class_table', stdout=out)
+        self.assertIn(
+            'shipping.methods.Free (oscar.apps) -> oscar.apps.shipping.methods.Free',
+            out.getvalue())
+
+    def test_lists_resolved_instances(self):
+        get_class('offer.results', 'SHIPPING_DISCOUNT')
+        out = io.StringIO()
+        call_command('oscar_class_table', stdout=out)
+        self.assertIn(
+            'offer.results.SHIPPING_DISCOUNT (oscar.apps) -> oscar.apps.offer.results.ShippingDiscount instance',
+            out.getvalue())
+
+    def test_lists_resolved_functions(self):
+        get_class('offer.utils', 'unit_price')
+        out = io.StringIO()
+        call_command('oscar_class_table', stdout=out)
+        self.assertIn(
+            'offer.utils.unit_price (oscar.apps) -> oscar.apps.offer.utils.unit_price\n',
+            out.getvalue())
+
+    def test_verifies_resolved_classes(self):
+        get_class('shipping.methods', 'Free')
+        out = io.StringIO()
+        call_command('oscar_class_table', verify=True, stdout=out)
+        self.assertIn('classes resolve as recorded', out.getvalue())
+
+    def test_reports_classes_that_resolve_differently(self):
+        Free = get_class('shipping.methods', 'Free')
+        key = ('oscar.apps', 'shipping.methods', 'Free')
+        loading._class_table[key] = object
+        err = io.StringIO()
+        with self.assertRaises(CommandError):
+            call_command('oscar_class_table', verify=True, stderr=err)
+        self.assertIn('resolves to oscar.apps.shipping.methods.Free', err.getvalue())
+        self.assertIs(get_class('shipping.methods', 'Free'), Free)
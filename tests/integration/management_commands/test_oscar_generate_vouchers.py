@@ -0,0 +1,37 @@
+import io
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+
+from oscar.core.loading import get_model
+from oscar.test.factories import ConditionalOfferFactory, VoucherSetFactory
+
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Voucher = get_model('voucher', 'Voucher')
+
+
+class OscarGenerateVouchersTestCase(TestCase):
+
+    def setUp(self):
+        self.voucher_set = VoucherSetFactory(count=2)
+
+    def test_generates_vouchers(self):
+        offer = ConditionalOfferFactory(offer_type=ConditionalOffer.VOUCHER)
+        out = io.StringIO()
+        call_command('oscar_generate_vouchers', self.voucher_set.name, count=5,
+                     offers=[offer.pk], batch_size=2, stdout=out)
+
+        self.voucher_set.refresh_from_db()
+        self.assertEqual(5, self.voucher_set.count)
+        self.assertEqual(5, self.voucher_set.vouchers.count())
+        self.assertEqual(3, offer.vouchers.count())
+        self.assertEqual(['4/5 vouchers', '5/5 vouchers'], out.getvalue().splitlines())
+
+    def test_cannot_remove_vouchers(self):
+        with self.assertRaises(CommandError):
+            call_command('oscar_generate_vouchers', str(self.voucher_set.pk), count=1)
+
+    def test_rejects_unknown_voucher_set(self):
+        with self.assertRaises(CommandError):
+            call_command('oscar_generate_vouchers', 'Unknown')
@@ -73,6 +73,48 @@ class TestOfferApplicator(TestCase):
         self.assertEqual(site_offers[0].name, "globaloffer")
 
 
+class TestOfferFiltering(TestCase):
+
+    def setUp(self):
+        self.applicator = Applicator()
+        self.basket = BasketFactory()
+        add_product(self.basket, D('10'))
+        self.product = self.basket.all_lines()[0].product
+        self.matching_range = RangeFactory(products=[self.product])
+        self.other_range = RangeFactory()
+
+    def create_offer(self, rng, **kwargs):
+        condition = ConditionFactory(
+            range=rng, type=ConditionFactory._meta.model.COUNT, value=1, **kwargs)
+        benefit = BenefitFactory(range=rng)
+        return ConditionalOfferFactory(condition=condition, benefit=benefit)
+
+    def test_drops_offers_whose_condition_range_has_no_basket_products(self):
+        matching_offer = self.create_offer(self.matching_range)
+        other_offer = self.create_offer(self.other_range)
+        offers = self.applicator.filter_offers(
+            self.basket, [matching_offer, other_offer])
+        self.assertEqual(offers, [matching_offer])
+
+    def test_keeps_offers_with_custom_conditions(self):
+        custom_offer = self.create_offer(
+            self.other_range,
+            proxy_class='tests._site.model_tests_app.models.CustomConditionModel')
+        offers = self.applicator.filter_offers(self.basket, [custom_offer])
+        self.assertEqual(offers, [custom_offer])
+
+    def test_uses_cached_product_ranges(self):
+        offers = [self.create_offer(self.matching_range), self.create_offer(self.other_range)]
+        self.applicator.filter_offers(self.basket, offers)
+        with self.assertNumQueries(0):
+            self.assertEqual(self.applicator.filter_offers(self.basket, offers), offers[:1])
+
+    def test_filtered_offers_are_not_applied(self):
+        self.create_offer(self.other_range)
+        self.applicator.apply(self.basket)
+        self.assertEqual(len(self.basket.offer_applications), 0)
+
+
 class TestOfferApplicationsWrapper(TestCase):
 
     def setUp(self):
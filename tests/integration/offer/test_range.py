@@ -1,8 +1,19 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.files.base import ContentFile
+from django.core.management import call_command
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
 
 from oscar.apps.catalogue import models as catalogue_models
 from oscar.apps.offer import models
-from oscar.test.factories import create_product
+from oscar.apps.offer.membership import RangeMembershipIndex
+from oscar.test.factories import UserFactory, create_product
 
 
 class TestWholeSiteRange(TestCase):
@@ -353,3 +364,241 @@ class TestRangeQuerySet(TestCase):
             0,
             "No ranges should contain child2 after explicitly removing it from the only range that contained it",
         )
+
+
+class TestRangeMembershipIndex(TestCase):
+    def setUp(self):
+        self.prod = create_product()
+        self.other = create_product()
+        self.range = models.Range.objects.create(
+            name="Indexed range", includes_all_products=False)
+        self.range.add_product(self.prod)
+
+    def test_contains_products(self):
+        product_ids = [self.prod.id, self.other.id]
+        self.assertEqual(self.range.contains_products(product_ids), {self.prod.id})
+
+    def test_contains_products_for_all_products_range(self):
+        all_range = models.Range.objects.create(
+            name="All products", includes_all_products=True)
+        all_range.excluded_products.add(self.other)
+        product_ids = [self.prod.id, self.other.id]
+        self.assertEqual(all_range.contains_products(product_ids), {self.prod.id})
+
+    def test_uses_a_single_lookup_once_built(self):
+        self.range.contains_products([self.prod.id])
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        with self.assertNumQueries(0):
+            fresh_range.contains_products([self.prod.id, self.other.id])
+            self.assertTrue(fresh_range.contains_product(self.prod))
+            self.assertFalse(fresh_range.contains_product(self.other))
+
+    def test_is_updated_when_product_categories_change(self):
+        category = catalogue_models.Category.add_root(name="root")
+        self.range.included_categories.add(category)
+        self.assertNotIn(self.other.id, self.range.contains_products([self.other.id]))
+
+        self.other.categories.add(category)
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertIn(self.other.id, fresh_range.contains_products([self.other.id]))
+
+    def test_is_updated_when_categories_are_moved(self):
+        category = catalogue_models.Category.add_root(name="root")
+        other_root = catalogue_models.Category.add_root(name="other")
+        child = other_root.add_child(name="child")
+        self.other.categories.add(child)
+        self.range.included_categories.add(category)
+        self.assertFalse(self.range.contains_product(self.other))
+
+        child.move(category, pos='first-child')
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertTrue(fresh_range.contains_product(self.other))
+
+    def test_is_updated_when_products_are_excluded(self):
+        self.assertTrue(self.range.contains_product(self.prod))
+        self.range.remove_product(self.prod)
+        self.assertFalse(self.range.contains_product(self.prod))
+
+    def test_is_updated_when_products_are_added_to_included_categories(self):
+        category = catalogue_models.Category.add_root(name="root")
+        child = category.add_child(name="child")
+        self.range.included_categories.add(category)
+        self.assertFalse(self.range.contains_product(self.other))
+
+        catalogue_models.ProductCategory.objects.create(product=self.other, category=child)
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertTrue(fresh_range.contains_product(self.other))
+
+    def test_is_updated_when_products_change_their_product_class(self):
+        product_class = self.other.product_class
+        self.range.classes.add(product_class)
+        self.assertTrue(self.range.contains_product(self.other))
+
+        self.other.product_class = catalogue_models.ProductClass.objects.create(name="Other class")
+        self.other.save()
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertFalse(fresh_range.contains_product(self.other))
+        self.assertNotIn(self.other, fresh_range.all_products())
+
+    def test_is_updated_when_children_move_to_another_parent(self):
+        parent = create_product(structure='parent')
+        other_parent = create_product(structure='parent')
+        child = create_product(structure='child', parent=parent)
+        category = catalogue_models.Category.add_root(name="root")
+        parent.categories.add(category)
+        self.range.included_categories.add(category)
+        self.assertTrue(self.range.contains_product(child))
+
+        child.parent = other_parent
+        child.save()
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertFalse(fresh_range.contains_product(child))
+
+    def test_is_updated_when_included_categories_are_deleted(self):
+        category = catalogue_models.Category.add_root(name="root")
+        child = category.add_child(name="child")
+        self.other.categories.add(child)
+        self.range.included_categories.add(category)
+        self.assertTrue(self.range.contains_product(self.other))
+
+        category.delete()
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertFalse(fresh_range.contains_product(self.other))
+        self.assertEqual(fresh_range.num_products(), 1)
+
+    def test_only_invalidates_the_ranges_of_changed_products(self):
+        other_range = models.Range.objects.create(name="Other range")
+        other_range.add_product(self.other)
+        self.range.contains_products([self.prod.id])
+        other_range.contains_products([self.other.id])
+
+        self.prod.save()
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        fresh_other_range = models.Range.objects.get(pk=other_range.pk)
+        with self.assertNumQueries(0):
+            self.assertTrue(fresh_other_range.contains_product(self.other))
+        # Only the range of the saved product is rebuilt
+        with self.assertNumQueries(2):
+            self.assertTrue(fresh_range.contains_product(self.prod))
+
+    def test_queries_ranges_that_are_too_large_for_the_cache(self):
+        self.range.add_product(self.other)
+        with mock.patch.object(RangeMembershipIndex, 'max_size', 1):
+            product_ids = {self.prod.id, self.other.id}
+            self.assertEqual(self.range.contains_products(product_ids), product_ids)
+            fresh_range = models.Range.objects.get(pk=self.range.pk)
+            # The range's product queryset is built and run, but no ids are loaded
+            with self.assertNumQueries(2):
+                self.assertEqual(fresh_range.contains_products([self.other.id]), {self.other.id})
+
+    def test_num_products_uses_the_index(self):
+        self.assertEqual(self.range.num_products(), 1)
+        self.range.add_product(self.other)
+        fresh_range = models.Range.objects.get(pk=self.range.pk)
+        self.assertEqual(fresh_range.num_products(), 2)
+        with self.assertNumQueries(0):
+            self.assertEqual(fresh_range.num_products(), 2)
+
+    def test_counts_ranges_that_are_too_large_for_the_cache(self):
+        self.range.add_product(self.other)
+        with mock.patch.object(RangeMembershipIndex, 'max_size', 1):
+            self.assertEqual(self.range.num_products(), 2)
+            fresh_range = models.Range.objects.get(pk=self.range.pk)
+            with self.assertNumQueries(0):
+                self.assertEqual(fresh_range.num_products(), 2)
+
+    def test_counts_are_cached_without_the_product_ids(self):
+        cache_key = self.range.membership_index.get_cache_key()
+        cache.delete(cache_key)
+        self.assertEqual(models.Range.objects.get(pk=self.range.pk).num_products(), 1)
+        self.assertIsNone(cache.get(cache_key))
+
+    def test_loads_many_ranges_at_once(self):
+        other_range = models.Range.objects.create(name="Other range")
+        other_range.add_product(self.prod)
+        other_range.add_product(self.other)
+        ranges = list(models.Range.objects.order_by('pk'))
+        RangeMembershipIndex.load_many(ranges)
+        with self.assertNumQueries(0):
+            self.assertEqual([r.num_products() for r in ranges], [1, 2])
+
+
+class TestRangeProductFileUpload(TestCase):
+
+    def setUp(self):
+        self.range = models.Range.objects.create(name='Upload range')
+        self.user = UserFactory()
+        self.products = [create_product(partner_sku='sku%d' % i, upc='upc%d' % i) for i in range(6)]
+
+    def process(self, content, chunk_size=2):
+        upload = models.RangeProductFileUpload.objects.create(
+            range=self.range, uploaded_by=self.user, filepath='skus.csv', size=len(content))
+        upload.chunk_size = chunk_size
+        products = upload.process(StringIO(content))
+        return upload, products
+
+    def test_adds_products_in_chunks_in_the_order_of_the_file(self):
+        upload, products = self.process('sku3\nupc1\nsku5\nsku0\n')
+        self.assertEqual(upload.status, models.RangeProductFileUpload.PROCESSED)
+        self.assertEqual(upload.num_new_skus, 4)
+        self.assertEqual(upload.num_processed_ids, 4)
+        self.assertEqual(set(products), {self.products[i] for i in (3, 1, 5, 0)})
+        ordered = models.RangeProduct.objects.filter(range=self.range).order_by('display_order')
+        self.assertEqual([rp.product for rp in ordered], [self.products[i] for i in (3, 1, 5, 0)])
+
+    def test_adds_products_after_the_products_in_the_range(self):
+        self.range.add_product(self.products[4], display_order=7)
+        self.process('sku3\nsku1\n')
+        ordered = models.RangeProduct.objects.filter(range=self.range).order_by('display_order')
+        self.assertEqual([rp.product for rp in ordered], [self.products[i] for i in (4, 3, 1)])
+        self.assertEqual([rp.display_order for rp in ordered], [7, 8, 9])
+
+    def test_marks_uploads_as_failed_when_processing_fails(self):
+        with mock.patch.object(models.RangeProductFileUpload, 'process_chunk', side_effect=ValueError("Oops")):
+            with self.assertRaises(ValueError):
+                self.process('sku0\n')
+        upload = models.RangeProductFileUpload.objects.get()
+        self.assertEqual(upload.status, models.RangeProductFileUpload.FAILED)
+        self.assertEqual(upload.error_message, "Oops")
+
+    def test_command_processes_uploads_that_stopped_being_processed(self):
+        stale, processing = [
+            models.RangeProductFileUpload.objects.create(
+                range=self.range, uploaded_by=self.user, filepath='skus.csv', size=5,
+                status=models.RangeProductFileUpload.PROCESSING)
+            for __ in range(2)]
+        stale.file.save('stale.csv', ContentFile(b'sku0\n'))
+        processing.file.save('processing.csv', ContentFile(b'sku1\n'))
+        models.RangeProductFileUpload.objects.filter(pk=stale.pk).update(date_updated=now() - timedelta(hours=2))
+
+        call_command('oscar_process_range_uploads')
+        stale.refresh_from_db()
+        processing.refresh_from_db()
+        self.assertEqual(stale.status, models.RangeProductFileUpload.PROCESSED)
+        self.assertEqual(processing.status, models.RangeProductFileUpload.PROCESSING)
+        self.assertEqual(list(self.range.all_products()), [self.products[0]])
+
+    def test_counts_duplicate_and_unknown_skus(self):
+        self.range.add_product(self.products[0])
+        upload, __ = self.process('sku0\nupc0\nsku1\nupc1\nsku1\nmissing\n')
+        self.assertEqual(upload.num_new_skus, 1)
+        self.assertEqual(upload.num_duplicate_skus, 2)
+        self.assertEqual(upload.num_unknown_skus, 1)
+        self.assertEqual(upload.num_processed_ids, 6)
+        self.assertEqual(set(self.range.all_products()), {self.products[0], self.products[1]})
+
+    def test_returns_excluded_products_to_the_range(self):
+        self.range.remove_product(self.products[2])
+        self.process('sku2\n')
+        self.assertTrue(self.range.contains_product(self.products[2]))
+        self.assertFalse(self.range.excluded_products.exists())
+
+    def test_number_of_queries_depends_on_number_of_chunks(self):
+        content = ''.join('sku%d\n' % i for i in range(6))
+        with CaptureQueriesContext(connection) as few_chunks:
+            self.process(content, chunk_size=6)
+        models.RangeProduct.objects.all().delete()
+        with CaptureQueriesContext(connection) as many_chunks:
+            self.process(content, chunk_size=2)
+        # Lookup, insert, exclusion delete and progress save per extra chunk
+        self.assertEqual(len(many_chunks) - len(few_chunks), 2 * 4)
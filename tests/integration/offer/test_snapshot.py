@@ -0,0 +1,57 @@
+import datetime
+
+from django.test import TestCase
+from django.utils import timezone
+from freezegun import freeze_time
+
+from oscar.apps.offer.snapshot import SiteOfferSnapshot
+from oscar.test import factories
+
+
+class TestSiteOfferSnapshot(TestCase):
+
+    def setUp(self):
+        self.offer = factories.create_offer(name="Site offer")
+
+    def test_returns_offers_with_resolved_components(self):
+        offers = SiteOfferSnapshot().get_offers()
+        self.assertEqual([offer.name for offer in offers], ["Site offer"])
+        with self.assertNumQueries(0):
+            offers = SiteOfferSnapshot().get_offers()
+            condition = offers[0].condition
+            self.assertIs(condition.proxy(), condition)
+            self.assertEqual(condition.range, self.offer.condition.range)
+            self.assertIs(offers[0].benefit.proxy(), offers[0].benefit)
+
+    def test_returns_new_instances_for_every_call(self):
+        first, second = SiteOfferSnapshot().get_offers(), SiteOfferSnapshot().get_offers()
+        self.assertIsNot(first[0], second[0])
+        self.assertIsNot(first[0].condition, second[0].condition)
+
+    def test_is_invalidated_when_an_offer_is_saved(self):
+        SiteOfferSnapshot().get_offers()
+        self.offer.name = "Renamed offer"
+        self.offer.save()
+        offers = SiteOfferSnapshot().get_offers()
+        self.assertEqual([offer.name for offer in offers], ["Renamed offer"])
+
+    def test_is_invalidated_when_an_offer_is_suspended(self):
+        SiteOfferSnapshot().get_offers()
+        self.offer.suspend()
+        self.assertEqual(SiteOfferSnapshot().get_offers(), [])
+
+    def test_honours_dates_without_a_rebuild(self):
+        start = timezone.now() + datetime.timedelta(days=1)
+        self.offer.start_datetime = start
+        self.offer.save()
+        self.assertEqual(SiteOfferSnapshot().get_offers(), [])
+
+        with freeze_time(start + datetime.timedelta(hours=1)):
+            with self.assertNumQueries(0):
+                offers = SiteOfferSnapshot().get_offers()
+        self.assertEqual([offer.name for offer in offers], ["Site offer"])
+
+    def test_excludes_offers_that_have_ended(self):
+        self.offer.end_datetime = timezone.now() - datetime.timedelta(days=1)
+        self.offer.save()
+        self.assertEqual(SiteOfferSnapshot().get_offers(), [])
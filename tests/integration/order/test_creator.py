@@ -13,8 +13,10 @@ from django.utils import timezone
 from oscar.apps.catalogue.models import Product, ProductClass
 from oscar.apps.checkout import calculators
 from oscar.apps.offer.utils import Applicator
+from oscar.apps.order.exceptions import UnableToPlaceOrder
 from oscar.apps.order.models import Order
 from oscar.apps.order.utils import OrderCreator
+from oscar.apps.partner.exceptions import InsufficientStock
 from oscar.apps.shipping.methods import FixedPrice, Free
 from oscar.apps.shipping.repository import Repository
 from oscar.apps.voucher.models import Voucher
@@ -148,6 +150,41 @@ class TestPlacingOrderForDigitalGoods(TestCase):
         self.assertTrue(stockrecord.num_allocated is None)
 
 
+class TestStockAllocationForOrder(TestCase):
+
+    def setUp(self):
+        self.basket = factories.create_basket(empty=True)
+        self.surcharges = SurchargeApplicator().get_applicable_surcharges(self.basket)
+        self.products = [factories.create_product(price=D('10.00'), num_in_stock=5) for x in range(3)]
+        for product in self.products:
+            add_product(self.basket, D('10.00'), quantity=2, product=product)
+
+    def get_allocated(self):
+        return [product.stockrecords.get().num_allocated for product in self.products]
+
+    def test_allocates_stock_of_all_lines(self):
+        place_order(OrderCreator(), surcharges=self.surcharges, basket=self.basket, order_number='1234')
+        self.assertEqual([2, 2, 2], self.get_allocated())
+
+    def test_allocates_stock_line_by_line_if_update_stock_records_is_overridden(self):
+        class Creator(OrderCreator):
+            def update_stock_records(self, line):
+                line.stockrecord.allocate(1)
+
+        place_order(Creator(), surcharges=self.surcharges, basket=self.basket, order_number='1234')
+        self.assertEqual([1, 1, 1], self.get_allocated())
+
+    def test_does_not_place_order_that_would_oversell_when_locking_stockrecords(self):
+        creator = OrderCreator()
+        creator.skip_locked_stockrecords = True
+        add_product(self.basket, D('10.00'), quantity=4, product=self.products[0])
+        with self.assertRaises(UnableToPlaceOrder) as context:
+            place_order(creator, surcharges=self.surcharges, basket=self.basket, order_number='1234')
+        self.assertIsInstance(context.exception.__cause__, InsufficientStock)
+        self.assertFalse(Order.objects.exists())
+        self.assertEqual([None, None, None], self.get_allocated())
+
+
 class TestShippingOfferForOrder(TestCase):
 
     def setUp(self):
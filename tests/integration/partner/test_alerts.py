@@ -0,0 +1,89 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from oscar.apps.partner.alerts import (
+    deferred_stock_alerts, get_below_threshold_stockrecords,
+    update_stock_alerts)
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+StockAlert = get_model('partner', 'StockAlert')
+StockRecord = get_model('partner', 'StockRecord')
+
+
+class TestUpdateStockAlerts(TestCase):
+
+    def setUp(self):
+        self.below, self.above, self.no_threshold, self.no_stock = [
+            factories.StockRecordFactory(
+                product=factories.ProductFactory(stockrecords=[]),
+                num_in_stock=num_in_stock, num_allocated=num_allocated, low_stock_threshold=threshold)
+            for num_in_stock, num_allocated, threshold in [(5, 2, 4), (5, None, 4), (0, None, None), (None, 2, 1)]]
+        self.ids = [stockrecord.pk for stockrecord in (self.below, self.above, self.no_threshold, self.no_stock)]
+
+    def test_finds_stockrecords_below_threshold_like_the_model(self):
+        expected = {pk for pk in self.ids if StockRecord.objects.get(pk=pk).is_below_threshold}
+        self.assertEqual({self.below.pk, self.no_stock.pk}, expected)
+        self.assertEqual(expected, set(get_below_threshold_stockrecords(self.ids).values_list('pk', flat=True)))
+
+    def test_opens_alerts_for_stockrecords_below_threshold(self):
+        update_stock_alerts(self.ids)
+        alerts = StockAlert.objects.filter(status=StockAlert.OPEN)
+        self.assertEqual({self.below, self.no_stock}, {alert.stockrecord for alert in alerts})
+
+    def test_does_not_open_alerts_twice(self):
+        update_stock_alerts(self.ids)
+        update_stock_alerts(self.ids)
+        self.assertEqual(2, StockAlert.objects.count())
+
+    def test_closes_alerts_of_stockrecords_no_longer_below_threshold(self):
+        update_stock_alerts(self.ids)
+        self.below.num_allocated = 0
+        StockRecord.objects.filter(pk=self.below.pk).update(num_allocated=0)
+        update_stock_alerts(self.ids)
+        alert = StockAlert.objects.get(stockrecord=self.below)
+        self.assertEqual(StockAlert.CLOSED, alert.status)
+        self.assertIsNotNone(alert.date_closed)
+
+
+class TestDeferredStockAlerts(TestCase):
+
+    def setUp(self):
+        self.stockrecords = [
+            factories.StockRecordFactory(
+                product=factories.ProductFactory(stockrecords=[]), num_in_stock=10, low_stock_threshold=5)
+            for x in range(5)]
+
+    def test_updates_alerts_once_after_the_block(self):
+        with deferred_stock_alerts():
+            for stockrecord in self.stockrecords:
+                stockrecord.num_in_stock = 2
+                stockrecord.save()
+            self.assertEqual(0, StockAlert.objects.count())
+        self.assertEqual(5, StockAlert.objects.filter(status=StockAlert.OPEN).count())
+
+    def test_saving_stockrecords_runs_a_fixed_number_of_alert_queries(self):
+        with CaptureQueriesContext(connection) as context:
+            with deferred_stock_alerts():
+                for stockrecord in self.stockrecords:
+                    stockrecord.num_in_stock = 2
+                    stockrecord.save()
+        alert_queries = [query for query in context.captured_queries if 'partner_stockalert' in query['sql']]
+        self.assertEqual(3, len(alert_queries))
+
+    def test_nested_blocks_share_the_outer_batch(self):
+        with deferred_stock_alerts() as outer:
+            with deferred_stock_alerts() as inner:
+                self.stockrecords[0].allocate(6)
+            self.assertIs(outer, inner)
+            self.assertEqual(0, StockAlert.objects.count())
+        self.assertEqual(1, StockAlert.objects.count())
+
+    def test_allocations_are_deferred(self):
+        with deferred_stock_alerts():
+            for stockrecord in self.stockrecords:
+                stockrecord.allocate(6)
+            StockRecord.allocate_many({self.stockrecords[0].pk: 1})
+            self.assertEqual(0, StockAlert.objects.count())
+        self.assertEqual(5, StockAlert.objects.count())
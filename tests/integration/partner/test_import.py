@@ -6,7 +6,8 @@ from django.test import TestCase
 
 from oscar.apps.catalogue.models import Product, ProductClass
 from oscar.apps.partner.exceptions import ImportingError
-from oscar.apps.partner.importers import CatalogueImporter
+from oscar.apps.partner.importers import (
+    BulkCatalogueImporter, CatalogueImporter)
 from oscar.apps.partner.models import Partner
 from oscar.test.factories import create_product
 from tests._site.apps.partner.models import StockRecord
@@ -125,3 +126,55 @@ class ImportWithFlushTest(TestCase):
 
         with self.assertRaises(Product.DoesNotExist):
             Product.objects.get(upc=upc)
+
+
+class BulkImportSmokeTest(TestCase):
+
+    def setUp(self):
+        self.importer = BulkCatalogueImporter(logger, batch_size=3)
+        self.importer.handle(TEST_BOOKS_CSV)
+        self.product = Product.objects.get(upc='9780115531446')
+
+    def test_all_rows_are_imported(self):
+        self.assertEqual(10, Product.objects.all().count())
+        self.assertEqual(1, ProductClass.objects.all().count())
+
+    def test_product_is_imported(self):
+        self.assertEqual("Prepare for Your Practical Driving Test", self.product.title)
+        self.assertEqual("", self.product.description)
+        self.assertTrue(self.product.slug)
+        self.assertEqual(1, self.product.categories.count())
+
+    def test_stockrecord_is_imported(self):
+        stockrecord = self.product.stockrecords.get()
+        self.assertEqual("Gardners", stockrecord.partner.name)
+        self.assertEqual("9780115531446", stockrecord.partner_sku)
+        self.assertEqual(D('10.32'), stockrecord.price)
+        self.assertEqual(6, stockrecord.num_in_stock)
+
+    def test_reimporting_updates_existing_records(self):
+        self.product.title = "Changed"
+        self.product.save()
+
+        self.importer.handle(TEST_BOOKS_CSV)
+
+        self.assertEqual(10, Product.objects.all().count())
+        self.assertEqual(1, StockRecord.objects.filter(partner_sku="9780115531446").count())
+        self.product.refresh_from_db()
+        self.assertEqual("Prepare for Your Practical Driving Test", self.product.title)
+        self.assertEqual(1, self.product.categories.count())
+
+    def test_matches_the_standard_importer(self):
+        bulk_products = list(Product.objects.order_by('upc').values_list(
+            'upc', 'title', 'description', 'product_class__name', 'categories__name'))
+        bulk_stock = list(StockRecord.objects.order_by('partner_sku').values_list(
+            'partner_sku', 'partner__name', 'price', 'num_in_stock', 'product__upc'))
+        Product.objects.all().delete()
+        StockRecord.objects.all().delete()
+
+        CatalogueImporter(logger).handle(TEST_BOOKS_CSV)
+
+        self.assertEqual(bulk_products, list(Product.objects.order_by('upc').values_list(
+            'upc', 'title', 'description', 'product_class__name', 'categories__name')))
+        self.assertEqual(bulk_stock, list(StockRecord.objects.order_by('partner_sku').values_list(
+            'partner_sku', 'partner__name', 'price', 'num_in_stock', 'product__upc')))
@@ -2,10 +2,13 @@ from decimal import Decimal as D
 
 from django.test import TestCase
 
+from oscar.apps.partner.exceptions import InsufficientStock
 from oscar.core.loading import get_model
 from oscar.test import factories
 
 Partner = get_model('partner', 'Partner')
+StockAlert = get_model('partner', 'StockAlert')
+StockRecord = get_model('partner', 'StockRecord')
 PartnerAddress = get_model('partner', 'PartnerAddress')
 Country = get_model('address', 'Country')
 
@@ -55,6 +58,43 @@ class TestStockRecord(TestCase):
         self.assertEqual(10, self.stockrecord.num_in_stock)
 
 
+class TestAllocatingManyStockRecords(TestCase):
+
+    def setUp(self):
+        self.stockrecords = [
+            factories.StockRecordFactory(product=factories.ProductFactory(stockrecords=[]), num_in_stock=10),
+            factories.StockRecordFactory(
+                product=factories.ProductFactory(stockrecords=[]), num_in_stock=10, low_stock_threshold=8),
+        ]
+
+    def get_allocated(self):
+        return [StockRecord.objects.get(pk=stockrecord.pk).num_allocated for stockrecord in self.stockrecords]
+
+    def test_allocates_all_stockrecords_in_one_update(self):
+        allocations = {self.stockrecords[0].pk: 2, self.stockrecords[1].pk: 3}
+        # One update, one query to close alerts and two to open them
+        with self.assertNumQueries(4):
+            StockRecord.allocate_many(allocations)
+        self.assertEqual([2, 3], self.get_allocated())
+
+    def test_opens_alerts_for_stockrecords_below_threshold(self):
+        StockRecord.allocate_many({self.stockrecords[0].pk: 2, self.stockrecords[1].pk: 3})
+        alert = StockAlert.objects.get()
+        self.assertEqual(self.stockrecords[1], alert.stockrecord)
+        self.assertEqual(8, alert.threshold)
+
+    def test_refuses_to_oversell_when_locking_stockrecords(self):
+        allocations = {self.stockrecords[0].pk: 2, self.stockrecords[1].pk: 11}
+        with self.assertRaises(InsufficientStock):
+            StockRecord.allocate_many(allocations, skip_locked=True)
+        self.assertEqual([None, None], self.get_allocated())
+
+    def test_allocates_when_locking_stockrecords_with_enough_stock(self):
+        allocations = {self.stockrecords[0].pk: 2, self.stockrecords[1].pk: 10}
+        StockRecord.allocate_many(allocations, skip_locked=True)
+        self.assertEqual([2, 10], self.get_allocated())
+
+
 class TestStockRecordNoStockTrack(TestCase):
 
     def setUp(self):
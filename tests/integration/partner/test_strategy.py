@@ -119,6 +119,50 @@ class TestDefaultStrategyForParentProductWithOutOfStockVariant(TestCase):
         self.assertEqual(D('10.00'), self.info.price.incl_tax)
 
 
+class TestDefaultStrategyForMultipleProducts(TestCase):
+
+    def setUp(self):
+        self.strategy = strategy.Default()
+        factories.create_product(price=D('5.00'), num_in_stock=2)
+        factories.create_product(price=D('6.00'), num_in_stock=0)
+        factories.ProductFactory(stockrecords=[])
+        for x in range(2):
+            parent = factories.create_product(structure='parent')
+            factories.create_product(parent=parent, price=D('10.00'), num_in_stock=3)
+            factories.create_product(parent=parent, price=D('12.00'), num_in_stock=0)
+            factories.create_product(parent=parent, price=D('1.00'), num_in_stock=3, is_public=False)
+
+    def get_products(self):
+        return list(models.Product.objects.browsable().base_queryset())
+
+    def test_returns_same_purchase_info_as_single_product_methods(self):
+        products = self.get_products()
+        purchase_info = self.strategy.fetch_for_products(products)
+        self.assertEqual(len(products), len(purchase_info))
+        for product in self.get_products():
+            if product.is_parent:
+                expected = self.strategy.fetch_for_parent(product)
+            else:
+                expected = self.strategy.fetch_for_product(product)
+            info = purchase_info[product.pk]
+            self.assertEqual(expected.stockrecord, info.stockrecord)
+            self.assertEqual(expected.price.exists, info.price.exists)
+            self.assertEqual(expected.price.incl_tax, info.price.incl_tax)
+            self.assertEqual(expected.availability.code, info.availability.code)
+
+    def test_number_of_queries_does_not_depend_on_number_of_products(self):
+        products = self.get_products()
+        # One query for the public children of the parent products and one
+        # for their stockrecords
+        with self.assertNumQueries(2):
+            self.strategy.fetch_for_products(products)
+
+    def test_fetches_stockrecords_of_products_without_prefetching(self):
+        products = list(models.Product.objects.browsable().select_related('product_class'))
+        with self.assertNumQueries(2):
+            self.strategy.fetch_for_products(products)
+
+
 class TestFixedRateTax(TestCase):
 
     def test_pricing_policy_unavailable_if_no_price_excl_tax(self):
@@ -0,0 +1,21 @@
+from unittest import mock
+
+from django.apps import apps
+from django.test import TestCase
+
+from oscar.apps.search.checks import check_index_command_order
+
+
+class TestIndexCommandOrderCheck(TestCase):
+
+    def test_passes_when_oscar_is_installed_before_haystack(self):
+        self.assertEqual(check_index_command_order(None), [])
+
+    def test_warns_when_haystack_is_installed_before_oscar(self):
+        app_configs = list(apps.get_app_configs())
+        haystack = apps.get_app_config('haystack')
+        app_configs.remove(haystack)
+        app_configs.insert(0, haystack)
+        with mock.patch.object(apps, 'get_app_configs', return_value=app_configs):
+            errors = check_index_command_order(None)
+        self.assertEqual([error.id for error in errors], ['oscar.search.W001'])
@@ -0,0 +1,110 @@
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.test.utils import override_settings
+
+from oscar.apps.search.indexing import ProductIndexUpdater
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+Category = get_model('catalogue', 'Category')
+ProductIndexUpdate = get_model('search', 'ProductIndexUpdate')
+
+
+@override_settings(OSCAR_QUEUE_SEARCH_INDEX_UPDATES=True)
+class TestQueueingProductIndexUpdates(TestCase):
+
+    def setUp(self):
+        self.product = factories.create_product(num_in_stock=5)
+        self.category = Category.add_root(name='Books')
+        ProductIndexUpdate.objects.all().delete()
+
+    def get_queued_ids(self):
+        return set(ProductIndexUpdate.objects.values_list('product_id', flat=True))
+
+    def test_queues_products_when_stock_changes(self):
+        stockrecord = self.product.stockrecords.get()
+        stockrecord.num_in_stock = 2
+        stockrecord.save()
+        self.assertEqual({self.product.pk}, self.get_queued_ids())
+
+    def test_queues_products_when_orders_are_placed(self):
+        other = factories.create_product(num_in_stock=5)
+        basket = factories.create_basket(empty=True)
+        basket.add_product(self.product)
+        basket.add_product(other, quantity=2)
+        ProductIndexUpdate.objects.all().delete()
+        factories.create_order(basket=basket)
+        self.assertEqual({self.product.pk, other.pk}, self.get_queued_ids())
+
+    def test_queues_the_parent_of_deleted_children(self):
+        parent = factories.create_product(structure='parent')
+        child = factories.create_product(parent=parent, num_in_stock=1)
+        child_pk = child.pk
+        ProductIndexUpdate.objects.all().delete()
+        child.delete()
+        self.assertEqual({child_pk, parent.pk}, self.get_queued_ids())
+
+    def test_queues_products_when_categories_change(self):
+        self.product.categories.add(self.category)
+        self.assertEqual({self.product.pk}, self.get_queued_ids())
+
+        other = factories.create_product()
+        ProductIndexUpdate.objects.all().delete()
+        self.category.product_set.add(other)
+        self.assertEqual({other.pk}, self.get_queued_ids())
+
+    def test_queues_the_products_of_renamed_categories_and_their_descendants(self):
+        child = self.category.add_child(name='Fiction')
+        self.product.categories.add(child)
+        ProductIndexUpdate.objects.all().delete()
+        self.category.name = 'Printed books'
+        self.category.save()
+        self.assertEqual({self.product.pk}, self.get_queued_ids())
+
+    def test_queues_products_when_reviews_change(self):
+        factories.ProductReviewFactory(product=self.product)
+        self.assertEqual({self.product.pk}, self.get_queued_ids())
+
+    @override_settings(OSCAR_QUEUE_SEARCH_INDEX_UPDATES=False)
+    def test_does_not_queue_products_when_disabled(self):
+        self.product.categories.add(self.category)
+        self.assertEqual(set(), self.get_queued_ids())
+
+
+@override_settings(OSCAR_QUEUE_SEARCH_INDEX_UPDATES=True)
+class TestProductIndexUpdater(TestCase):
+
+    def setUp(self):
+        self.product = factories.create_product(num_in_stock=5)
+        self.parent = factories.create_product(structure='parent')
+        self.child = factories.create_product(parent=self.parent, num_in_stock=1)
+        self.hidden = factories.create_product(is_public=False)
+        self.updater = ProductIndexUpdater(batch_size=2)
+        self.updater.backend = mock.Mock()
+
+    def test_updates_queued_products_in_batches(self):
+        self.assertTrue(ProductIndexUpdate.objects.exists())
+        self.updater.update()
+        self.assertFalse(ProductIndexUpdate.objects.exists())
+
+        indexed = {product for call in self.updater.backend.update.call_args_list for product in call[0][1]}
+        # Children are indexed through their parent, and products that aren't
+        # browsable are removed from the index
+        self.assertEqual({self.product, self.parent}, indexed)
+        self.updater.backend.remove.assert_called_with('catalogue.product.%d' % self.hidden.pk)
+
+    def test_coalesces_entries_of_the_same_product(self):
+        ProductIndexUpdate.objects.all().delete()
+        for i in range(3):
+            self.product.save()
+        self.updater.batch_size = 3
+        self.assertEqual(1, self.updater.update())
+        self.updater.backend.update.assert_called_once_with(self.updater.index, [self.product])
+
+    def test_command_processes_the_queue(self):
+        with mock.patch('haystack.backends.simple_backend.SimpleSearchBackend.update') as update:
+            call_command('oscar_update_search_index')
+        self.assertTrue(update.called)
+        self.assertFalse(ProductIndexUpdate.objects.exists())
@@ -0,0 +1,86 @@
+from unittest import mock
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.http import QueryDict
+from django.test import TestCase
+
+from oscar.apps.search.facets import SearchIndexFacetCache
+from oscar.apps.search.forms import BrowseCategoryForm
+from oscar.apps.search.search_handlers import SearchHandler
+from oscar.core.loading import get_model
+from oscar.test.factories import create_product
+from tests.integration.search.test_munger import FACET_COUNTS
+
+Product = get_model('catalogue', 'Product')
+
+
+class ProductSearchHandler(SearchHandler):
+    form_class = BrowseCategoryForm
+    model_whitelist = [Product]
+    paginate_by = 20
+
+
+class TestFacetCaching(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        patcher = mock.patch('haystack.query.SearchQuerySet.facet_counts', return_value=FACET_COUNTS)
+        self.facet_counts = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def tearDown(self):
+        cache.clear()
+
+    def get_facet_data(self, query=''):
+        handler = ProductSearchHandler(QueryDict(query), '/catalogue/?%s' % query)
+        return handler, handler.get_search_context_data()['facet_data']
+
+    def test_caches_facet_counts_and_data(self):
+        handler, facet_data = self.get_facet_data()
+        self.assertEqual(1, self.facet_counts.call_count)
+
+        handler, cached_facet_data = self.get_facet_data()
+        self.assertEqual(1, self.facet_counts.call_count)
+        self.assertEqual(facet_data, cached_facet_data)
+        # The facets aren't computed by the search backend again
+        self.assertEqual({}, handler.results.query.facets)
+        self.assertEqual([], handler.results.query.query_facets)
+
+    def test_keys_facet_data_by_the_normalised_path(self):
+        self.get_facet_data('sort_by=title-asc&q=a')
+        self.get_facet_data('page=1&q=a&sort_by=title-asc')
+        self.assertEqual(1, self.facet_counts.call_count)
+
+    def test_keys_facet_counts_by_the_selected_facets(self):
+        self.get_facet_data('selected_facets=product_class_exact:Book')
+        self.get_facet_data('selected_facets=product_class_exact:DVD')
+        self.assertEqual(2, self.facet_counts.call_count)
+
+    def test_is_invalidated_when_the_index_is_updated(self):
+        self.get_facet_data()
+        SearchIndexFacetCache.invalidate()
+        self.get_facet_data()
+        self.assertEqual(2, self.facet_counts.call_count)
+
+    def test_is_invalidated_after_update_index_writes_to_the_index(self):
+        create_product()
+
+        # Facets that are cached while the index is being updated are stale
+        # once the update has finished
+        def update(*args, **kwargs):
+            self.get_facet_data()
+
+        with mock.patch('haystack.backends.simple_backend.SimpleSearchBackend.update', side_effect=update) as backend:
+            call_command('update_index', verbosity=0)
+        self.assertTrue(backend.called)
+        self.assertEqual(1, self.facet_counts.call_count)
+
+        self.get_facet_data()
+        self.assertEqual(2, self.facet_counts.call_count)
+
+    def test_is_invalidated_when_the_index_is_rebuilt(self):
+        self.get_facet_data()
+        call_command('rebuild_index', interactive=False, verbosity=0)
+        self.get_facet_data()
+        self.assertEqual(2, self.facet_counts.call_count)
@@ -0,0 +1,48 @@
+from django.test import TestCase
+
+from oscar.apps.search.search_indexes import ProductIndex
+from oscar.core.loading import get_model
+from oscar.test import factories
+
+Category = get_model('catalogue', 'Category')
+
+
+class TestProductIndex(TestCase):
+
+    def setUp(self):
+        self.index = ProductIndex()
+        books = Category.add_root(name='Books')
+        fiction = books.add_child(name='Fiction')
+        self.product = factories.create_product(title='Standalone', price=10, num_in_stock=5)
+        self.product.categories.add(fiction)
+        self.parent = factories.create_product(title='Parent', structure='parent')
+        self.parent.categories.add(books)
+        for price in (7, 3):
+            factories.create_product(parent=self.parent, price=price, num_in_stock=2)
+        factories.create_product(title='No stock')
+
+    def prepare_all(self):
+        products = list(self.index.index_queryset().order_by('pk'))
+        return {product.title: self.index.full_prepare(product) for product in products}
+
+    def test_prepares_products(self):
+        prepared = self.prepare_all()
+        self.assertEqual(prepared['Standalone']['category'], ['Books > Fiction'])
+        self.assertEqual(prepared['Standalone']['price'], 10.0)
+        self.assertEqual(prepared['Standalone']['num_in_stock'], 5)
+        self.assertEqual(prepared['Parent']['category'], ['Books'])
+        self.assertEqual(prepared['Parent']['price'], 3.0)
+        # Fields without a value are left out
+        self.assertNotIn('num_in_stock', prepared['Parent'])
+        self.assertNotIn('price', prepared['No stock'])
+        self.assertNotIn('num_in_stock', prepared['No stock'])
+
+    def test_prepares_a_batch_of_products_with_a_fixed_number_of_queries(self):
+        for i in range(5):
+            product = factories.create_product(price=5, num_in_stock=1)
+            product.categories.add(*Category.objects.all())
+
+        products = list(self.index.index_queryset())
+        with self.assertNumQueries(0):
+            for product in products:
+                self.index.full_prepare(product)
@@ -0,0 +1,72 @@
+from datetime import timedelta
+
+from django.test import TestCase
+from django.utils import timezone
+
+from oscar.apps.voucher.generators import VoucherSetGenerator
+from oscar.core.loading import get_model
+from oscar.test.factories import ConditionalOfferFactory, VoucherSetFactory
+
+ConditionalOffer = get_model('offer', 'ConditionalOffer')
+Voucher = get_model('voucher', 'Voucher')
+
+
+class TestVoucherSetGenerator(TestCase):
+
+    def setUp(self):
+        self.voucher_set = VoucherSetFactory(count=0, code_length=8)
+        self.offer = ConditionalOfferFactory(offer_type=ConditionalOffer.VOUCHER)
+
+    def test_creates_vouchers_in_batches(self):
+        progress = []
+        self.voucher_set.count = 25
+        generator = VoucherSetGenerator(
+            self.voucher_set, usage=Voucher.SINGLE_USE, offers=[self.offer],
+            batch_size=10, progress=lambda done, total: progress.append((done, total)))
+
+        # Per batch: 1 for the codes, 1 to insert the vouchers, 1 for their
+        # ids, 1 to insert the offers and 2 for the savepoint
+        with self.assertNumQueries(2 + 3 * 6):
+            generator.run()
+
+        self.assertEqual([(10, 25), (20, 25), (25, 25)], progress)
+        vouchers = self.voucher_set.vouchers.order_by('date_created', 'pk')
+        self.assertEqual(25, vouchers.count())
+        self.assertEqual(25, len({voucher.code for voucher in vouchers}))
+        self.assertEqual(
+            ["%s - %d" % (self.voucher_set.name, i) for i in range(1, 26)],
+            [voucher.name for voucher in vouchers])
+        for voucher in vouchers:
+            self.assertEqual(9, len(voucher.code))
+            self.assertEqual(Voucher.SINGLE_USE, voucher.usage)
+            self.assertEqual([self.offer], list(voucher.offers.all()))
+
+    def test_adds_vouchers_like_the_existing_ones(self):
+        self.voucher_set.count = 3
+        VoucherSetGenerator(self.voucher_set, usage=Voucher.SINGLE_USE, offers=[self.offer]).run()
+        self.voucher_set.count = 5
+
+        VoucherSetGenerator(self.voucher_set).run()
+
+        self.assertEqual(5, self.voucher_set.vouchers.count())
+        self.assertEqual(5, Voucher.offers.through.objects.filter(conditionaloffer=self.offer).count())
+        self.assertFalse(self.voucher_set.vouchers.exclude(usage=Voucher.SINGLE_USE).exists())
+
+    def test_updates_existing_vouchers(self):
+        self.voucher_set.count = 3
+        VoucherSetGenerator(self.voucher_set, offers=[self.offer]).run()
+        other_offer = ConditionalOfferFactory(offer_type=ConditionalOffer.VOUCHER)
+        self.voucher_set.name = 'Renamed'
+        self.voucher_set.end_datetime = timezone.now() + timedelta(days=30)
+        self.voucher_set.save()
+
+        VoucherSetGenerator(self.voucher_set, usage=Voucher.ONCE_PER_CUSTOMER,
+                            offers=[other_offer]).run(update=True)
+
+        vouchers = self.voucher_set.vouchers.order_by('date_created', 'pk')
+        self.assertEqual(['Renamed - 1', 'Renamed - 2', 'Renamed - 3'],
+                         [voucher.name for voucher in vouchers])
+        for voucher in vouchers:
+            self.assertEqual(Voucher.ONCE_PER_CUSTOMER, voucher.usage)
+            self.assertEqual(self.voucher_set.end_datetime, voucher.end_datetime)
+            self.assertEqual([other_offer], list(voucher.offers.all()))
@@ -1,5 +1,9 @@
 
+import pytest
+
+from oscar.apps.voucher import utils
 from oscar.apps.voucher.utils import generate_code
+from oscar.test.factories import VoucherFactory
 
 
 def test_generate_code():
@@ -18,3 +22,12 @@ def test_generate_code():
     result = generate_code(length=16, group_length=16, separator=' ')
     assert len(result) == 16
     assert result.count(' ') == 0
+
+
+@pytest.mark.django_db
+def test_get_unused_codes(monkeypatch):
+    VoucherFactory(code='AAAA-AAAA')
+    candidates = iter(['AAAA-AAAA', 'BBBB-BBBB', 'BBBB-BBBB', 'CCCC-CCCC', 'DDDD-DDDD'])
+    monkeypatch.setattr(utils, 'generate_code', lambda *args, **kwargs: next(candidates))
+
+    assert utils.get_unused_codes(3, length=8) == {'BBBB-BBBB', 'CCCC-CCCC', 'DDDD-DDDD'}
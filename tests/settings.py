@@ -163,6 +163,8 @@ DDF_DEFAULT_DATA_FIXTURE = 'tests.dynamic_fixtures.OscarDynamicDataFixtureClass'
 SESSION_SERIALIZER = 'django.contrib.sessions.serializers.JSONSerializer'
 LANGUAGE_CODE = 'en-gb'
 
+OSCAR_ANALYTICS_FLUSH_INTERVAL = 0
+
 OSCAR_INITIAL_ORDER_STATUS = 'A'
 OSCAR_ORDER_STATUS_PIPELINE = {'A': ('B',), 'B': ()}
 OSCAR_INITIAL_LINE_STATUS = 'a'
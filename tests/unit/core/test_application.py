@@ -1,11 +1,16 @@
 from unittest import mock
 
-from django.apps import apps
-from django.test import TestCase
+from django.apps import AppConfig, apps
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase, override_settings
 from django.test.utils import modify_settings
 from django.urls import path
+from django.utils.decorators import method_decorator
+from django.views.decorators.csrf import csrf_exempt
 from django.views.generic import View
 
+from oscar.core.application import LazyView
+
 
 @modify_settings(INSTALLED_APPS={
     'append': 'tests._site.apps.myapp.apps.TestConfig',
@@ -44,3 +49,50 @@ class OscarConfigTestCase(TestCase):
 
         self.myapp.get_url_decorator.assert_called_once_with(pattern)
         self.assertEqual(processed_patterns[0].callback, fake_callback)
+
+
+class HelloView(View):
+    greeting = None
+
+    @method_decorator(csrf_exempt)
+    def dispatch(self, *args, **kwargs):
+        return super().dispatch(*args, **kwargs)
+
+    def get(self, request):
+        return HttpResponse(self.greeting)
+
+
+class LazyViewTestCase(TestCase):
+
+    @mock.patch('oscar.core.application.get_class', return_value=HelloView)
+    def test_imports_view_class_on_first_dispatch(self, mock_get_class):
+        view = LazyView('myapp.views', 'HelloView').as_view(greeting='hello')
+        pattern = path('', view, name='hello')
+        self.assertIn('HelloView', pattern.lookup_str)
+        self.assertFalse(mock_get_class.called)
+
+        response = view(RequestFactory().get('/'))
+        self.assertEqual(response.content, b'hello')
+        mock_get_class.assert_called_once_with('myapp.views', 'HelloView')
+
+        view(RequestFactory().get('/'))
+        self.assertEqual(mock_get_class.call_count, 1)
+
+    @mock.patch('oscar.core.application.get_class', return_value=HelloView)
+    def test_exposes_attributes_of_view(self, mock_get_class):
+        view = LazyView('myapp.views', 'HelloView').as_view(greeting='hello')
+        self.assertTrue(view.csrf_exempt)
+
+    @override_settings(OSCAR_LAZY_VIEWS=True)
+    def test_is_used_by_apps_in_lazy_mode(self):
+        app_config = AppConfig.create('oscar.apps.dashboard.users')
+        app_config.ready()
+        self.assertIsInstance(app_config.index_view, LazyView)
+        self.assertEqual(app_config.index_view.view_class.__module__,
+                         'oscar.apps.dashboard.users.views')
+
+    def test_is_not_used_by_default(self):
+        app_config = AppConfig.create('oscar.apps.dashboard.users')
+        app_config.ready()
+        self.assertEqual(app_config.index_view.__module__,
+                         'oscar.apps.dashboard.users.views')
@@ -0,0 +1,25 @@
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from oscar.core.cache import VersionedCache
+
+
+class ExampleCache(VersionedCache):
+    version_cache_key = 'oscar_test_version'
+
+
+class TestVersionedCache(SimpleTestCase):
+
+    def tearDown(self):
+        cache.delete(ExampleCache.version_cache_key)
+
+    def test_keeps_the_version_until_invalidated(self):
+        version = ExampleCache.get_version()
+        self.assertIsNotNone(version)
+        self.assertEqual(ExampleCache.get_version(), version)
+        ExampleCache.invalidate()
+        self.assertNotEqual(ExampleCache.get_version(), version)
+
+    @override_settings(CACHES={'default': {'BACKEND': 'django.core.cache.backends.dummy.DummyCache'}})
+    def test_has_no_version_without_a_persistent_cache(self):
+        self.assertIsNone(ExampleCache.get_version())